@@ -5,15 +5,95 @@ Funguje bez external dependencies (FastMCP, Pydantic, atď.)
 """
 
 import json
+import os
 import sys
+import time
+import signal
+import socket
 import asyncio
+import tempfile
+import threading
+import subprocess
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+from src.utils.rate_limit import RateLimitExceeded, TokenBucketLimiter
+from src.utils.response_mode import COMPACT, COMPACT_SEPARATORS, FULL, RESPONSE_MODES, ResponseModes, compact_validation, dumps
+
+# Limit jedného JSON-RPC riadku (HTML komponentov môže byť veľa)
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+
+# Daemon sa ukončí po tejto dobe bez pripojených klientov (sekundy)
+DEFAULT_IDLE_TIMEOUT = float(os.getenv("FLOWBITE_MCP_IDLE_TIMEOUT", "1800"))
+
+# Ako dlho shim čaká na spustenie daemona (sekundy)
+DAEMON_START_TIMEOUT = 10.0
+
+# Limit volaní nástrojov na klienta (0 = bez limitu) a počet komponentov v odpovedi
+RATE_LIMIT_PER_MINUTE = float(os.getenv("RATE_LIMIT_PER_MINUTE", "100"))
+RATE_LIMIT_BURST = float(os.getenv("RATE_LIMIT_BURST", "20"))
+MAX_COMPONENTS_PER_REQUEST = int(os.getenv("MAX_COMPONENTS_PER_REQUEST", "10"))
+
+# Maximálny počet správ v jednom JSON-RPC batchi
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "100"))
+
+# Predvolený režim odpovedí nástrojov (full, compact)
+RESPONSE_MODE = os.getenv("RESPONSE_MODE", "full").lower()
+
+# Argument režimu odpovede - spoločný pre schémy všetkých nástrojov
+RESPONSE_MODE_SCHEMA = {
+    "type": "string",
+    "enum": list(RESPONSE_MODES),
+    "description": "compact = minimal JSON (HTML, score, issue codes), full = descriptive text"
+}
+
+
+def _error_response(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    """JSON-RPC chybová odpoveď"""
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": code, "message": message}
+    }
+
+
+def _invalid_request(request: Any) -> Optional[Dict[str, Any]]:
+    """
+    Chyba -32600 pre správu, ktorá nie je platný JSON-RPC request
+
+    Správa musí byť objekt s reťazcom method. Na neplatnú správu sa
+    odpovedá vždy, aj bez id - s id null, ak sa nedá prečítať.
+    """
+    if isinstance(request, dict) and isinstance(request.get("method"), str):
+        return None
+
+    request_id = request.get("id") if isinstance(request, dict) else None
+    if isinstance(request_id, bool) or not isinstance(request_id, (str, int)):
+        request_id = None
+    return _error_response(request_id, -32600, "Invalid Request")
+
+
+def default_socket_path() -> str:
+    """Cesta k Unix socketu daemona (FLOWBITE_MCP_SOCKET alebo runtime adresár)"""
+    configured = os.getenv("FLOWBITE_MCP_SOCKET")
+    if configured:
+        return configured
+
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"flowbite-mcp-{os.getuid()}.sock")
+
+
 class SimpleMCPServer:
     """Simplified MCP server implementation"""
     
     def __init__(self):
+        self.limiter = TokenBucketLimiter(RATE_LIMIT_PER_MINUTE, RATE_LIMIT_BURST)
+        # Režim odpovedí session - z initialize (capabilities.experimental.response_mode)
+        self.response_modes = ResponseModes(RESPONSE_MODE)
+        # Nemenné výsledky (initialize, tools/list) a ich JSON zakódovaný raz;
+        # podľa id objektu výsledku sa pri odosielaní vloží bez kódovania
+        self._static_results: Dict[Any, Dict[str, Any]] = {}
+        self._encoded_results: Dict[int, str] = {}
         self.tools = {
             "generate_component": {
                 "name": "generate_component",
@@ -23,7 +103,8 @@ class SimpleMCPServer:
                     "properties": {
                         "component_type": {"type": "string", "description": "Type of component (button, form, card, etc.)"},
                         "variant": {"type": "string", "description": "Component variant (primary, secondary, etc.)"},
-                        "props": {"type": "object", "description": "Component properties"}
+                        "props": {"type": "object", "description": "Component properties"},
+                        "response_mode": RESPONSE_MODE_SCHEMA
                     },
                     "required": ["component_type"]
                 }
@@ -35,7 +116,8 @@ class SimpleMCPServer:
                     "type": "object",
                     "properties": {
                         "html": {"type": "string", "description": "HTML code to validate"},
-                        "component_type": {"type": "string", "description": "Expected component type"}
+                        "component_type": {"type": "string", "description": "Expected component type"},
+                        "response_mode": RESPONSE_MODE_SCHEMA
                     },
                     "required": ["html"]
                 }
@@ -47,7 +129,8 @@ class SimpleMCPServer:
                     "type": "object", 
                     "properties": {
                         "description": {"type": "string", "description": "Description of what you need"},
-                        "context": {"type": "string", "description": "Context (e-shop, dashboard, landing, etc.)"}
+                        "context": {"type": "string", "description": "Context (e-shop, dashboard, landing, etc.)"},
+                        "response_mode": RESPONSE_MODE_SCHEMA
                     },
                     "required": ["description"]
                 }
@@ -197,29 +280,42 @@ class SimpleMCPServer:
             }
         }
 
-    async def handle_rpc_call(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_rpc_call(self, method: str, params: Dict[str, Any], client_id: str = "local") -> Dict[str, Any]:
         """Handle MCP RPC calls"""
         
         if method == "initialize":
-            return {
+            # Klient si môže pre celú session vyžiadať kompaktné odpovede
+            experimental = (params.get("capabilities") or {}).get("experimental") or {}
+            mode = self.response_modes.set(client_id, experimental.get("response_mode"))
+            return self._static_result(("initialize", mode), lambda: {
                 "protocolVersion": "2024-11-05",
                 "capabilities": {
                     "tools": {},
-                    "resources": {}
+                    "resources": {},
+                    "experimental": {"response_mode": mode}
                 },
                 "serverInfo": {
                     "name": "flowbite-mcp-server",
                     "version": "1.0.0"
                 }
-            }
+            })
             
         elif method == "tools/list":
-            return {"tools": list(self.tools.values())}
+            return self._static_result("tools/list", lambda: {"tools": list(self.tools.values())})
             
         elif method == "tools/call":
             tool_name = params.get("name")
             arguments = params.get("arguments", {})
             
+            # Token-bucket limit na klienta - pri prekročení RateLimitExceeded
+            self.limiter.acquire(client_id)
+            
+            # Explicitný response_mode volania má prednosť pred režimom session
+            arguments = {
+                **arguments,
+                "response_mode": self.response_modes.get(client_id, arguments.get("response_mode"))
+            }
+            
             if tool_name == "generate_component":
                 return await self.generate_component(**arguments)
             elif tool_name == "validate_component":
@@ -232,7 +328,8 @@ class SimpleMCPServer:
         else:
             return {"error": f"Unknown method: {method}"}
 
-    async def generate_component(self, component_type: str, variant: str = None, props: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def generate_component(self, component_type: str, variant: str = None, props: Dict[str, Any] = None,
+                                 response_mode: str = FULL) -> Dict[str, Any]:
         """Generate component HTML"""
         props = props or {}
         
@@ -273,6 +370,9 @@ class SimpleMCPServer:
         for placeholder, value in replacements.items():
             html = html.replace(f"{{{{{placeholder}}}}}", str(value))
         
+        if response_mode == COMPACT:
+            return self._compact_content({"html": html})
+        
         # Component-specific information
         component_info = self._get_component_info(component_type, variant, props)
         
@@ -404,31 +504,33 @@ class SimpleMCPServer:
         
         return info_map.get(component_type, {}).get(variant, f"📦 {component_type} component")
 
-    async def validate_component(self, html: str, component_type: str = None) -> Dict[str, Any]:
+    async def validate_component(self, html: str, component_type: str = None,
+                                 response_mode: str = FULL) -> Dict[str, Any]:
         """Validate component HTML"""
+        # Nálezy ako (kód, správa) - kód pre kompaktný režim, správa pre úplný
         errors = []
         warnings = []
         suggestions = []
         
         # Basic validation
         if not html.strip():
-            errors.append("HTML cannot be empty")
+            errors.append(("empty-html", "HTML cannot be empty"))
             
         if not html.strip().startswith('<'):
-            errors.append("HTML must start with a valid tag")
+            errors.append(("no-root-tag", "HTML must start with a valid tag"))
             
         # Check for required elements based on component type
         if component_type:
             if component_type == "button" and "<button" not in html.lower():
-                errors.append("Button component must contain <button> tag")
+                errors.append(("button-tag-missing", "Button component must contain <button> tag"))
             elif component_type == "form" and "<form" not in html.lower():
-                errors.append("Form component must contain <form> tag")
+                errors.append(("form-tag-missing", "Form component must contain <form> tag"))
                 
         # Check for Tailwind classes
         if "class=" not in html:
-            warnings.append("No CSS classes found - consider adding Tailwind classes")
+            warnings.append(("css-classes-missing", "No CSS classes found - consider adding Tailwind classes"))
         elif "bg-" not in html:
-            suggestions.append("Consider adding background color classes (bg-blue-500, bg-gray-100, etc.)")
+            suggestions.append(("background-class-missing", "Consider adding background color classes (bg-blue-500, bg-gray-100, etc.)"))
             
         # Calculate score
         score = 100
@@ -438,19 +540,29 @@ class SimpleMCPServer:
         
         status = "valid" if len(errors) == 0 else "invalid"
         
+        if response_mode == COMPACT:
+            return self._compact_content(compact_validation({
+                "valid": not errors,
+                "score": score,
+                "error_codes": [code for code, _ in errors],
+                "warning_codes": [code for code, _ in warnings],
+                "suggestion_codes": [code for code, _ in suggestions]
+            }))
+        
         return {
             "content": [
                 {
                     "type": "text", 
                     "text": f"Validation Result: {status.upper()}\n\nScore: {score}/100\n\n" +
-                           (f"❌ Errors ({len(errors)}):\n" + "\n".join(f"  • {e}" for e in errors) + "\n\n" if errors else "") +
-                           (f"⚠️ Warnings ({len(warnings)}):\n" + "\n".join(f"  • {w}" for w in warnings) + "\n\n" if warnings else "") +
-                           (f"💡 Suggestions ({len(suggestions)}):\n" + "\n".join(f"  • {s}" for s in suggestions) if suggestions else "")
+                           (f"❌ Errors ({len(errors)}):\n" + "\n".join(f"  • {e}" for _, e in errors) + "\n\n" if errors else "") +
+                           (f"⚠️ Warnings ({len(warnings)}):\n" + "\n".join(f"  • {w}" for _, w in warnings) + "\n\n" if warnings else "") +
+                           (f"💡 Suggestions ({len(suggestions)}):\n" + "\n".join(f"  • {s}" for _, s in suggestions) if suggestions else "")
                 }
             ]
         }
 
-    async def suggest_components(self, description: str, context: str = "general") -> Dict[str, Any]:
+    async def suggest_components(self, description: str, context: str = "general",
+                                 response_mode: str = FULL) -> Dict[str, Any]:
         """Suggest appropriate components"""
         
         # Simple keyword matching
@@ -615,6 +727,16 @@ class SimpleMCPServer:
                 "example": "Start with a primary button for main actions"
             })
             
+        suggestions = suggestions[:MAX_COMPONENTS_PER_REQUEST]
+        
+        if response_mode == COMPACT:
+            return self._compact_content({
+                "suggestions": [
+                    {"component": s["component"], "variants": s["variants"]}
+                    for s in suggestions
+                ]
+            })
+        
         result_text = f"🎯 Component Suggestions for: **'{description}'**\n📍 Context: {context}\n\n"
         
         for i, suggestion in enumerate(suggestions, 1):
@@ -640,72 +762,357 @@ class SimpleMCPServer:
             ]
         }
 
+    def _static_result(self, key: Any, build) -> Dict[str, Any]:
+        """
+        Nemenný výsledok metódy - vytvorí a zakóduje sa pri prvom volaní
+
+        Vrátený objekt sa nesmie meniť, jeho JSON je uložený v cache.
+        """
+        result = self._static_results.get(key)
+        if result is None:
+            result = self._static_results[key] = build()
+            self._encoded_results[id(result)] = json.dumps(result, separators=COMPACT_SEPARATORS)
+        return result
+
+    def encode_response(self, response: Any) -> str:
+        """JSON riadok odpovede (alebo batchu) - predkódované výsledky sa vložia bez kódovania"""
+        if isinstance(response, list):
+            return "[" + ",".join(self.encode_response(item) for item in response) + "]"
+        encoded = self._encoded_results.get(id(response.get("result")))
+        if encoded is None:
+            return json.dumps(response, separators=COMPACT_SEPARATORS)
+        return f'{{"jsonrpc":"2.0","id":{json.dumps(response["id"])},"result":{encoded}}}'
+
+    def _compact_content(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Výsledok nástroja ako jeden textový blok s JSON bez medzier"""
+        return {"content": [{"type": "text", "text": dumps(data, COMPACT)}]}
+
+    async def handle_message(self, request: Dict[str, Any], client_id: str = "local") -> Dict[str, Any]:
+        """Spracuje jednu JSON-RPC správu a vráti odpoveď"""
+        request_id = request.get("id")
+
+        try:
+            result = await self.handle_rpc_call(request.get("method"), request.get("params", {}), client_id)
+            return {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "result": result
+            }
+        except RateLimitExceeded as e:
+            return {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": e.to_error()
+            }
+        except Exception as e:
+            return {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {
+                    "code": -32603,
+                    "message": str(e)
+                }
+            }
+
+    async def handle_payload(self, payload: Any, client_id: str = "local") -> Any:
+        """
+        Spracuje JSON-RPC správu alebo batch (pole správ)
+
+        Volania v batchi bežia súbežne na jednej slučke a odpovede sa
+        vrátia v jednom poli. Notifikácie (správy bez id) nemajú odpoveď -
+        ak batch obsahuje len notifikácie, vráti sa None. Každý prvok sa
+        pred spracovaním overí; neplatný dostane chybu -32600.
+        """
+        if isinstance(payload, dict):
+            invalid = _invalid_request(payload)
+            if invalid:
+                return invalid
+            response = await self.handle_message(payload, client_id)
+            return response if "id" in payload else None
+
+        if not isinstance(payload, list) or not payload:
+            return _error_response(None, -32600, "Invalid Request")
+        if len(payload) > MAX_BATCH_SIZE:
+            return _error_response(None, -32600, f"Batch too large (max {MAX_BATCH_SIZE})")
+
+        async def handle_item(item: Any) -> Optional[Dict[str, Any]]:
+            invalid = _invalid_request(item)
+            if invalid:
+                return invalid
+            response = await self.handle_message(item, client_id)
+            return response if "id" in item else None
+
+        responses = await asyncio.gather(*(handle_item(item) for item in payload))
+        responses = [response for response in responses if response is not None]
+        return responses or None
+
+    async def serve_lines(self, read_line, write_line, client_id: str = "local"):
+        """
+        Obsluha JSON-RPC riadkov jedného spojenia (stdio alebo daemon)
+
+        Každá správa beží ako samostatná úloha, takže notifications/cancelled
+        zruší ešte bežiace volanie s daným requestId - zrušené volanie podľa
+        MCP špecifikácie nemá odpoveď. Odpovede sa preto môžu vrátiť v inom
+        poradí než požiadavky (klient ich páruje podľa id).
+
+        Args:
+            read_line: Korutina vracajúca ďalší riadok (prázdny = koniec vstupu)
+            write_line: Korutina, ktorá odošle jeden riadok odpovede
+            client_id: Identifikátor klienta pre limit volaní
+        """
+        in_flight: Dict[Any, asyncio.Task] = {}
+        pending = set()
+
+        async def dispatch(payload: Any):
+            try:
+                response = await self.handle_payload(payload, client_id)
+            except asyncio.CancelledError:
+                return
+            if response is not None:
+                await write_line(self.encode_response(response))
+
+        def forget(request_id: Any, task: asyncio.Task):
+            if in_flight.get(request_id) is task:
+                del in_flight[request_id]
+
+        while True:
+            line = await read_line()
+            if not line:
+                break
+            if not line.strip():
+                continue
+
+            # Parse JSON-RPC request (objekt alebo batch)
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError:
+                await write_line(json.dumps(_error_response(None, -32700, "Parse error")))
+                continue
+
+            if isinstance(payload, dict) and payload.get("method") == "notifications/cancelled":
+                request_id = (payload.get("params") or {}).get("requestId")
+                task = in_flight.pop(request_id, None)
+                if task is not None:
+                    task.cancel()
+                continue
+
+            task = asyncio.create_task(dispatch(payload))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            if isinstance(payload, dict) and payload.get("id") is not None:
+                in_flight[payload["id"]] = task
+                task.add_done_callback(lambda done, request_id=payload["id"]: forget(request_id, done))
+
+        # Koniec vstupu - rozbehnuté volania ešte dobehnú a odpovedia
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
     def run_stdio(self):
         """Run MCP server in stdio mode for Cline"""
-        import sys
-        
         print("Flowbite MCP Server starting in stdio mode...", file=sys.stderr)
-        
-        while True:
-            try:
-                line = sys.stdin.readline()
-                if not line:
-                    break
-                    
-                # Parse JSON-RPC request
+
+        async def serve():
+            loop = asyncio.get_running_loop()
+
+            async def read_line() -> str:
+                # Blokujúce čítanie stdin beží mimo slučky, aby volania bežali súbežne
+                return await loop.run_in_executor(None, sys.stdin.readline)
+
+            async def write_line(line: str):
+                print(line, flush=True)
+
+            await self.serve_lines(read_line, write_line)
+
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            pass
+
+    def run_daemon(self, socket_path: Optional[str] = None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        """
+        Dlho bežiaci server na Unix sockete
+
+        Jedna inštancia servera (a jej cache) obsluhuje všetky pripojené
+        shimy. Správy sú JSON-RPC riadky ako v stdio režime.
+        """
+        import fcntl
+
+        socket_path = socket_path or default_socket_path()
+
+        # Zámok zabráni dvom daemonom, keď ich naraz spustí viac shimov
+        lock_file = open(socket_path + ".lock", "w")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            print(f"Daemon už beží na {socket_path}", file=sys.stderr)
+            lock_file.close()
+            return
+
+        print(f"Flowbite MCP daemon listening on {socket_path}", file=sys.stderr)
+        try:
+            asyncio.run(self._serve_daemon(socket_path, idle_timeout))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            for path in (socket_path, socket_path + ".pid"):
                 try:
-                    request = json.loads(line.strip())
-                except json.JSONDecodeError:
-                    continue
-                    
-                # Handle request
-                method = request.get("method")
-                params = request.get("params", {})
-                request_id = request.get("id")
-                
-                # Run async handler
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+            lock_file.close()
+
+    async def _serve_daemon(self, socket_path: str, idle_timeout: float):
+        """Obsluha pripojení daemona až do vypršania nečinnosti"""
+        state = {"connections": 0, "accepted": 0, "last_activity": time.monotonic()}
+
+        async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            state["connections"] += 1
+            state["accepted"] += 1
+            # Každý shim (session) má vlastný limit volaní
+            client_id = f"session-{state['accepted']}"
+
+            async def write_line(line: str):
+                writer.write((line + "\n").encode("utf-8"))
+                await writer.drain()
+
+            try:
+                await self.serve_lines(reader.readline, write_line, client_id)
+            except (ConnectionError, asyncio.LimitOverrunError, ValueError) as e:
+                print(f"Daemon connection error: {e}", file=sys.stderr)
+            finally:
+                self.response_modes.drop(client_id)
+                state["connections"] -= 1
+                state["last_activity"] = time.monotonic()
+                writer.close()
+
+        # Po páde predchádzajúceho daemona ostane socket súbor
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+        previous_umask = os.umask(0o077)  # Socket len pre vlastníka
+        try:
+            server = await asyncio.start_unix_server(
+                handle_connection, path=socket_path, limit=MAX_FRAME_BYTES
+            )
+        finally:
+            os.umask(previous_umask)
+
+        with open(socket_path + ".pid", "w") as f:
+            f.write(str(os.getpid()))
+
+        # SIGTERM ukončí daemon čisto (odstráni socket a pid súbor)
+        stopped = asyncio.Event()
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stopped.set)
+
+        async with server:
+            while not stopped.is_set():
                 try:
-                    result = loop.run_until_complete(self.handle_rpc_call(method, params))
-                    
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": result
-                    }
-                except Exception as e:
-                    response = {
-                        "jsonrpc": "2.0", 
-                        "id": request_id,
-                        "error": {
-                            "code": -32603,
-                            "message": str(e)
-                        }
-                    }
-                finally:
-                    loop.close()
-                
-                # Send response
-                print(json.dumps(response), flush=True)
-                
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                print(f"Error: {e}", file=sys.stderr)
+                    await asyncio.wait_for(stopped.wait(), timeout=min(idle_timeout, 5.0))
+                except asyncio.TimeoutError:
+                    pass
+
+                idle_for = time.monotonic() - state["last_activity"]
+                if state["connections"] == 0 and idle_for >= idle_timeout:
+                    print("Flowbite MCP daemon idle, shutting down", file=sys.stderr)
+                    break
+
+
+def _connect(socket_path: str) -> socket.socket:
+    """Pripojenie k Unix socketu daemona"""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+    except OSError:
+        client.close()
+        raise
+    return client
+
+
+def _connect_or_spawn(socket_path: str) -> socket.socket:
+    """Pripojí sa k daemonu, ak nebeží, spustí ho na pozadí"""
+    try:
+        return _connect(socket_path)
+    except OSError:
+        pass
+
+    subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--daemon", "--socket", socket_path],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True  # Daemon prežije ukončenie editora
+    )
+
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT
+    while True:
+        try:
+            return _connect(socket_path)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.02)
+
+
+def run_shim(socket_path: Optional[str] = None):
+    """
+    Tenký stdio shim - preposiela JSON-RPC riadky medzi klientom a daemonom
+
+    Ak daemon nebeží, spustí ho. Ak sa daemon spustiť nedá (napr. bez
+    podpory Unix socketov), server beží priamo v tomto procese.
+    """
+    socket_path = socket_path or default_socket_path()
+
+    try:
+        connection = _connect_or_spawn(socket_path)
+    except (OSError, AttributeError) as e:
+        print(f"Daemon nedostupný ({e}), spúšťam server v procese", file=sys.stderr)
+        SimpleMCPServer().run_stdio()
+        return
+
+    def relay_responses():
+        with connection.makefile("rb") as responses:
+            for line in responses:
+                sys.stdout.buffer.write(line)
+                sys.stdout.buffer.flush()
+
+    responder = threading.Thread(target=relay_responses, daemon=True)
+    responder.start()
+
+    try:
+        for line in sys.stdin.buffer:
+            connection.sendall(line)
+        connection.shutdown(socket.SHUT_WR)
+    except (BrokenPipeError, ConnectionResetError) as e:
+        print(f"Spojenie s daemonom prerušené: {e}", file=sys.stderr)
+    except KeyboardInterrupt:
+        pass
+
+    # Počkáme na odpovede na posledné požiadavky
+    responder.join()
+    connection.close()
+
 
 if __name__ == "__main__":
+    socket_arg = sys.argv[sys.argv.index("--socket") + 1] if "--socket" in sys.argv else None
+
+    if "--shim" in sys.argv:
+        run_shim(socket_arg)
+        sys.exit(0)
+
     server = SimpleMCPServer()
     
     if len(sys.argv) > 1 and sys.argv[1] == "--stdio":
         server.run_stdio()
+    elif "--daemon" in sys.argv:
+        server.run_daemon(socket_arg)
     else:
         print("🚀 Flowbite MCP Server (Simplified)")
         print("="*50)
         print("Usage:")
         print("  python mcp_server_simple.py --stdio  # For Cline integration")
+        print("  python mcp_server_simple.py --shim   # Stdio shim, shares a warm daemon")
+        print("  python mcp_server_simple.py --daemon # Daemon on a Unix socket")
         print("\nAvailable tools:")
         for tool_name, tool_info in server.tools.items():
             print(f"  • {tool_name}: {tool_info['description']}")
-        print("\nReady for MCP testing! 🎯")
\ No newline at end of file
+        print("\nReady for MCP testing! 🎯")
@@ -3,10 +3,18 @@ Konfigurácia pre Flowbite MCP Server
 """
 
 import os
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pathlib import Path
 
 
+def _parse_mapping(value: str) -> Dict[str, float]:
+    """Načíta zoznam "názov=číslo,názov=číslo" z premennej prostredia"""
+    return {
+        name.strip(): float(number)
+        for name, _, number in (item.partition("=") for item in value.split(",") if "=" in item)
+    }
+
+
 class ServerConfig:
     """Hlavná konfigurácia servera"""
     
@@ -47,6 +55,21 @@ class ServerConfig:
         self.strict_validation: bool = os.getenv("STRICT_VALIDATION", "true").lower() == "true"
         self.auto_format: bool = os.getenv("AUTO_FORMAT", "true").lower() == "true"
         
+        # Transport (stdio pre jedného klienta, http/sse pre zdieľanú inštanciu)
+        self.transport: str = os.getenv("TRANSPORT", "stdio").lower()
+        self.server_host: str = os.getenv("SERVER_HOST", "localhost")
+        self.server_port: int = int(os.getenv("SERVER_PORT", "8000"))
+        self.http_path: str = os.getenv("HTTP_PATH", "/mcp")
+        self.http_workers: int = int(os.getenv("HTTP_WORKERS", "1"))  # 0 = počet jadier
+        self.http_max_concurrency: int = int(os.getenv("HTTP_MAX_CONCURRENCY", "64"))
+        self.http_queue_timeout: float = float(os.getenv("HTTP_QUEUE_TIMEOUT", "30"))
+        self.http_keep_alive: int = int(os.getenv("HTTP_KEEP_ALIVE", "75"))
+        self.http_compression: str = os.getenv("HTTP_COMPRESSION", "gzip").lower()
+        self.http_compression_min_size: int = int(os.getenv("HTTP_COMPRESSION_MIN_SIZE", "1024"))
+        self.http_json_response: bool = os.getenv("HTTP_JSON_RESPONSE", "true").lower() == "true"
+        # Prometheus endpoint metrík v HTTP režime (prázdne = vypnutý)
+        self.metrics_path: str = os.getenv("METRICS_PATH", "/metrics")
+        
         # Development nastavenia
         self.debug: bool = os.getenv("DEBUG", "false").lower() == "true"
         self.log_level: str = os.getenv("LOG_LEVEL", "INFO")
@@ -74,6 +97,35 @@ class ServerConfig:
         # Performance nastavenia
         self.cache_components: bool = True
         self.cache_ttl: int = 3600  # 1 hodina
+        self.docs_chunk_tokens: int = int(os.getenv("DOCS_CHUNK_TOKENS", "400"))
+        # Časové limity nástrojov v sekundách (0 = bez limitu), TOOL_DEADLINES="validate_component=5,..."
+        self.tool_deadline: float = float(os.getenv("TOOL_DEADLINE_SECONDS", "30"))
+        self.tool_deadlines: Dict[str, float] = _parse_mapping(os.getenv("TOOL_DEADLINES", ""))
+        # Vlákna pre CPU náročné nástroje a pre čítanie súborov
+        self.cpu_workers: int = int(os.getenv("CPU_WORKERS", str(min(4, os.cpu_count() or 1))))
+        self.io_workers: int = int(os.getenv("IO_WORKERS", "8"))
+        # Plánovač nástrojov - súbežnosť (0 = bez plánovania), podiely tried a váhy klientov
+        self.scheduler_concurrency: int = int(os.getenv("SCHEDULER_CONCURRENCY", str(self.cpu_workers)))
+        self.scheduler_shares: Dict[str, float] = _parse_mapping(
+            os.getenv("SCHEDULER_SHARES", "interactive=1.0,bulk=0.5")
+        )
+        self.scheduler_client_weights: Dict[str, float] = _parse_mapping(os.getenv("SCHEDULER_CLIENT_WEIGHTS", ""))
+        # Hromadné volania - vymenované nástroje alebo argumenty nad limit bajtov
+        self.scheduler_bulk_tools: List[str] = [
+            name.strip() for name in os.getenv("SCHEDULER_BULK_TOOLS", "").split(",") if name.strip()
+        ]
+        self.scheduler_bulk_bytes: int = int(os.getenv("SCHEDULER_BULK_BYTES", "16384"))
+        # Asynchrónne úlohy (submit_job) - súbežné úlohy v procese, veľkosť a doba uchovania
+        self.job_workers: int = int(os.getenv("JOB_WORKERS", "2"))
+        self.job_max_items: int = int(os.getenv("JOB_MAX_ITEMS", "5000"))
+        self.job_retention_hours: float = float(os.getenv("JOB_RETENTION_HOURS", "24"))
+        # Artefakty sessions (handles HTML) - počet sessions, bajty na session a rozparsované stromy
+        self.artifact_max_sessions: int = int(os.getenv("ARTIFACT_MAX_SESSIONS", "256"))
+        self.artifact_session_bytes: int = int(os.getenv("ARTIFACT_SESSION_BYTES", str(8 * 1024 * 1024)))
+        self.artifact_tree_cache: int = int(os.getenv("ARTIFACT_TREE_CACHE", "64"))
+        
+        # Predvolený režim odpovedí nástrojov (full, compact) - session ani volanie ho nemusia meniť
+        self.response_mode: str = os.getenv("RESPONSE_MODE", "full").lower()
         
         # Accessibility
         self.enforce_accessibility: bool = True
@@ -90,8 +142,13 @@ class ServerConfig:
         
         # Limits
         self.max_component_size: int = 100000  # 100KB
-        self.max_components_per_request: int = 10
-        self.rate_limit_per_minute: int = 100
+        self.max_components_per_request: int = int(os.getenv("MAX_COMPONENTS_PER_REQUEST", "10"))
+        self.rate_limit_per_minute: int = int(os.getenv("RATE_LIMIT_PER_MINUTE", "100"))  # 0 = bez limitu
+        self.rate_limit_burst: int = int(os.getenv("RATE_LIMIT_BURST", "20"))
+        # Proxy (IP alebo sieť CIDR), ktorej sa verí hlavička X-Client-Id - inak sa klient určí podľa IP
+        self.trusted_proxies: List[str] = [
+            proxy.strip() for proxy in os.getenv("TRUSTED_PROXIES", "").split(",") if proxy.strip()
+        ]
         
         # Lokalizácia
         self.default_language: str = "sk"
@@ -109,6 +166,10 @@ class ServerConfig:
         """Vráti cestu k validačnej schéme"""
         return Path(self.schemas_dir) / f"{schema_name}_schema.json"
     
+    def get_tool_deadline(self, tool_name: str) -> float:
+        """Vráti časový limit nástroja v sekundách (0 = bez limitu)"""
+        return self.tool_deadlines.get(tool_name, self.tool_deadline)
+    
     def is_component_supported(self, component_type: str) -> bool:
         """Kontroluje či je typ komponentu podporovaný"""
         return component_type.lower() in self.supported_components
@@ -168,6 +229,19 @@ class ServerConfig:
         if self.accessibility_level not in ["A", "AA", "AAA"]:
             errors.append(f"Nepodporovaný accessibility level: {self.accessibility_level}")
         
+        if self.transport not in ["stdio", "http", "sse"]:
+            errors.append(f"Nepodporovaný transport: {self.transport}")
+        
+        if self.http_compression not in ["gzip", "br", "none"]:
+            errors.append(f"Nepodporovaná kompresia: {self.http_compression}")
+        
+        if self.response_mode not in ["full", "compact"]:
+            errors.append(f"Nepodporovaný režim odpovedí: {self.response_mode}")
+        
+        unknown_classes = set(self.scheduler_shares) - {"interactive", "bulk"}
+        if unknown_classes:
+            errors.append(f"Neznáme triedy plánovača: {', '.join(sorted(unknown_classes))}")
+        
         return errors
 
 
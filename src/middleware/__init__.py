@@ -0,0 +1,3 @@
+"""
+FastMCP middleware okolo volaní nástrojov (limity, plánovanie, metriky)
+"""
@@ -0,0 +1,68 @@
+"""
+Zlučovanie súbežných rovnakých volaní nástrojov (single-flight)
+"""
+
+from typing import Iterable, Optional
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from ..utils.response_mode import ResponseModes
+from ..utils.single_flight import SingleFlight, canonical_key
+from .identity import session_identity
+
+# Nástroje bez vedľajších účinkov - rovnaké argumenty dávajú rovnaký výsledok.
+# fetch_resource sem nepatrí, registruje session volajúceho na notifikácie.
+COALESCED_TOOLS = frozenset({
+    "generate_component",
+    "validate_component",
+    "suggest_components",
+    "get_documentation_section",
+    "retrieve_docs"
+})
+
+# Nástroje, ktoré ukladajú artefakt do session volajúceho (a čítajú handles
+# z nej) - zlučujú sa len volania z rovnakej session, inak by ostatní
+# volajúci dostali handle, ktorý ich session nepozná
+SESSION_SCOPED_TOOLS = frozenset({
+    "generate_component",
+    "validate_component"
+})
+
+
+class SingleFlightMiddleware(Middleware):
+    """
+    Súbežné volania rovnakého nástroja s rovnakými argumentami čakajú
+    na jeden výpočet namiesto toho, aby každé počítalo znova
+    """
+
+    def __init__(self, flights: SingleFlight, tools: Iterable[str] = COALESCED_TOOLS,
+                 response_modes: Optional[ResponseModes] = None,
+                 session_tools: Iterable[str] = SESSION_SCOPED_TOOLS):
+        self.flights = flights
+        self.tools = frozenset(tools)
+        self.response_modes = response_modes
+        self.session_tools = frozenset(session_tools)
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        name = context.message.name
+        if name not in self.tools:
+            return await call_next(context)
+
+        arguments = context.message.arguments or {}
+        session = session_identity(context.fastmcp_context)
+        if self.response_modes is not None:
+            # Rovnaké argumenty v sessions s iným režimom odpovedí dávajú iný výsledok
+            try:
+                mode = self.response_modes.get(session, arguments.get("response_mode"))
+                arguments = {**arguments, "response_mode": mode}
+            except ValueError:
+                pass  # Neplatný režim ohlási samotný nástroj
+
+        key = canonical_key(name, arguments)
+        if name in self.session_tools:
+            key = f"{key}:{session}"
+        return await self.flights.do(key, lambda: call_next(context))
+
+
+# Globálne zlučovanie volaní nástrojov
+tool_flights = SingleFlight()
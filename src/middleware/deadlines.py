@@ -0,0 +1,32 @@
+"""
+Časové limity a zrušenie volaní nástrojov
+"""
+
+import asyncio
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from ..config import get_config
+from ..utils.cancellation import CancellationToken, cancellation_scope
+
+config = get_config()
+
+
+class DeadlineMiddleware(Middleware):
+    """
+    Každé volanie nástroja dostane token zrušenia s limitom podľa
+    config.get_tool_deadline()
+
+    Keď klient pošle notifications/cancelled, MCP SDK zruší úlohu
+    požiadavky - middleware to prenesie do tokenu, aby skončila aj práca,
+    ktorá beží mimo slučky alebo medzi kontrolami.
+    """
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        token = CancellationToken(config.get_tool_deadline(context.message.name))
+        with cancellation_scope(token):
+            try:
+                return await call_next(context)
+            except asyncio.CancelledError:
+                token.cancel()
+                raise
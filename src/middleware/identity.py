@@ -0,0 +1,104 @@
+"""
+Identifikácia klienta volania nástroja
+"""
+
+import ipaddress
+import logging
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from ..config import get_config
+
+# Konfigurácia
+config = get_config()
+logger = logging.getLogger(__name__)
+
+# Hlavička, ktorou dôveryhodná proxy rozlišuje klientov za sebou
+CLIENT_ID_HEADER = "x-client-id"
+# Hlavička session streamable HTTP transportu
+SESSION_ID_HEADER = "mcp-session-id"
+
+
+@lru_cache(maxsize=8)
+def _proxy_networks(proxies: Tuple[str, ...]) -> List[object]:
+    """Rozparsuje TRUSTED_PROXIES na siete (neplatné položky sa preskočia)"""
+    networks = []
+    for proxy in proxies:
+        try:
+            networks.append(ipaddress.ip_network(proxy, strict=False))
+        except ValueError:
+            logger.warning(f"Neplatná adresa v TRUSTED_PROXIES: {proxy}")
+    return networks
+
+
+def is_trusted_proxy(host: Optional[str]) -> bool:
+    """Či je adresa spojenia dôveryhodná proxy z TRUSTED_PROXIES"""
+    if not host or not config.trusted_proxies:
+        return False
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in _proxy_networks(tuple(config.trusted_proxies)))
+
+
+def client_identity(fastmcp_context: Optional[object] = None) -> str:
+    """
+    Vráti identifikátor klienta pre limity a plánovanie
+
+    Poradie: IP adresa HTTP klienta (hlavička X-Client-Id len od
+    dôveryhodnej proxy - inak by si klient novou hodnotou získal nový
+    limit), client_id z metadát požiadavky; inak "local" (stdio má
+    jedného klienta na proces).
+    """
+    try:
+        from fastmcp.server.dependencies import get_http_request
+        request = get_http_request()
+        host = request.client.host if request.client else None
+        if is_trusted_proxy(host):
+            client_id = request.headers.get(CLIENT_ID_HEADER)
+            if client_id:
+                return client_id
+        if host:
+            return host
+    except RuntimeError:
+        pass  # Mimo HTTP požiadavky
+
+    if fastmcp_context is not None and getattr(fastmcp_context, "client_id", None):
+        return fastmcp_context.client_id
+
+    return "local"
+
+
+# Bezstavové HTTP (pre-fork workery) - volania tej istej session môžu
+# skončiť na rôznych procesoch, stav session v pamäti by sa stratil
+_stateless_sessions = False
+
+
+def use_stateless_sessions(stateless: bool = True):
+    """Vypne stav viazaný na session (artefakty, režim odpovedí) v tomto procese"""
+    global _stateless_sessions
+    _stateless_sessions = stateless
+
+
+def session_identity(fastmcp_context: Optional[object] = None) -> Optional[str]:
+    """
+    Vráti identifikátor session pre stav viazaný na session (artefakty)
+
+    Streamable HTTP session má hlavičku Mcp-Session-Id, SSE parameter
+    session_id; stdio spojenie je jedna session na proces. HTTP
+    požiadavka bez session vráti None - IP adresu zdieľajú všetci
+    klienti za NAT alebo proxy, stav session sa na ňu viazať nesmie.
+    Bezstavový pre-fork worker vráti vždy None.
+    """
+    if _stateless_sessions:
+        return None
+
+    try:
+        from fastmcp.server.dependencies import get_http_request
+        request = get_http_request()
+    except RuntimeError:
+        # Mimo HTTP požiadavky (stdio, klient v procese)
+        return client_identity(fastmcp_context)
+
+    return request.headers.get(SESSION_ID_HEADER) or request.query_params.get("session_id") or None
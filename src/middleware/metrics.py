@@ -0,0 +1,108 @@
+"""
+Metriky volaní nástrojov a čítaní resources (latencia, veľkosti, rozbehnuté volania)
+"""
+
+import time
+from typing import Any, Dict
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from ..utils.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+# Najviac sledovaných mien nástrojov - ďalšie (napr. neexistujúce) sa zlúčia do "other"
+MAX_TRACKED_TOOLS = 128
+
+
+class _EndpointMetrics:
+    """Metriky jedného nástroja alebo druhu resource"""
+
+    __slots__ = ("calls", "errors", "in_flight", "latency", "request_chars", "response_chars")
+
+    def __init__(self, registry: MetricsRegistry, prefix: str, **labels):
+        self.calls: Counter = registry.counter(f"{prefix}_calls_total", "Calls", **labels)
+        self.errors: Counter = registry.counter(f"{prefix}_errors_total", "Calls that raised an error", **labels)
+        self.in_flight: Gauge = registry.gauge(f"{prefix}_in_flight", "Calls in progress", **labels)
+        self.latency: Histogram = registry.histogram(f"{prefix}_latency_us", "Call latency in microseconds", **labels)
+        self.request_chars: Histogram = registry.histogram(
+            f"{prefix}_request_chars", "Size of string arguments in characters", **labels
+        )
+        self.response_chars: Histogram = registry.histogram(
+            f"{prefix}_response_chars", "Size of text content in characters", **labels
+        )
+
+
+def _arguments_size(arguments: Any) -> int:
+    """Veľkosť reťazcových argumentov (HTML, kontext) bez serializácie"""
+    if not arguments:
+        return 0
+    return sum(len(value) for value in arguments.values() if isinstance(value, str))
+
+
+def _content_size(result: Any) -> int:
+    """Veľkosť textového obsahu výsledku nástroja alebo resource"""
+    items = getattr(result, "content", None)
+    if items is None:
+        items = getattr(result, "contents", None) or []
+    size = 0
+    for item in items:
+        text = getattr(item, "text", None)
+        if text is None:
+            text = getattr(item, "content", None)
+        if isinstance(text, (str, bytes)):
+            size += len(text)
+    return size
+
+
+class MetricsMiddleware(Middleware):
+    """
+    Meria každé volanie nástroja a čítanie resource
+
+    Ako vonkajší middleware zahŕňa aj čakanie v limite, single-flight a
+    plánovači - latencia je tá, ktorú vidí klient.
+    """
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self._tools: Dict[str, _EndpointMetrics] = {}
+        self._resources: Dict[str, _EndpointMetrics] = {}
+
+    def _tool(self, name: str) -> _EndpointMetrics:
+        tool = self._tools.get(name)
+        if tool is None:
+            if len(self._tools) >= MAX_TRACKED_TOOLS:
+                name = "other"
+            tool = self._tools.get(name) or _EndpointMetrics(self.registry, "tool", tool=name)
+            self._tools[name] = tool
+        return tool
+
+    def _resource(self, uri: str) -> _EndpointMetrics:
+        # Druh resource (components, docs) - celé URI by malo neohraničený počet hodnôt
+        parts = uri.split("/", 3)
+        kind = parts[2] if len(parts) > 2 and parts[2] in ("components", "docs") else "other"
+        resource = self._resources.get(kind)
+        if resource is None:
+            resource = self._resources[kind] = _EndpointMetrics(self.registry, "resource", kind=kind)
+        return resource
+
+    async def _measure(self, endpoint: _EndpointMetrics, context: MiddlewareContext, call_next):
+        endpoint.calls.value += 1
+        endpoint.in_flight.value += 1
+        started = time.perf_counter_ns()
+        try:
+            result = await call_next(context)
+        except BaseException:
+            endpoint.errors.value += 1
+            raise
+        finally:
+            endpoint.in_flight.value -= 1
+            endpoint.latency.record((time.perf_counter_ns() - started) // 1000)
+        endpoint.response_chars.record(_content_size(result))
+        return result
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        tool = self._tool(context.message.name)
+        tool.request_chars.record(_arguments_size(context.message.arguments))
+        return await self._measure(tool, context, call_next)
+
+    async def on_read_resource(self, context: MiddlewareContext, call_next):
+        return await self._measure(self._resource(str(context.message.uri)), context, call_next)
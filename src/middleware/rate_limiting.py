@@ -0,0 +1,43 @@
+"""
+Limit volaní nástrojov na klienta (config.rate_limit_per_minute)
+"""
+
+import logging
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from mcp import MCPError
+
+from ..config import get_config
+from ..utils.rate_limit import RateLimitExceeded, TokenBucketLimiter
+from .identity import client_identity
+
+config = get_config()
+logger = logging.getLogger(__name__)
+
+
+class RateLimitMiddleware(Middleware):
+    """
+    Token-bucket limit pred každým nástrojom servera
+
+    Pri prekročení vráti JSON-RPC chybu s data.retry_after, aby klient
+    (napr. agent v slučke) vedel, kedy to skúsiť znova. V pre-fork
+    režime má každý worker vlastné vedrá.
+    """
+
+    def __init__(self, limiter: TokenBucketLimiter):
+        self.limiter = limiter
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        client_id = client_identity(context.fastmcp_context)
+        try:
+            self.limiter.acquire(client_id)
+        except RateLimitExceeded as e:
+            logger.warning(f"Klient {client_id} prekročil limit pri volaní {context.message.name}")
+            error = e.to_error()
+            raise MCPError(error["code"], error["message"], error["data"])
+
+        return await call_next(context)
+
+
+# Globálny limiter volaní nástrojov
+tool_limiter = TokenBucketLimiter(config.rate_limit_per_minute, config.rate_limit_burst)
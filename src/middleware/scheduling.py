@@ -0,0 +1,57 @@
+"""
+Plánovanie volaní nástrojov podľa priority (interaktívne vs. hromadné)
+"""
+
+import json
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from ..config import get_config
+from ..utils.scheduler import BULK, INTERACTIVE, PriorityScheduler
+from .identity import client_identity
+
+config = get_config()
+
+
+class SchedulerMiddleware(Middleware):
+    """
+    Každé volanie nástroja čaká na miesto vo svojej prioritnej triede
+
+    Do hromadnej triedy patria nástroje z config.scheduler_bulk_tools a
+    volania s argumentmi väčšími ako config.scheduler_bulk_bytes. Cena
+    volania pre férové radenie rastie s veľkosťou argumentov.
+    """
+
+    def __init__(self, scheduler: PriorityScheduler, bulk_tools: Optional[Iterable[str]] = None,
+                 bulk_bytes: Optional[int] = None):
+        self.scheduler = scheduler
+        self.bulk_tools = frozenset(config.scheduler_bulk_tools if bulk_tools is None else bulk_tools)
+        self.bulk_bytes = config.scheduler_bulk_bytes if bulk_bytes is None else bulk_bytes
+
+    def classify(self, tool_name: str, arguments: Optional[Dict[str, Any]]) -> Tuple[str, float]:
+        """
+        Určí prioritnú triedu a cenu volania
+
+        Returns:
+            (trieda, cena) - cena je 1 + veľkosť argumentov v násobkoch bulk_bytes
+        """
+        size = len(json.dumps(arguments, ensure_ascii=False, default=str)) if arguments else 0
+        priority = BULK if tool_name in self.bulk_tools or size > self.bulk_bytes else INTERACTIVE
+        return priority, 1.0 + size / max(self.bulk_bytes, 1)
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        if not self.scheduler.enabled:
+            return await call_next(context)
+
+        priority, cost = self.classify(context.message.name, context.message.arguments)
+        async with self.scheduler.slot(client_identity(context.fastmcp_context), priority, cost):
+            return await call_next(context)
+
+
+# Globálny plánovač volaní nástrojov
+tool_scheduler = PriorityScheduler(
+    config.scheduler_concurrency,
+    config.scheduler_shares,
+    config.scheduler_client_weights
+)
@@ -264,11 +264,25 @@ class ComponentValidationResult(BaseModel):
     suggestions: List[str] = Field(default_factory=list, description="Návrhy na zlepšenie")
     score: float = Field(0.0, description="Skóre kvality (0-100)")
     
+    # Stabilné kódy nálezov v poradí správ (kompaktné odpovede)
+    error_codes: List[str] = Field(default_factory=list, description="Kódy chýb")
+    warning_codes: List[str] = Field(default_factory=list, description="Kódy upozornení")
+    suggestion_codes: List[str] = Field(default_factory=list, description="Kódy návrhov")
+    
     # Detailná analýza
     accessibility_score: float = Field(0.0, description="Accessibility skóre")
     performance_score: float = Field(0.0, description="Performance skóre")
     best_practices_score: float = Field(0.0, description="Best practices skóre")
     
+    # Typ komponentu
+    component_type: Optional[str] = Field(None, description="Zadaný alebo detegovaný typ komponentu")
+    component_variant: Optional[str] = Field(None, description="Detegovaná varianta komponentu")
+    type_detected: bool = Field(False, description="Či bol typ určený automaticky")
+    
+    # Neúplná validácia (vypršal časový limit)
+    truncated: bool = Field(False, description="Či sa pre časový limit preskočili niektoré pravidlá")
+    skipped_rules: List[str] = Field(default_factory=list, description="Preskočené skupiny pravidiel")
+    
     # Metadata
     validated_at: Optional[str] = Field(None, description="Čas validácie")
     validator_version: Optional[str] = Field(None, description="Verzia validátora")
@@ -2,12 +2,19 @@
 Resources moduly pre Flowbite MCP
 """
 
-from .component_db import ComponentDatabase, component_db
-from .documentation import DocumentationManager, documentation_manager
-
-__all__ = [
-    'ComponentDatabase',
-    'component_db',
-    'DocumentationManager', 
-    'documentation_manager'
-]
\ No newline at end of file
+# Moduly sa importujú až pri prvom prístupe k atribútu (PEP 562)
+_EXPORTS = {
+    'ComponentDatabase': '.component_db',
+    'component_db': '.component_db',
+    'DocumentationManager': '.documentation',
+    'documentation_manager': '.documentation'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        import importlib
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,18 +10,24 @@ from dataclasses import asdict
 
 from ..config import get_config
 from ..models.component import FlowbiteComponent, ComponentType, ComponentVariant
+from ..utils.executors import io_pool
+from ..utils.metrics import metrics
+from .versions import resource_versions
 
 # Konfigurácia
 config = get_config()
 logger = logging.getLogger(__name__)
 
+# Úspešnosť cache načítaných komponentov
+cache_metrics = metrics.cache("component_db")
+
 
 class ComponentDatabase:
     """Správca databázy Flowbite komponentov"""
     
     def __init__(self):
         self.config = config
-        self.components_dir = config.data_dir / "components"
+        self.components_dir = Path(config.components_dir)
         self._cache = {}
         self._index = {}
         self._initialize_index()
@@ -102,6 +108,27 @@ class ComponentDatabase:
         except Exception as e:
             logger.error(f"Chyba pri ukladaní indexu: {e}")
     
+    def warm_up(self):
+        """Načíta celý katalóg do cache vopred (pred forkom workerov)"""
+        for component_type, component_info in self._index.get("components", {}).items():
+            cache_key = f"{component_type}_all"
+            if cache_key in self._cache:
+                continue
+            
+            try:
+                with open(self.components_dir / component_info["file"], 'r', encoding='utf-8') as f:
+                    self._cache[cache_key] = json.load(f)
+            except Exception as e:
+                logger.error(f"Chyba pri načítaní komponentu {component_type}: {e}")
+    
+    def _read_component_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Načíta JSON súbor komponentu (None ak neexistuje) - blokujúce"""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+    
     async def get_component(
         self,
         component_type: str,
@@ -121,20 +148,20 @@ class ComponentDatabase:
             # Kontrola cache
             cache_key = f"{component_type}_{variant or 'all'}"
             if cache_key in self._cache:
+                cache_metrics.hit()
                 return self._cache[cache_key]
+            cache_metrics.miss()
             
             # Načítanie zo súboru
             component_info = self._index["components"].get(component_type)
             if not component_info:
                 return None
             
-            file_path = self.components_dir / component_info["file"]
-            if not file_path.exists():
+            # Súbor sa číta v I/O poole, slučka medzitým obsluhuje ďalšie volania
+            data = await io_pool.run(self._read_component_file, self.components_dir / component_info["file"])
+            if data is None:
                 return None
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
             # Ak je špecifikovaná varianta
             if variant:
                 variant_data = data.get("variants", {}).get(variant)
@@ -367,6 +394,8 @@ class ComponentDatabase:
             
             # Vyčistenie cache
             self._cache.clear()
+            self._invalidate_fingerprints()
+            resource_versions.changed(f"flowbite://components/{component_type}")
             
             logger.info(f"Komponent {component_type} úspešne pridaný")
             return True
@@ -451,6 +480,8 @@ class ComponentDatabase:
                 
                 # Vyčistenie cache
                 self._cache.clear()
+                self._invalidate_fingerprints()
+                resource_versions.changed(f"flowbite://components/{component_type}")
                 
                 logger.info(f"Komponent {component_type} úspešne zmazaný")
                 return True
@@ -496,6 +527,11 @@ class ComponentDatabase:
             logger.error(f"Chyba pri získavaní štatistík: {e}")
             return {"error": str(e)}
     
+    def _invalidate_fingerprints(self):
+        """Označí index odtlačkov CSS tried na prebudovanie"""
+        from ..tools.fingerprint import fingerprint_index
+        fingerprint_index.invalidate()
+    
     def clear_cache(self):
         """Vyčistí cache"""
         self._cache.clear()
@@ -505,8 +541,14 @@ class ComponentDatabase:
         """Znovu zostaví index"""
         self._cache.clear()
         self._build_index()
+        self._invalidate_fingerprints()
+        resource_versions.changed("flowbite://components")
         logger.info("Index znovu zostavený")
 
 
-# Globálna inštancia databázy
-component_db = ComponentDatabase()
\ No newline at end of file
+# Globálna inštancia databázy - vytvorí sa pri prvom prístupe (PEP 562)
+def __getattr__(name: str):
+    if name == "component_db":
+        from ..utils.registry import subsystems
+        return subsystems.get("component_db")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
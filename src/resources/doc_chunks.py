@@ -0,0 +1,151 @@
+"""
+Delenie dokumentácie na stabilné úseky ohraničené počtom tokenov
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .doc_index import tokenize
+from .markdown_renderer import FENCE_RE
+
+# Predvolená maximálna veľkosť úseku v tokenoch
+DEFAULT_CHUNK_TOKENS = 400
+
+# Hrubý odhad - priemerne ~4 znaky na token
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Odhadne počet tokenov textu"""
+    return max(1, round(len(text) / CHARS_PER_TOKEN))
+
+
+@dataclass
+class DocChunk:
+    """Úsek dokumentácie pod jedným nadpisom"""
+    id: str
+    section: str
+    path: List[str]
+    start: int  # Bajtový rozsah v .md súbore
+    end: int
+    content: str
+    tokens: int = field(init=False)
+
+    def __post_init__(self):
+        self.tokens = estimate_tokens(self.content)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "section": self.section,
+            "path": self.path,
+            "tokens": self.tokens,
+            "content": self.content
+        }
+
+
+def _split_blocks(text: str) -> List[str]:
+    """Rozdelí text na bloky podľa prázdnych riadkov mimo blokov kódu"""
+    blocks: List[str] = []
+    current: List[str] = []
+    in_code = False
+
+    for line in text.splitlines(keepends=True):
+        if FENCE_RE.match(line.rstrip('\r\n')):
+            in_code = not in_code
+        current.append(line)
+        if not in_code and not line.strip():
+            blocks.append(''.join(current))
+            current = []
+
+    if current:
+        blocks.append(''.join(current))
+    return blocks
+
+
+def _pack(text: str, max_tokens: int) -> List[str]:
+    """Poskladá bloky (prípadne riadky) do častí s najviac max_tokens"""
+    if estimate_tokens(text) <= max_tokens:
+        return [text]
+
+    pieces: List[str] = []
+    current = ''
+    for block in _split_blocks(text):
+        # Príliš veľký blok (dlhý kód) sa delí po riadkoch
+        units = [block] if estimate_tokens(block) <= max_tokens else block.splitlines(keepends=True)
+        for unit in units:
+            if current and estimate_tokens(current + unit) > max_tokens:
+                pieces.append(current)
+                current = ''
+            current += unit
+
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def build_chunks(
+    section: str,
+    data: bytes,
+    headings: Sequence[Tuple[int, str, int, int]],
+    max_tokens: int = DEFAULT_CHUNK_TOKENS
+) -> List[DocChunk]:
+    """
+    Rozdelí dokument na úseky podľa nadpisov
+
+    Každý nadpis tvorí úsek od seba po najbližší ďalší nadpis. Úseky nad
+    limit sa delia na hraniciach odstavcov. ID je odvodené z cesty nadpisov
+    (api/mcp-tools/generate_component), takže sa nemení pri úpravách iných
+    častí dokumentu.
+
+    Args:
+        section: Názov sekcie
+        data: Obsah .md súboru v bajtoch
+        headings: Nadpisy z heading_spans()
+        max_tokens: Maximálna veľkosť úseku
+
+    Returns:
+        Zoznam úsekov v poradí dokumentu
+    """
+    boundaries = [(0, 0, None)]
+    boundaries += [(start, level, title) for level, title, start, _ in headings]
+
+    chunks: List[DocChunk] = []
+    used_ids: Dict[str, int] = {}
+    path: List[Tuple[int, str]] = []
+
+    for index, (start, level, title) in enumerate(boundaries):
+        end = boundaries[index + 1][0] if index + 1 < len(boundaries) else len(data)
+
+        if title is not None:
+            while path and path[-1][0] >= level:
+                path.pop()
+            path.append((level, title))
+
+        text = data[start:end].decode('utf-8')
+        body = text.partition('\n')[2] if title is not None else text
+        if not body.strip():
+            continue  # Nadpis bez vlastného textu je súčasťou cesty podsekcií
+
+        # H1 je názov celej sekcie - do ID sa nedáva; ID je ASCII bez diakritiky
+        slug = '/'.join('-'.join(tokenize(t)) for lvl, t in path if lvl > 1) or 'intro'
+        base_id = f"{section}/{slug}"
+        used_ids[base_id] = used_ids.get(base_id, 0) + 1
+        if used_ids[base_id] > 1:
+            base_id = f"{base_id}-{used_ids[base_id]}"
+
+        pieces = _pack(text, max_tokens)
+        position = start
+        for part, piece in enumerate(pieces):
+            piece_end = position + len(piece.encode('utf-8'))
+            chunks.append(DocChunk(
+                id=base_id if part == 0 else f"{base_id}:{part + 1}",
+                section=section,
+                path=[t for _, t in path],
+                start=position,
+                end=piece_end,
+                content=piece
+            ))
+            position = piece_end
+
+    return chunks
@@ -0,0 +1,463 @@
+"""
+Pozičný invertovaný index pre fulltextové vyhľadávanie v dokumentácii
+"""
+
+import json
+import math
+import os
+import re
+import hashlib
+import logging
+import tempfile
+import unicodedata
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"\w+")
+QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+# Maximum termov, na ktoré sa rozvinie prefixový dotaz (napr. "valid*")
+MAX_PREFIX_EXPANSIONS = 64
+
+# BM25 parametre
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+@lru_cache(maxsize=16384)
+def normalize_term(token: str) -> str:
+    """Normalizuje token - malé písmená bez diakritiky"""
+    decomposed = unicodedata.normalize("NFKD", token.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def tokenize(text: str) -> List[str]:
+    """Rozdelí text na normalizované termy"""
+    return [normalize_term(match.group()) for match in TOKEN_RE.finditer(text)]
+
+
+@dataclass
+class QueryClause:
+    """Časť dotazu - term, prefix alebo fráza"""
+    terms: List[str]
+    prefix: bool = False
+
+    @property
+    def length(self) -> int:
+        return len(self.terms)
+
+
+@dataclass
+class SearchHit:
+    """Výsledok vyhľadávania v jednom dokumente"""
+    doc_id: str
+    score: float
+    matches: int
+    start: int  # Bajtový offset prvej zhody
+    end: int
+
+
+def parse_query(query: str) -> List[QueryClause]:
+    """
+    Rozparsuje dotaz na klauzuly
+
+    - "presná fráza" v úvodzovkách
+    - prefix* pre prefixové vyhľadávanie
+    - slovo s interpunkciou (flowbite://docs) sa hľadá ako fráza
+    """
+    clauses = []
+
+    for phrase, word in QUERY_RE.findall(query):
+        if phrase:
+            terms = tokenize(phrase)
+            if terms:
+                clauses.append(QueryClause(terms))
+            continue
+
+        prefix = word.endswith("*")
+        terms = tokenize(word)
+        if terms:
+            clauses.append(QueryClause(terms, prefix=prefix))
+
+    return clauses
+
+
+class DocumentationSearchIndex:
+    """Perzistentný pozičný invertovaný index nad súbormi dokumentácie"""
+
+    VERSION = 1
+
+    def __init__(self, docs_dir: Path, index_file: Optional[Path] = None, persistent: bool = True):
+        self.docs_dir = Path(docs_dir)
+        self.index_file = index_file or self.docs_dir / "search_index.json"
+        # Neperzistentný index (napr. nad úsekmi dokumentácie) žije len v pamäti
+        self.persistent = persistent
+        # doc_id -> {file, hash, mtime, size, length, offsets}
+        self._documents: Dict[str, Dict] = {}
+        # term -> {doc_id -> [pozície]}
+        self._postings: Dict[str, Dict[str, List[int]]] = {}
+        self._vocabulary: Optional[List[str]] = None
+        self._total_length = 0
+        self._loaded = False
+
+    # Perzistencia
+
+    def load(self):
+        """Načíta index zo súboru"""
+        self._loaded = True
+
+        if not self.persistent or not self.index_file.exists():
+            return
+
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if data.get("version") != self.VERSION:
+                logger.info("Nekompatibilná verzia vyhľadávacieho indexu, zostavujem nanovo")
+                return
+
+            self._documents = data.get("documents", {})
+            self._postings = data.get("postings", {})
+            self._total_length = sum(doc["length"] for doc in self._documents.values())
+            self._vocabulary = None
+
+        except Exception as e:
+            logger.error(f"Chyba pri načítaní vyhľadávacieho indexu: {e}")
+            self._documents = {}
+            self._postings = {}
+            self._total_length = 0
+
+    def save(self):
+        """Uloží index do súboru"""
+        if not self.persistent:
+            return
+        self.write(self.serialize())
+
+    def serialize(self) -> str:
+        """
+        Snímka indexu ako JSON
+
+        Volá sa tam, kde sa index mení (na slučke) - zápis súboru potom
+        môže bežať v io_pool bez čítania meniacich sa slovníkov.
+        """
+        return json.dumps({
+            "version": self.VERSION,
+            "documents": self._documents,
+            "postings": self._postings
+        }, ensure_ascii=False, separators=(",", ":"))
+
+    def write(self, payload: str):
+        """Zapíše snímku indexu do súboru"""
+        if not self.persistent:
+            return
+
+        temp_file = None
+        try:
+            # Unikátny dočasný súbor - ukladať môžu súčasne pre-fork workery
+            # aj úloha reindexácie; os.replace je atomický
+            with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=self.index_file.parent,
+                prefix=f".{self.index_file.name}.", suffix=".tmp", delete=False
+            ) as f:
+                temp_file = f.name
+                f.write(payload)
+            os.replace(temp_file, self.index_file)
+
+        except Exception as e:
+            logger.error(f"Chyba pri ukladaní vyhľadávacieho indexu: {e}")
+            if temp_file and os.path.exists(temp_file):
+                os.unlink(temp_file)
+
+    def sync(self, doc_ids: Iterable[str]) -> bool:
+        """
+        Zosynchronizuje index so súbormi na disku
+
+        Reindexuje len dokumenty so zmenenou veľkosťou alebo mtime.
+
+        Returns:
+            True ak sa index zmenil
+        """
+        if not self._loaded:
+            self.load()
+
+        changed = False
+        wanted = set(doc_ids)
+
+        for doc_id in list(self._documents):
+            if doc_id not in wanted:
+                self.remove_document(doc_id)
+                changed = True
+
+        for doc_id in wanted:
+            file_path = self.docs_dir / f"{doc_id}.md"
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
+                if doc_id in self._documents:
+                    self.remove_document(doc_id)
+                    changed = True
+                continue
+
+            indexed = self._documents.get(doc_id)
+            if indexed and indexed["mtime"] == stat.st_mtime and indexed["size"] == stat.st_size:
+                continue
+
+            # newline='' zachová bajtové offsety zhodné so súborom
+            with open(file_path, 'r', encoding='utf-8', newline='') as f:
+                content = f.read()
+            self.index_document(doc_id, content, mtime=stat.st_mtime, size=stat.st_size)
+            changed = True
+
+        if changed:
+            self.save()
+
+        return changed
+
+    # Indexovanie
+
+    def index_document(
+        self,
+        doc_id: str,
+        content: str,
+        mtime: Optional[float] = None,
+        size: Optional[int] = None
+    ):
+        """Zaindexuje (alebo preindexuje) jeden dokument"""
+        if not self._loaded:
+            self.load()
+
+        if doc_id in self._documents:
+            self.remove_document(doc_id)
+
+        offsets: List[int] = []
+        postings: Dict[str, List[int]] = {}
+
+        # Bajtové offsety - úryvky sa čítajú priamo zo súboru cez seek
+        byte_position = 0
+        char_position = 0
+        for position, match in enumerate(TOKEN_RE.finditer(content)):
+            start, end = match.span()
+            byte_position += len(content[char_position:start].encode('utf-8'))
+            token_bytes = len(match.group().encode('utf-8'))
+            offsets.append(byte_position)
+            offsets.append(byte_position + token_bytes)
+            byte_position += token_bytes
+            char_position = end
+
+            postings.setdefault(normalize_term(match.group()), []).append(position)
+
+        for term, positions in postings.items():
+            self._postings.setdefault(term, {})[doc_id] = positions
+
+        encoded_size = byte_position + len(content[char_position:].encode('utf-8'))
+        self._documents[doc_id] = {
+            "file": f"{doc_id}.md",
+            "hash": hashlib.sha256(content.encode('utf-8')).hexdigest(),
+            "mtime": mtime,
+            "size": size if size is not None else encoded_size,
+            "length": len(offsets) // 2,
+            "offsets": offsets,
+            "terms": list(postings)
+        }
+        self._total_length += len(offsets) // 2
+        self._vocabulary = None
+
+    def remove_document(self, doc_id: str):
+        """Odstráni dokument z indexu"""
+        document = self._documents.pop(doc_id, None)
+        if not document:
+            return
+
+        for term in document["terms"]:
+            doc_postings = self._postings.get(term)
+            if doc_postings:
+                doc_postings.pop(doc_id, None)
+                if not doc_postings:
+                    del self._postings[term]
+
+        self._total_length -= document["length"]
+        self._vocabulary = None
+
+    def set_document_stat(self, doc_id: str, mtime: float, size: int):
+        """Aktualizuje mtime/size po zápise súboru (bez reindexovania)"""
+        if doc_id in self._documents:
+            self._documents[doc_id]["mtime"] = mtime
+            self._documents[doc_id]["size"] = size
+
+    # Vyhľadávanie
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        """Vráti termy začínajúce daným prefixom"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+
+        terms = []
+        index = bisect_left(self._vocabulary, prefix)
+        while index < len(self._vocabulary) and self._vocabulary[index].startswith(prefix):
+            terms.append(self._vocabulary[index])
+            if len(terms) >= MAX_PREFIX_EXPANSIONS:
+                break
+            index += 1
+        return terms
+
+    def _term_positions(self, term: str, prefix: bool) -> Dict[str, List[int]]:
+        """Pozície termu (alebo všetkých termov s prefixom) podľa dokumentu"""
+        if not prefix:
+            return self._postings.get(term, {})
+
+        merged: Dict[str, List[int]] = {}
+        for expanded in self._expand_prefix(term):
+            for doc_id, positions in self._postings[expanded].items():
+                merged.setdefault(doc_id, []).extend(positions)
+        for positions in merged.values():
+            positions.sort()
+        return merged
+
+    def _match_clause(self, clause: QueryClause) -> Dict[str, List[int]]:
+        """Nájde začiatočné pozície zhôd klauzuly podľa dokumentu"""
+        last = clause.length - 1
+        term_positions = [
+            self._term_positions(term, clause.prefix and i == last)
+            for i, term in enumerate(clause.terms)
+        ]
+
+        if clause.length == 1:
+            return term_positions[0]
+
+        # Fráza - nasledujúce termy musia byť na nasledujúcich pozíciách
+        candidates = set(term_positions[0])
+        for positions in term_positions[1:]:
+            candidates &= positions.keys()
+
+        matches: Dict[str, List[int]] = {}
+        for doc_id in candidates:
+            following = [set(positions[doc_id]) for positions in term_positions[1:]]
+            starts = [
+                p for p in term_positions[0][doc_id]
+                if all(p + i + 1 in following[i] for i in range(last))
+            ]
+            if starts:
+                matches[doc_id] = starts
+        return matches
+
+    def search(
+        self,
+        query: str,
+        max_results: Optional[int] = 10,
+        match_all: bool = True
+    ) -> List[SearchHit]:
+        """
+        Vyhľadá dokumenty zodpovedajúce klauzulám dotazu
+
+        Args:
+            query: Dotaz (termy, "frázy", prefixy*)
+            max_results: Maximum výsledkov (None = všetky)
+            match_all: Dokument musí obsahovať všetky klauzuly (inak stačí
+                jedna a viac zhôd zvyšuje skóre)
+
+        Returns:
+            Výsledky zoradené podľa BM25 skóre
+        """
+        if not self._loaded:
+            self.load()
+
+        clauses = parse_query(query)
+        if not clauses or not self._documents:
+            return []
+
+        clause_matches = [self._match_clause(clause) for clause in clauses]
+
+        doc_ids = set(clause_matches[0])
+        for matches in clause_matches[1:]:
+            if match_all:
+                doc_ids &= matches.keys()
+            else:
+                doc_ids |= matches.keys()
+
+        total_docs = len(self._documents)
+        average_length = self._total_length / total_docs if total_docs else 1.0
+
+        hits = []
+        for doc_id in doc_ids:
+            document = self._documents[doc_id]
+            length_norm = 1 - BM25_B + BM25_B * document["length"] / (average_length or 1.0)
+
+            score = 0.0
+            match_count = 0
+            first: Optional[Tuple[int, int]] = None
+
+            for clause, matches in zip(clauses, clause_matches):
+                positions = matches.get(doc_id)
+                if not positions:
+                    continue
+                frequency = len(positions)
+                document_frequency = len(matches)
+                idf = math.log(1 + (total_docs - document_frequency + 0.5) / (document_frequency + 0.5))
+                # Frázy majú vyššiu váhu ako jednotlivé termy
+                score += clause.length * idf * frequency * (BM25_K1 + 1) / (
+                    frequency + BM25_K1 * length_norm
+                )
+                match_count += frequency
+
+                if first is None or positions[0] < first[0]:
+                    first = (positions[0], positions[0] + clause.length - 1)
+
+            offsets = document["offsets"]
+            hits.append(SearchHit(
+                doc_id=doc_id,
+                score=score,
+                matches=match_count,
+                start=offsets[2 * first[0]],
+                end=offsets[2 * first[1] + 1]
+            ))
+
+        hits.sort(key=lambda hit: (-hit.score, hit.doc_id))
+        return hits if max_results is None else hits[:max_results]
+
+    def snippet(self, hit: SearchHit, context_bytes: int = 100) -> str:
+        """
+        Vráti úryvok okolo zhody - číta len potrebné bajty zo súboru
+
+        Args:
+            hit: Výsledok vyhľadávania
+            context_bytes: Počet bajtov kontextu pred a za zhodou
+
+        Returns:
+            Úryvok textu
+        """
+        document = self._documents.get(hit.doc_id)
+        if not document:
+            return ""
+
+        start = max(0, hit.start - context_bytes)
+        end = min(document["size"], hit.end + context_bytes)
+
+        try:
+            with open(self.docs_dir / document["file"], 'rb') as f:
+                f.seek(start)
+                raw = f.read(end - start)
+        except OSError as e:
+            logger.error(f"Chyba pri čítaní úryvku {hit.doc_id}: {e}")
+            return ""
+
+        # Orezanie na hranicu znakov UTF-8
+        text = raw.decode('utf-8', errors='ignore').strip()
+        if start > 0:
+            text = "..." + text
+        if end < document["size"]:
+            text = text + "..."
+        return text
+
+    def stats(self) -> Dict[str, int]:
+        """Štatistiky indexu"""
+        return {
+            "documents": len(self._documents),
+            "terms": len(self._postings),
+            "tokens": self._total_length
+        }
@@ -0,0 +1,257 @@
+"""
+Jednopriechodový renderer markdown dokumentácie do HTML a JSON
+"""
+
+import re
+import html
+from typing import Any, Dict, List, Optional, Tuple
+
+# Blokové prvky - rozpoznávajú sa po riadkoch
+FENCE_RE = re.compile(r'^\s*```\s*([\w+-]*)\s*$')
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+UNORDERED_ITEM_RE = re.compile(r'^\s*[-*+]\s+(.*)$')
+ORDERED_ITEM_RE = re.compile(r'^\s*\d+[.)]\s+(.*)$')
+TABLE_ROW_RE = re.compile(r'^\s*\|(.*)\|\s*$')
+TABLE_SEPARATOR_RE = re.compile(r'^\s*\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$')
+
+# Inline prvky - jedna alternácia, jeden prechod cez riadok
+INLINE_RE = re.compile(
+    r'`(?P<code>[^`]+)`'
+    r'|\*\*(?P<strong>.+?)\*\*'
+    r'|\*(?P<em>[^*\s](?:[^*]*[^*\s])?)\*'
+    r'|\[(?P<link_text>[^\]]+)\]\((?P<link_href>[^)\s]+)\)'
+)
+
+SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+SLUG_SPACE_RE = re.compile(r'[\s_]+')
+
+
+def slugify(text: str) -> str:
+    """Vytvorí ID kotvy z nadpisu"""
+    slug = SLUG_STRIP_RE.sub('', text.lower()).strip()
+    return SLUG_SPACE_RE.sub('-', slug)
+
+
+def render_inline(text: str) -> str:
+    """Vyrenderuje inline markdown (kód, tučné, kurzíva, odkazy) s escapovaním"""
+    parts = []
+    position = 0
+
+    for match in INLINE_RE.finditer(text):
+        parts.append(html.escape(text[position:match.start()], quote=False))
+        kind = match.lastgroup
+
+        if kind == 'code':
+            parts.append(f'<code>{html.escape(match.group("code"), quote=False)}</code>')
+        elif kind == 'strong':
+            parts.append(f'<strong>{render_inline(match.group("strong"))}</strong>')
+        elif kind == 'em':
+            parts.append(f'<em>{render_inline(match.group("em"))}</em>')
+        else:
+            href = html.escape(match.group("link_href"))
+            parts.append(f'<a href="{href}">{render_inline(match.group("link_text"))}</a>')
+
+        position = match.end()
+
+    parts.append(html.escape(text[position:], quote=False))
+    return ''.join(parts)
+
+
+def heading_spans(data: bytes) -> List[Tuple[int, str, int, int]]:
+    """
+    Nájde nadpisy v markdown dokumente a bajtové rozsahy ich sekcií
+
+    Sekcia nadpisu končí pred ďalším nadpisom rovnakej alebo vyššej úrovne.
+    Riadky s # vnútri blokov kódu sa nepovažujú za nadpisy.
+
+    Args:
+        data: Obsah súboru v bajtoch (offsety zodpovedajú súboru na disku)
+
+    Returns:
+        Zoznam (úroveň, nadpis, začiatok, koniec)
+    """
+    headings: List[List[Any]] = []
+    open_headings: List[List[Any]] = []
+    in_code = False
+    offset = 0
+
+    for raw_line in data.split(b'\n'):
+        line_start = offset
+        offset += len(raw_line) + 1
+        stripped = raw_line.lstrip()
+
+        if stripped.startswith(b'```'):
+            if FENCE_RE.match(raw_line.decode('utf-8', errors='replace').rstrip('\r')):
+                in_code = not in_code
+            continue
+        if in_code or not stripped.startswith(b'#'):
+            continue
+
+        heading = HEADING_RE.match(raw_line.decode('utf-8', errors='replace').rstrip('\r'))
+        if not heading:
+            continue
+
+        level = len(heading.group(1))
+        while open_headings and open_headings[-1][0] >= level:
+            open_headings.pop()[3] = line_start
+
+        entry = [level, heading.group(2), line_start, len(data)]
+        headings.append(entry)
+        open_headings.append(entry)
+
+    return [tuple(entry) for entry in headings]
+
+
+def _split_table_row(line: str) -> List[str]:
+    """Rozdelí riadok tabuľky na bunky"""
+    return [cell.strip() for cell in TABLE_ROW_RE.match(line).group(1).split('|')]
+
+
+class MarkdownRenderer:
+    """
+    Prevedie markdown na HTML a JSON štruktúru v jednom prechode riadkami
+
+    Podporuje nadpisy, odstavce, zoznamy, tabuľky a bloky kódu. Nadpisy
+    vnútri blokov kódu (napr. Python komentáre) sa neinterpretujú.
+    """
+
+    def render(self, markdown_content: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Vyrenderuje markdown
+
+        Returns:
+            (HTML, JSON štruktúra s title/sections/content)
+        """
+        out: List[str] = []
+        structure: Dict[str, Any] = {"title": "", "sections": [], "content": markdown_content}
+        section: Optional[Dict[str, Any]] = None
+        subsection: Optional[Dict[str, Any]] = None
+
+        paragraph: List[str] = []
+        list_tag: Optional[str] = None
+        code_lines: Optional[List[str]] = None
+        code_language = ''
+
+        lines = markdown_content.split('\n')
+        index = 0
+
+        def close_blocks():
+            nonlocal list_tag
+            if paragraph:
+                out.append(f'<p>{render_inline(" ".join(paragraph))}</p>')
+                paragraph.clear()
+            if list_tag:
+                out.append(f'</{list_tag}>')
+                list_tag = None
+
+        while index < len(lines):
+            line = lines[index]
+            index += 1
+
+            # JSON štruktúra - obsah patrí aktuálnej sekcii/podsekcii
+            stripped = line.strip()
+
+            if code_lines is not None:
+                if FENCE_RE.match(line):
+                    language = f' class="language-{code_language}"' if code_language else ''
+                    code = html.escape('\n'.join(code_lines), quote=False)
+                    out.append(f'<pre><code{language}>{code}</code></pre>')
+                    code_lines = None
+                else:
+                    code_lines.append(line)
+                self._append_content(section, subsection, stripped)
+                continue
+
+            fence = FENCE_RE.match(line)
+            if fence:
+                close_blocks()
+                code_lines = []
+                code_language = fence.group(1)
+                self._append_content(section, subsection, stripped)
+                continue
+
+            heading = HEADING_RE.match(line)
+            if heading:
+                close_blocks()
+                level = len(heading.group(1))
+                title = heading.group(2)
+                out.append(f'<h{level} id="{slugify(title)}">{render_inline(title)}</h{level}>')
+
+                if level == 1:
+                    structure["title"] = title
+                elif level == 2:
+                    section = {"title": title, "content": "", "subsections": []}
+                    subsection = None
+                    structure["sections"].append(section)
+                elif level == 3 and section is not None:
+                    subsection = {"title": title, "content": ""}
+                    section["subsections"].append(subsection)
+                else:
+                    self._append_content(section, subsection, stripped)
+                continue
+
+            self._append_content(section, subsection, stripped)
+
+            if not stripped:
+                close_blocks()
+                continue
+
+            # Tabuľka - hlavička nasledovaná oddeľovačom
+            if (TABLE_ROW_RE.match(line) and index < len(lines)
+                    and TABLE_SEPARATOR_RE.match(lines[index])):
+                close_blocks()
+                header = _split_table_row(line)
+                self._append_content(section, subsection, lines[index].strip())
+                index += 1
+
+                rows = []
+                while index < len(lines) and TABLE_ROW_RE.match(lines[index]):
+                    rows.append(_split_table_row(lines[index]))
+                    self._append_content(section, subsection, lines[index].strip())
+                    index += 1
+
+                head = ''.join(f'<th>{render_inline(cell)}</th>' for cell in header)
+                body = ''.join(
+                    '<tr>' + ''.join(f'<td>{render_inline(cell)}</td>' for cell in row) + '</tr>'
+                    for row in rows
+                )
+                out.append(f'<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>')
+                continue
+
+            item = UNORDERED_ITEM_RE.match(line)
+            ordered = None if item else ORDERED_ITEM_RE.match(line)
+            if item or ordered:
+                tag = 'ul' if item else 'ol'
+                if paragraph or list_tag != tag:
+                    close_blocks()
+                    out.append(f'<{tag}>')
+                    list_tag = tag
+                out.append(f'<li>{render_inline((item or ordered).group(1))}</li>')
+                continue
+
+            if list_tag:
+                close_blocks()
+            paragraph.append(stripped)
+
+        if code_lines is not None:
+            # Neuzavretý blok kódu
+            out.append(f'<pre><code>{html.escape(chr(10).join(code_lines), quote=False)}</code></pre>')
+        close_blocks()
+
+        return '\n'.join(out), structure
+
+    @staticmethod
+    def _append_content(
+        section: Optional[Dict[str, Any]],
+        subsection: Optional[Dict[str, Any]],
+        line: str
+    ):
+        """Pridá riadok do obsahu aktuálnej sekcie a podsekcie"""
+        if section is not None:
+            section["content"] += line + "\n"
+        if subsection is not None:
+            subsection["content"] += line + "\n"
+
+
+# Globálna inštancia renderera
+markdown_renderer = MarkdownRenderer()
@@ -0,0 +1,129 @@
+"""
+Verzie MCP resources podľa hashu obsahu a notifikácie o ich zmene
+"""
+
+import asyncio
+import hashlib
+import logging
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Dĺžka verzie v hex znakoch (prefix SHA-256)
+VERSION_LENGTH = 16
+
+
+def content_version(payload: str) -> str:
+    """Vypočíta verziu obsahu resource"""
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:VERSION_LENGTH]
+
+
+class ResourcePayload(NamedTuple):
+    """Zakódovaný obsah resource a jeho verzia - nemenný, zdieľaný všetkými čítaniami"""
+    version: str
+    text: str
+
+
+class ResourceVersionRegistry:
+    """
+    Pamätá si verzie a zakódovaný obsah naposledy vrátených resources
+
+    Zápisy komponentov a dokumentácie volajú changed(), čo zahodí
+    zapamätané verzie aj obsah dotknutých URI a upozorní poslucháčov.
+    Zápisy bežia aj vo vláknach cpu_pool/io_pool - poslucháči sa preto
+    vždy spúšťajú na slučke servera (attach_loop).
+    """
+
+    def __init__(self):
+        self._versions: Dict[str, str] = {}
+        self._payloads: Dict[str, ResourcePayload] = {}
+        self._listeners: List[Callable[[str], object]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def attach_loop(self, loop: Optional[asyncio.AbstractEventLoop]):
+        """Nastaví slučku servera, na ktorej bežia poslucháči zmien"""
+        self._loop = loop
+
+    def get(self, uri: str) -> Optional[str]:
+        """Zapamätaná verzia resource (None ak sa mohol zmeniť)"""
+        return self._versions.get(uri)
+
+    def remember(self, uri: str, payload: str) -> str:
+        """Vypočíta a zapamätá verziu vráteného obsahu"""
+        cached = self._payloads.get(uri)
+        if cached is not None and cached.text is payload:
+            # Obsah z cache má verziu už vypočítanú
+            self._versions[uri] = cached.version
+            return cached.version
+        version = content_version(payload)
+        self._versions[uri] = version
+        return version
+
+    def payload(self, uri: str) -> Optional[ResourcePayload]:
+        """Zakódovaný obsah resource z cache (None ak ešte nebol čítaný alebo sa zmenil)"""
+        return self._payloads.get(uri)
+
+    def store(self, uri: str, text: str) -> ResourcePayload:
+        """
+        Uloží zakódovaný obsah resource - ďalšie čítania ho vrátia bez kódovania
+
+        Ukladá sa len úspešný obsah; chybové odpovede sa necachujú.
+        """
+        payload = ResourcePayload(content_version(text), text)
+        self._payloads[uri] = payload
+        self._versions[uri] = payload.version
+        return payload
+
+    def changed(self, uri: str):
+        """
+        Označí resource (a všetky URI pod ním) ako zmenený
+
+        Args:
+            uri: URI resource, napr. flowbite://docs/api zahŕňa aj
+                flowbite://docs/api/generate_component
+        """
+        for known in (self._versions, self._payloads):
+            for known_uri in [u for u in known if u == uri or u.startswith(uri + "/")]:
+                del known[known_uri]
+
+        if not self._listeners:
+            return
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        loop = self._loop if self._loop is not None and not self._loop.is_closed() else running
+        if loop is None:
+            logger.debug(f"Zmena {uri} bez slučky servera - poslucháči sa nenotifikujú")
+            return
+
+        if loop is running:
+            self._notify(uri)
+        else:
+            # Zápis z vlákna poolu (ktoré môže mať vlastnú slučku)
+            loop.call_soon_threadsafe(self._notify, uri)
+
+    def _notify(self, uri: str):
+        """Zavolá poslucháčov na slučke servera, async poslucháči bežia ako tasky"""
+        for listener in list(self._listeners):
+            try:
+                result = listener(uri)
+                if asyncio.iscoroutine(result):
+                    asyncio.get_running_loop().create_task(result)
+            except Exception as e:
+                logger.error(f"Chyba pri notifikácii zmeny resource {uri}: {e}")
+
+    def add_listener(self, listener: Callable[[str], object]):
+        """Zaregistruje poslucháča zmien (sync alebo async funkcia s URI)"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str], object]):
+        """Odregistruje poslucháča zmien"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+
+# Globálna inštancia registra verzií
+resource_versions = ResourceVersionRegistry()
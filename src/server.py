@@ -2,47 +2,42 @@
 Flowbite MCP Server - hlavný server súbor
 """
 
-import asyncio
-import json
-import logging
-from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-from fastmcp import FastMCP
-from pydantic import BaseModel
+import time
 
-from .config import get_config
-from .models.component import ComponentType, ComponentVariant, ComponentSize
-from .tools.generator import FlowbiteGenerator
-from .tools.validator import FlowbiteValidator  
-from .tools.suggestions import FlowbiteSuggestionEngine
-from .resources.component_db import ComponentDatabase
-from .resources.documentation import DocumentationManager
+# Začiatok importu - meria sa studený štart servera
+_IMPORT_STARTED = time.perf_counter()
 
 import asyncio
+import copy
 import json
 import logging
-from typing import Dict, List, Optional, Any
+import re
+import weakref
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 try:
-    from fastmcp import FastMCP
-    from fastmcp.resources import Resource
-    from fastmcp.tools import Tool
+    from fastmcp import FastMCP, Context
 except ImportError:
     print("FastMCP nie je nainštalovaný. Nainštalujte ho pomocou: pip install fastmcp")
     exit(1)
 
 from .config import get_config, validate_environment
-from .models.component import (
-    FlowbiteComponent,
-    ComponentGenerationRequest,
-    ComponentValidationResult,
-    ComponentSuggestion,
-    ComponentType,
-    ComponentVariant,
-    ComponentSize
-)
+from .middleware.coalescing import SingleFlightMiddleware, tool_flights
+from .middleware.deadlines import DeadlineMiddleware
+from .middleware.identity import client_identity, session_identity, use_stateless_sessions
+from .middleware.metrics import MetricsMiddleware
+from .middleware.rate_limiting import RateLimitMiddleware, tool_limiter
+from .middleware.scheduling import SchedulerMiddleware, tool_scheduler
+from .resources.versions import resource_versions
+from .utils.cancellation import current_token
+from .utils.executors import cpu_pool, pool_stats
+from .utils.metrics import PROMETHEUS_CONTENT_TYPE, metrics
+from .utils.registry import subsystems
+from .utils.response_mode import COMPACT, ResponseModes, compact_validation, dumps
+
+if TYPE_CHECKING:
+    from .models.component import FlowbiteComponent
 
 
 # Konfigurácia loggingu
@@ -52,27 +47,40 @@ logger = logging.getLogger(__name__)
 # Konfigurácia
 config = get_config()
 
-# Inicializácia modulov
-generator = FlowbiteGenerator()
-validator = FlowbiteValidator()
-suggestion_engine = FlowbiteSuggestionEngine()
-component_db = ComponentDatabase()
-documentation_manager = DocumentationManager()
+# Režim odpovedí (full/compact) - predvolený zo servera, prípadne nastavený pre session
+response_modes = ResponseModes(config.response_mode)
+
+# Moduly (generátor, validátor, databáza, dokumentácia) sa vytvoria pri prvom
+# použití cez register subsystémov - import servera nič nenačítava ani negeneruje
 
 # Inicializácia FastMCP servera
 app = FastMCP(
     name=config.name,
     version=config.version,
-    description=config.description
+    instructions=config.description
 )
 
+# Metriky volaní - vonkajší middleware, latencia zahŕňa aj čakanie v ďalších
+app.add_middleware(MetricsMiddleware(metrics))
+# Token-bucket limit volaní nástrojov na klienta
+app.add_middleware(RateLimitMiddleware(tool_limiter))
+# Súbežné rovnaké volania zdieľajú jeden výpočet (limit sa počíta každému)
+app.add_middleware(SingleFlightMiddleware(tool_flights, response_modes=response_modes))
+# Prioritné triedy (interaktívne pred hromadnými) a férové poradie klientov -
+# miesto zaberá len výpočet, nie volania čakajúce na zdieľaný výsledok
+app.add_middleware(SchedulerMiddleware(tool_scheduler))
+# Časový limit a zrušenie - vo vnútri single-flight, zrušenie jedného
+# z čakajúcich volaní tak nezastaví zdieľaný výpočet; limit plynie až
+# od pridelenia miesta plánovačom
+app.add_middleware(DeadlineMiddleware())
+
 
 class FlowbiteServer:
     """Hlavná trieda MCP servera"""
     
     def __init__(self):
         self.config = config
-        self.components_cache: Dict[str, List[FlowbiteComponent]] = {}
+        self.components_cache: Dict[str, List["FlowbiteComponent"]] = {}
         self.templates_cache: Dict[str, str] = {}
         
     async def initialize(self):
@@ -101,11 +109,13 @@ class FlowbiteServer:
         for component_type in self.config.supported_components:
             await self._load_components_by_type(component_type)
     
-    async def _load_components_by_type(self, component_type: str) -> List[FlowbiteComponent]:
+    async def _load_components_by_type(self, component_type: str) -> List["FlowbiteComponent"]:
         """Načíta komponenty daného typu"""
         if component_type in self.components_cache:
             return self.components_cache[component_type]
         
+        from .models.component import FlowbiteComponent
+        
         component_path = self.config.get_component_path(component_type)
         components = []
         
@@ -125,6 +135,52 @@ class FlowbiteServer:
 # Globálna inštancia servera
 server = FlowbiteServer()
 
+# Úspešnosť cache zakódovaných resources
+resource_cache_metrics = metrics.cache("resource_payload")
+
+
+def _created_stats(name: str) -> Dict[str, Any]:
+    """Štatistiky subsystému, len ak už existuje - metriky ho nevytvárajú"""
+    return subsystems.get(name).stats() if subsystems.is_created(name) else {}
+
+
+# Štatistiky subsystémov v server_stats a Prometheus expozícii
+metrics.register_collector("rate_limit", lambda: {
+    key: value for key, value in tool_limiter.stats().items() if key != "rejected_by_client"
+})
+metrics.register_collector("single_flight", tool_flights.stats)
+metrics.register_collector("scheduler", tool_scheduler.stats)
+metrics.register_collector("pools", pool_stats)
+metrics.register_collector("subsystems", subsystems.report)
+metrics.register_collector("job_queue", lambda: _created_stats("job_queue"))
+metrics.register_collector("artifacts", lambda: _created_stats("artifact_store"))
+
+
+async def _resolve_artifact(
+    ctx: Optional[Context],
+    html: Optional[str],
+    artifact: Optional[str],
+    patch: Optional[List[Dict[str, Any]]]
+):
+    """Vstup nástroja (HTML, handle, patch) ako artefakt session s rozparsovaným stromom"""
+    return await cpu_pool.run(
+        subsystems.get("artifact_store").resolve, session_identity(ctx), html, artifact, patch
+    )
+
+
+def _response_mode(ctx: Optional[Context], response_mode: Optional[str]) -> str:
+    """Režim odpovede volania - explicitný argument, inak režim session, inak predvolený"""
+    return response_modes.get(session_identity(ctx), response_mode)
+
+
+def _component_props(variant: str, size: str, props: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Varianta a veľkosť sú vlastnosti, podľa ktorých generátor skladá CSS triedy"""
+    props = dict(props or {})
+    if variant != "default":
+        props.setdefault("variant", variant)
+    props.setdefault("size", size)
+    return props
+
 
 # MCP Tools
 @app.tool()
@@ -132,7 +188,10 @@ async def generate_component(
     component_type: str,
     variant: str = "default",
     size: str = "md",
-    props: Dict[str, Any] = None
+    props: Dict[str, Any] = None,
+    template_variant: str = "basic",
+    response_mode: str = None,
+    ctx: Context = None
 ) -> Dict[str, Any]:
     """
     Generuje Flowbite komponent
@@ -142,25 +201,37 @@ async def generate_component(
         variant: Varianta komponentu
         size: Veľkosť komponentu  
         props: Dodatočné vlastnosti komponentu
+        template_variant: Variant HTML šablóny (basic, with_icon...)
+        response_mode: "compact" (len HTML a handle) alebo "full"
         
     Returns:
-        Vygenerovaný HTML kód s metadátami
+        Vygenerovaný HTML kód a handle artefaktu pre ďalšie nástroje
     """
     try:
         logger.info(f"Generujem komponent: {component_type}, variant: {variant}")
         
-        if props is None:
-            props = {}
+        mode = _response_mode(ctx, response_mode)
+        props = _component_props(variant, size, props)
             
-        # Použitie generátora
-        result = await generator.generate_component(
+        # Generátor beží v CPU poole - slučka medzitým obsluhuje lacné volania
+        html = await cpu_pool.run_coroutine(
+            subsystems.get("generator").generate_component,
             component_type=component_type,
-            variant=variant,
-            size=size,
-            props=props
+            props=props,
+            template_variant=template_variant
         )
         
-        return result
+        handle = subsystems.get("artifact_store").put(session_identity(ctx), html)
+        if mode == COMPACT:
+            return {"html": html, "artifact": handle}
+        
+        return {
+            "html": html,
+            "artifact": handle,
+            "component_type": component_type,
+            "variant": variant,
+            "size": size
+        }
         
     except Exception as e:
         logger.error(f"Chyba pri generovaní komponentu: {e}")
@@ -176,7 +247,9 @@ async def suggest_components(
     context: str,
     page_type: str = "general",
     framework: str = "html",
-    max_suggestions: int = 5
+    max_suggestions: int = 5,
+    response_mode: str = None,
+    ctx: Context = None
 ) -> Dict[str, Any]:
     """
     Navrhuje vhodné komponenty na základe kontextu
@@ -186,6 +259,7 @@ async def suggest_components(
         page_type: Typ stránky (landing, dashboard, ecommerce, etc.)
         framework: Cieľový framework (html, react, vue, etc.)
         max_suggestions: Maximum počet návrhov
+        response_mode: "compact" (typ, istota a vlastnosti bez popisov) alebo "full"
         
     Returns:
         Zoznam navrhnutých komponentov
@@ -193,28 +267,55 @@ async def suggest_components(
     try:
         logger.info(f"Generujem návrhy pre kontext: {context}")
         
-        # Použitie suggestion engine
-        suggestions = await suggestion_engine.suggest_components(
+        mode = _response_mode(ctx, response_mode)
+        
+        # Počet komponentov v jednej odpovedi obmedzuje konfigurácia
+        max_suggestions = min(max_suggestions, config.max_components_per_request)
+        
+        # Použitie suggestion engine (v CPU poole)
+        token = current_token()
+        suggestions = await cpu_pool.run_coroutine(
+            subsystems.get("suggestion_engine").suggest_components,
             context=context,
             page_type=page_type,
             framework=framework,
-            max_suggestions=max_suggestions
+            max_suggestions=max_suggestions,
+            token=token
         )
         
-        return {
-            "suggestions": [
-                {
-                    "component_type": s.component_type,
-                    "name": s.name,
-                    "description": s.description,
-                    "confidence": s.confidence,
-                    "props": s.props.dict() if s.props else {},
-                    "reason": s.reason,
-                    "use_case": s.use_case
-                }
-                for s in suggestions
-            ]
-        }
+        if mode == COMPACT:
+            response = {
+                "suggestions": [
+                    {
+                        "component_type": s.component_type,
+                        "confidence": round(s.confidence, 2),
+                        **({"props": s.props.dict(exclude_defaults=True)} if s.props else {})
+                    }
+                    for s in suggestions
+                ]
+            }
+        else:
+            response = {
+                "suggestions": [
+                    {
+                        "component_type": s.component_type,
+                        "name": s.name,
+                        "description": s.description,
+                        "confidence": s.confidence,
+                        "props": s.props.dict() if s.props else {},
+                        "reason": s.reason,
+                        "use_case": s.use_case
+                    }
+                    for s in suggestions
+                ]
+            }
+        
+        # Po vypršaní časového limitu sú návrhy neúplné
+        if token.truncated:
+            response["truncated"] = True
+            response["skipped"] = list(token.skipped)
+        
+        return response
         
     except Exception as e:
         logger.error(f"Chyba pri generovaní návrhov: {e}")
@@ -226,32 +327,49 @@ async def suggest_components(
 
 @app.tool()
 async def validate_component(
-    html: str,
+    html: str = None,
     component_type: str = None,
-    strict: bool = False
+    strict: bool = False,
+    artifact: str = None,
+    patch: List[Dict[str, Any]] = None,
+    response_mode: str = None,
+    ctx: Context = None
 ) -> Dict[str, Any]:
     """
     Validuje Flowbite komponent
     
     Args:
-        html: HTML kód na validáciu
-        component_type: Očakávaný typ komponentu (voliteľné)
+        html: HTML kód na validáciu (alebo artifact)
+        component_type: Očakávaný typ komponentu (voliteľné, inak sa určí
+            automaticky podľa CSS tried)
         strict: Prísna validácia
+        artifact: Handle artefaktu z generate_component/fix_component
+        patch: Úpravy artefaktu pred validáciou - [{"find", "replace"}]
+            alebo [{"select", "set_attrs"/"add_class"/"remove_class"/"text"...}]
+        response_mode: "compact" (platnosť, skóre a kódy nálezov) alebo "full"
         
     Returns:
-        Výsledok validácie s hodnotením a návrhmi
+        Výsledok validácie s hodnotením, návrhmi a handle artefaktu
     """
     try:
         logger.info(f"Validujem komponent typu: {component_type}")
         
-        # Použitie validátora
-        result = await validator.validate_component(
-            html=html,
+        mode = _response_mode(ctx, response_mode)
+        resolved = await _resolve_artifact(ctx, html, artifact, patch)
+        
+        # Použitie validátora (v CPU poole) nad stromom z cache artefaktov
+        result = await cpu_pool.run_coroutine(
+            subsystems.get("validator").validate_component,
+            html_code=resolved.html,
             component_type=component_type,
-            strict=strict
+            strict=strict,
+            soup=resolved.tree
         )
         
-        return result
+        if mode == COMPACT:
+            return {**compact_validation(result.dict()), "artifact": resolved.handle}
+        
+        return {**result.dict(), "artifact": resolved.handle}
         
     except Exception as e:
         logger.error(f"Chyba pri validácii komponentu: {e}")
@@ -262,6 +380,194 @@ async def validate_component(
         }
 
 
+@app.tool()
+async def fix_component(
+    html: str = None,
+    artifact: str = None,
+    patch: List[Dict[str, Any]] = None,
+    component_type: str = None,
+    response_mode: str = None,
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    Automaticky opraví bežné chyby komponentu (type tlačidiel, alt, ID vstupov...)
+    
+    Args:
+        html: HTML kód na opravu (alebo artifact)
+        artifact: Handle artefaktu z generate_component/fix_component
+        patch: Úpravy artefaktu pred opravou (rovnaký formát ako vo validate_component)
+        component_type: Typ komponentu
+        response_mode: "compact" (len HTML a handle) alebo "full"
+        
+    Returns:
+        Opravený HTML kód a handle nového artefaktu
+    """
+    try:
+        logger.info(f"Opravujem komponent typu: {component_type}")
+        
+        mode = _response_mode(ctx, response_mode)
+        resolved = await _resolve_artifact(ctx, html, artifact, patch)
+        session_key = session_identity(ctx)
+        store = subsystems.get("artifact_store")
+        validator = subsystems.get("validator")
+        
+        def fix():
+            # Oprava kópie stromu z cache - opravený strom sa uloží k novému handle
+            tree = validator.fix_tree(copy.copy(resolved.tree))
+            fixed = str(tree)
+            return fixed, store.put(session_key, fixed, tree)
+        
+        fixed, handle = await cpu_pool.run(fix)
+        if mode == COMPACT:
+            return {"html": fixed, "artifact": handle}
+        
+        return {
+            "html": fixed,
+            "artifact": handle,
+            "source_artifact": resolved.handle,
+            "changed": fixed != resolved.html
+        }
+        
+    except Exception as e:
+        logger.error(f"Chyba pri oprave komponentu: {e}")
+        return {"error": str(e), "artifact": artifact}
+
+
+@app.tool()
+async def analyze_layout(
+    html: str = None,
+    artifact: str = None,
+    patch: List[Dict[str, Any]] = None,
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    Analyzuje štruktúru layoutu a navrhne chýbajúce komponenty a vylepšenia
+    
+    Args:
+        html: HTML kód stránky alebo komponentu (alebo artifact)
+        artifact: Handle artefaktu z generate_component/fix_component
+        patch: Úpravy artefaktu pred analýzou
+        
+    Returns:
+        Analýza layoutu s handle artefaktu
+    """
+    try:
+        logger.info("Analyzujem layout")
+        
+        resolved = await _resolve_artifact(ctx, html, artifact, patch)
+        analysis = await cpu_pool.run_coroutine(
+            subsystems.get("suggestion_engine").analyze_layout,
+            resolved.html,
+            token=current_token(),
+            soup=resolved.tree
+        )
+        
+        return {**analysis, "artifact": resolved.handle}
+        
+    except Exception as e:
+        logger.error(f"Chyba pri analýze layoutu: {e}")
+        return {"error": str(e), "artifact": artifact}
+
+
+@app.tool()
+async def build_component(
+    component_type: str,
+    variant: str = "default",
+    size: str = "md",
+    props: Dict[str, Any] = None,
+    template_variant: str = "basic",
+    min_score: float = 90.0,
+    max_fix_iterations: int = 2,
+    strict: bool = False,
+    response_mode: str = None,
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    Vygeneruje, zvaliduje a opraví komponent v jednom volaní
+    
+    Nahrádza reťaz generate_component -> validate_component -> fix_component
+    -> validate_component; kroky bežia nad jedným rozparsovaným stromom.
+    
+    Args:
+        component_type: Typ komponentu (button, form, card, etc.)
+        variant: Varianta komponentu
+        size: Veľkosť komponentu
+        props: Dodatočné vlastnosti komponentu
+        template_variant: Variant HTML šablóny
+        min_score: Skóre validácie, pri ktorom sa opravy zastavia
+        max_fix_iterations: Najviac opravných kôl (0 = len validácia)
+        strict: Prísna validácia
+        response_mode: "compact" (HTML, handle, skóre a kódy nálezov) alebo "full"
+        
+    Returns:
+        Výsledné HTML s handle artefaktu, poslednou validáciou,
+        dôvodom ukončenia a časmi jednotlivých krokov
+    """
+    try:
+        logger.info(f"Zostavujem komponent: {component_type}, variant: {variant}")
+        
+        mode = _response_mode(ctx, response_mode)
+        built = await cpu_pool.run_coroutine(
+            subsystems.get("component_pipeline").build_component,
+            component_type=component_type,
+            props=_component_props(variant, size, props),
+            template_variant=template_variant,
+            min_score=min_score,
+            max_fix_iterations=max_fix_iterations,
+            strict=strict,
+            session_id=session_identity(ctx),
+            token=current_token()
+        )
+        if mode == COMPACT and "error" not in built:
+            return {
+                "html": built["html"],
+                "artifact": built.get("artifact"),
+                **compact_validation(built["validation"])
+            }
+        
+        return built
+        
+    except Exception as e:
+        logger.error(f"Chyba pri zostavovaní komponentu: {e}")
+        return {"error": str(e), "component_type": component_type}
+
+
+@app.tool()
+async def set_response_mode(mode: str = None, ctx: Context = None) -> Dict[str, Any]:
+    """
+    Nastaví režim odpovedí nástrojov pre túto session
+    
+    Kompaktný režim vracia len HTML, skóre a kódy nálezov bez viet a
+    popisov - menej tokenov pre LLM klientov. Argument response_mode
+    jednotlivého volania má prednosť.
+    
+    Args:
+        mode: "compact", "full", alebo nič pre návrat k predvolenému režimu servera
+        
+    Returns:
+        Režim session a predvolený režim servera; bez MCP session chybu
+    """
+    try:
+        logger.info(f"Nastavujem režim odpovedí: {mode}")
+        
+        session = session_identity(ctx)
+        if session is None:
+            # Bez MCP session by režim zdieľali všetci bezstavoví klienti procesu
+            raise ValueError(
+                "Režim session vyžaduje MCP session (bezstavové HTTP alebo pre-fork) - "
+                "použite argument response_mode jednotlivých nástrojov"
+            )
+        
+        return {
+            "response_mode": response_modes.set(session, mode),
+            "default": response_modes.default
+        }
+        
+    except Exception as e:
+        logger.error(f"Chyba pri nastavení režimu odpovedí: {e}")
+        return {"error": str(e), "default": response_modes.default}
+
+
 # MCP Resources
 @app.resource("flowbite://components/{component_type}")
 async def get_component_resource(component_type: str) -> str:
@@ -277,8 +583,16 @@ async def get_component_resource(component_type: str) -> str:
     try:
         logger.info(f"Získavam resource pre komponent: {component_type}")
         
+        # Zakódovaný obsah platí, kým ho zápis do databázy nezneplatní
+        uri = f"flowbite://components/{component_type}"
+        cached = resource_versions.payload(uri)
+        if cached is not None:
+            resource_cache_metrics.hit()
+            return cached.text
+        resource_cache_metrics.miss()
+        
         # Použitie component database
-        component_data = await component_db.get_component(component_type)
+        component_data = await subsystems.get("component_db").get_component(component_type)
         
         if not component_data:
             return json.dumps({
@@ -286,7 +600,8 @@ async def get_component_resource(component_type: str) -> str:
                 "available_components": list(config.supported_components)
             }, ensure_ascii=False)
         
-        return json.dumps(component_data, ensure_ascii=False, indent=2)
+        # Odsadenie podľa predvoleného režimu - verzia obsahu ostáva pre všetkých rovnaká
+        return resource_versions.store(uri, dumps(component_data, response_modes.default)).text
         
     except Exception as e:
         logger.error(f"Chyba pri získavaní resource: {e}")
@@ -308,15 +623,22 @@ async def get_component_variant_resource(component_type: str, variant: str) -> s
     try:
         logger.info(f"Získavam resource pre: {component_type}/{variant}")
         
+        uri = f"flowbite://components/{component_type}/{variant}"
+        cached = resource_versions.payload(uri)
+        if cached is not None:
+            resource_cache_metrics.hit()
+            return cached.text
+        resource_cache_metrics.miss()
+        
         # Použitie component database
-        variant_data = await component_db.get_component(component_type, variant)
+        variant_data = await subsystems.get("component_db").get_component(component_type, variant)
         
         if not variant_data:
             return json.dumps({
                 "error": f"Varianta '{variant}' komponentu '{component_type}' nebola nájdená"
             }, ensure_ascii=False)
         
-        return json.dumps(variant_data, ensure_ascii=False, indent=2)
+        return resource_versions.store(uri, dumps(variant_data, response_modes.default)).text
         
     except Exception as e:
         logger.error(f"Chyba pri získavaní variant resource: {e}")
@@ -338,10 +660,10 @@ async def get_documentation_resource(section: str) -> str:
         logger.info(f"Získavam dokumentáciu: {section}")
         
         # Použitie documentation manager
-        content = await documentation_manager.get_documentation(section)
+        content = await subsystems.get("documentation_manager").get_documentation(section)
         
         if not content:
-            available_sections = await documentation_manager.list_sections()
+            available_sections = await subsystems.get("documentation_manager").list_sections()
             return f"""# Sekcia '{section}' nebola nájdená
 
 ## Dostupné sekcie:
@@ -356,18 +678,389 @@ async def get_documentation_resource(section: str) -> str:
         return f"# Chyba\n\n{str(e)}"
 
 
-# Inicializácia FastMCP aplikácie
-app = FastMCP(config.name, version=config.version)
+@app.resource("flowbite://docs/{section}/{heading}")
+async def get_documentation_section_resource(section: str, heading: str) -> str:
+    """
+    Poskytuje len časť dokumentácie pod jedným nadpisom
+    
+    Args:
+        section: Názov sekcie dokumentácie
+        heading: Nadpis v sekcii (napr. generate_component)
+        
+    Returns:
+        Markdown obsah podsekcie
+    """
+    try:
+        logger.info(f"Získavam časť dokumentácie: {section}/{heading}")
+        
+        result = await subsystems.get("documentation_manager").get_documentation_section(section, heading)
+        
+        if result is None:
+            return f"# Sekcia '{section}' nebola nájdená"
+        
+        if "error" in result:
+            return f"""# {result['error']}
 
+## Dostupné nadpisy v sekcii {section}:
 
-async def main():
+{chr(10).join(f"- {title}" for title in result['headings'])}
+"""
+        
+        return result["content"]
+        
+    except Exception as e:
+        logger.error(f"Chyba pri získavaní časti dokumentácie: {e}")
+        return f"# Chyba\n\n{str(e)}"
+
+
+@app.tool()
+async def get_documentation_section(
+    section: str,
+    heading: str
+) -> Dict[str, Any]:
+    """
+    Vráti len časť dokumentácie pod zadaným nadpisom
+    
+    Args:
+        section: Názov sekcie (napr. api)
+        heading: Nadpis v sekcii (napr. generate_component)
+        
+    Returns:
+        Obsah podsekcie s bajtovým rozsahom v súbore
+    """
+    try:
+        logger.info(f"Získavam časť dokumentácie: {section}/{heading}")
+        
+        result = await subsystems.get("documentation_manager").get_documentation_section(section, heading)
+        
+        if result is None:
+            return {
+                "error": f"Sekcia '{section}' nebola nájdená",
+                "available_sections": [s["id"] for s in await subsystems.get("documentation_manager").list_sections()]
+            }
+        
+        return result
+        
+    except Exception as e:
+        logger.error(f"Chyba pri získavaní časti dokumentácie: {e}")
+        return {"error": str(e)}
+
+
+@app.tool()
+async def retrieve_docs(
+    query: str,
+    budget_tokens: int = 1000
+) -> Dict[str, Any]:
+    """
+    Vyhľadá najrelevantnejšie úseky dokumentácie v rámci rozpočtu tokenov
+    
+    Args:
+        query: Otázka alebo kľúčové slová
+        budget_tokens: Maximálny počet tokenov vrátených úsekov
+        
+    Returns:
+        Úseky dokumentácie so stabilnými ID zoradené podľa relevancie
+    """
+    try:
+        logger.info(f"Vyberám úseky dokumentácie pre: {query}")
+        
+        return await cpu_pool.run_coroutine(
+            subsystems.get("documentation_manager").retrieve_docs, query, budget_tokens
+        )
+        
+    except Exception as e:
+        logger.error(f"Chyba pri výbere úsekov dokumentácie: {e}")
+        return {"chunks": [], "error": str(e)}
+
+
+@app.tool()
+async def submit_job(
+    kind: str,
+    params: Dict[str, Any] = None,
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    Zadá dlhú úlohu na pozadí - výsledok sa vyzdvihne cez job_result
+    
+    Druhy úloh:
+        validate_batch: {"items": [HTML alebo {"html", "component_type"}], "strict": false}
+        render_catalog: {"component_types": [...], "props": {...}} - všetky varianty šablón
+        reindex_docs: {"sections": [...]} - bez sekcií celá dokumentácia
+    
+    Args:
+        kind: Druh úlohy
+        params: Parametre úlohy
+        
+    Returns:
+        Stav úlohy s job_id
+    """
+    try:
+        logger.info(f"Zadávam úlohu: {kind}")
+        
+        return await subsystems.get("job_queue").submit(kind, params, client_identity(ctx))
+        
+    except Exception as e:
+        logger.error(f"Chyba pri zadávaní úlohy: {e}")
+        return {"error": str(e), "kind": kind}
+
+
+@app.tool()
+async def job_status(job_id: str) -> Dict[str, Any]:
+    """
+    Stav a priebeh úlohy
+    
+    Args:
+        job_id: ID úlohy zo submit_job
+        
+    Returns:
+        Stav (queued, running, succeeded, failed, cancelled) a počet spracovaných položiek
+    """
+    try:
+        return await subsystems.get("job_queue").status(job_id)
+        
+    except Exception as e:
+        logger.error(f"Chyba pri zisťovaní stavu úlohy: {e}")
+        return {"error": str(e), "job_id": job_id}
+
+
+@app.tool()
+async def job_result(
+    job_id: str,
+    page: int = 1,
+    page_size: int = 50
+) -> Dict[str, Any]:
+    """
+    Stránka výsledkov úlohy (dostupné aj počas behu)
+    
+    Args:
+        job_id: ID úlohy zo submit_job
+        page: Číslo stránky od 1
+        page_size: Počet výsledkov na stránku (najviac 200)
+        
+    Returns:
+        Výsledky stránky, počet stránok a či je úloha dokončená
+    """
+    try:
+        return await subsystems.get("job_queue").result(job_id, page, page_size)
+        
+    except Exception as e:
+        logger.error(f"Chyba pri čítaní výsledkov úlohy: {e}")
+        return {"error": str(e), "job_id": job_id}
+
+
+@app.tool()
+async def cancel_job(job_id: str) -> Dict[str, Any]:
+    """
+    Zruší úlohu - čakajúcu hneď, bežiacu po aktuálnej položke
+    
+    Args:
+        job_id: ID úlohy zo submit_job
+        
+    Returns:
+        Stav úlohy po zrušení
+    """
+    try:
+        logger.info(f"Ruším úlohu: {job_id}")
+        
+        return await subsystems.get("job_queue").cancel(job_id)
+        
+    except Exception as e:
+        logger.error(f"Chyba pri rušení úlohy: {e}")
+        return {"error": str(e), "job_id": job_id}
+
+
+# URI resources -> handler (poradie: špecifickejšie vzory skôr)
+RESOURCE_ROUTES = [
+    (re.compile(r"^flowbite://components/([^/]+)/([^/]+)$"), get_component_variant_resource),
+    (re.compile(r"^flowbite://components/([^/]+)$"), get_component_resource),
+    (re.compile(r"^flowbite://docs/([^/]+)/(.+)$"), get_documentation_section_resource),
+    (re.compile(r"^flowbite://docs/([^/]+)$"), get_documentation_resource)
+]
+
+# Sessions, ktoré resource čítali cez fetch_resource - dostanú notifikáciu o zmene
+_resource_watchers: Dict[str, "weakref.WeakSet"] = {}
+
+
+async def _read_resource(uri: str) -> Optional[str]:
+    """Prečíta resource podľa URI cez jeho handler"""
+    for pattern, handler in RESOURCE_ROUTES:
+        match = pattern.match(uri)
+        if match:
+            return await handler(*match.groups())
+    return None
+
+
+def _watch_resource(uri: str, ctx: Optional[Context]):
+    """Zaregistruje session klienta na notifikácie o zmene resource"""
+    session = getattr(ctx, "session", None) if ctx else None
+    if session is not None:
+        _resource_watchers.setdefault(uri, weakref.WeakSet()).add(session)
+
+
+async def _notify_resource_changed(uri: str):
+    """Pošle notifications/resources/updated sessions, ktoré resource čítali"""
+    for watched_uri, sessions in list(_resource_watchers.items()):
+        if watched_uri != uri and not watched_uri.startswith(uri + "/"):
+            continue
+        
+        for session in list(sessions):
+            try:
+                await session.send_resource_updated(watched_uri)
+            except Exception as e:
+                logger.warning(f"Notifikácia o zmene {watched_uri} zlyhala: {e}")
+                sessions.discard(session)
+
+
+resource_versions.add_listener(_notify_resource_changed)
+
+
+@app.tool()
+async def fetch_resource(
+    uri: str,
+    if_version: Optional[str] = None,
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """
+    Podmienené čítanie resource podľa verzie obsahu
+    
+    Ak klient pošle verziu, ktorú už má, a obsah sa odvtedy nezmenil,
+    vráti sa len {"unchanged": true} bez obsahu. Klient zároveň dostane
+    notifikáciu notifications/resources/updated, keď sa resource zmení.
+    
+    Args:
+        uri: URI resource (flowbite://components/..., flowbite://docs/...)
+        if_version: Verzia, ktorú klient už má
+        
+    Returns:
+        Verzia a obsah resource, alebo len verzia ak sa nezmenil
+    """
+    try:
+        logger.info(f"Podmienené čítanie resource: {uri}")
+        
+        # Zapamätaná verzia platí, kým ju nezneplatní zápis komponentu/dokumentácie
+        version = resource_versions.get(uri)
+        if if_version is None or version != if_version:
+            payload = await _read_resource(uri)
+            if payload is None:
+                return {
+                    "uri": uri,
+                    "error": f"Neznámy resource '{uri}'"
+                }
+            version = resource_versions.remember(uri, payload)
+        
+        _watch_resource(uri, ctx)
+        
+        if version == if_version:
+            return {
+                "uri": uri,
+                "version": version,
+                "unchanged": True
+            }
+        
+        return {
+            "uri": uri,
+            "version": version,
+            "unchanged": False,
+            "content": payload
+        }
+        
+    except Exception as e:
+        logger.error(f"Chyba pri podmienenom čítaní resource: {e}")
+        return {"uri": uri, "error": str(e)}
+
+
+@app.tool()
+async def server_stats(include_metrics: bool = True) -> Dict[str, Any]:
+    """
+    Metriky servera - latencie a veľkosti odpovedí nástrojov, úspešnosť
+    caches, rozbehnuté volania a stav limitov, plánovača a poolov
+    
+    Args:
+        include_metrics: Či vrátiť aj jednotlivé metriky (inak len caches a subsystémy)
+        
+    Returns:
+        Prehľad metrík procesu (v pre-fork režime len tohto workera)
+    """
+    try:
+        snapshot = metrics.snapshot()
+        if not include_metrics:
+            snapshot.pop("metrics")
+        return {**snapshot, "import_time_ms": IMPORT_TIME_MS}
+        
+    except Exception as e:
+        logger.error(f"Chyba pri zbere metrík: {e}")
+        return {"error": str(e)}
+
+
+if config.metrics_path:
+    @app.custom_route(config.metrics_path, methods=["GET"])
+    async def prometheus_metrics(request):
+        """Prometheus textová expozícia metrík (len HTTP transport)"""
+        from starlette.responses import Response
+        return Response(metrics.prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+def __getattr__(name: str):
+    """Spätná kompatibilita - moduly servera dostupné ako atribúty (PEP 562)"""
+    if name in subsystems.report():
+        return subsystems.get(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def run_http(transport: str = "http", sockets: Optional[List[Any]] = None):
+    """
+    Spustí server cez HTTP transport (streamable HTTP alebo SSE)
+
+    Jedna teplá inštancia obslúži viacerých klientov naraz - súbežnosť
+    obmedzuje ConcurrencyLimitMiddleware, veľké odpovede sa komprimujú.
+
+    Args:
+        transport: http alebo sse
+        sockets: Sockety od pre-fork mastera - worker nemá vlastný stav
+            sessions, preto beží bezstavovo
+    """
+    from .utils.http import build_http_middleware
+
+    path = config.http_path if transport == "http" else None
+    if sockets:
+        # Ďalšie volanie klienta môže prísť na iný worker - bez stavu session
+        use_stateless_sessions()
+    logger.info(
+        f"HTTP transport ({transport}) na http://{config.server_host}:{config.server_port}"
+        f"{path or '/sse'}, max. {config.http_max_concurrency} súbežných požiadaviek"
+    )
+
+    await app.run_http_async(
+        show_banner=False,
+        transport=transport,
+        host=config.server_host,
+        port=config.server_port,
+        path=path,
+        middleware=build_http_middleware(),
+        # JSON odpovede namiesto SSE streamu - dajú sa komprimovať
+        json_response=config.http_json_response if transport == "http" else None,
+        stateless_http=True if sockets else None,
+        uvicorn_config={"timeout_keep_alive": config.http_keep_alive},
+        sockets=sockets
+    )
+
+
+async def main(transport: Optional[str] = None, sockets: Optional[List[Any]] = None):
     """Hlavná funkcia servera"""
+    transport = (transport or config.transport).lower()
     try:
         logger.info(f"Spúšťam {config.name} v{config.version}")
         logger.info(f"Podporované komponenty: {', '.join(config.supported_components)}")
+        logger.info(f"Import servera: {IMPORT_TIME_MS} ms")
+        
+        # Notifikácie o zmenách resources zo zápisov vo vláknach poolov
+        resource_versions.attach_loop(asyncio.get_running_loop())
         
         # Spustenie MCP servera
-        await app.run()
+        if transport == "stdio":
+            await app.run_async()
+        else:
+            await run_http(transport, sockets)
         
     except KeyboardInterrupt:
         logger.info("Server ukončený používateľom")
@@ -376,9 +1069,54 @@ async def main():
         raise
 
 
-if __name__ == "__main__":
-    asyncio.run(main())
+def run_prefork(workers: int):
+    """
+    Pre-fork HTTP server - master pripraví subsystémy a spustí workery
+
+    Katalóg, skompilované šablóny a indexy sa načítajú raz v masteri a
+    workery ich zdieľajú copy-on-write.
+    """
+    import os
+    from .utils.prefork import PreforkServer, bind_sockets
+
+    subsystems.warm_up()
+    sockets = bind_sockets(config.server_host, config.server_port, workers)
+    logger.info(f"Pre-fork master {os.getpid()} na http://{config.server_host}:{config.server_port}{config.http_path}")
+
+    PreforkServer(lambda sock: asyncio.run(main("http", [sock])), sockets, workers).run()
+
+
+def run(argv: Optional[List[str]] = None):
+    """Vstupný bod príkazu flowbite-mcp"""
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(description=config.description)
+    parser.add_argument("--transport", choices=["stdio", "http", "sse"], default=config.transport)
+    parser.add_argument("--host", help="Adresa HTTP servera")
+    parser.add_argument("--port", type=int, help="Port HTTP servera")
+    parser.add_argument("--workers", type=int, default=config.http_workers,
+                        help="Počet pre-fork workerov HTTP servera (0 = počet jadier, 1 = jeden proces)")
+    args, _ = parser.parse_known_args(argv)
+
+    if args.host:
+        config.server_host = args.host
+    if args.port:
+        config.server_port = args.port
+
+    workers = args.workers or os.cpu_count() or 1
+    if workers > 1 and args.transport == "http":
+        run_prefork(workers)
+        return
+    if workers > 1 and args.transport == "sse":
+        logger.warning("SSE transport vyžaduje sessions v jednom procese, pre-fork sa nepoužije")
+
+    asyncio.run(main(args.transport))
+
+
+# Koniec importu - čas studeného štartu servera
+IMPORT_TIME_MS = round((time.perf_counter() - _IMPORT_STARTED) * 1000, 2)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
\ No newline at end of file
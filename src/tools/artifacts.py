@@ -0,0 +1,298 @@
+"""
+Artefakty sessions - HTML komponentov adresované hashom obsahu
+
+generate_component a fix_component vrátia popri HTML aj handle artefaktu.
+Ďalšie volania (validate_component, fix_component, analyze_layout) potom
+pošlú len handle, prípadne malý patch voči nemu, namiesto celého HTML.
+Rozparsované stromy sa držia v ohraničenej LRU cache podľa handle, takže
+opakovaná práca s tým istým artefaktom HTML neparsuje znova.
+"""
+
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from bs4 import BeautifulSoup
+
+from ..config import get_config
+from ..resources.versions import content_version
+
+# Konfigurácia
+config = get_config()
+logger = logging.getLogger(__name__)
+
+# Prefix handle artefaktu (zvyšok je hash obsahu)
+HANDLE_PREFIX = "art_"
+
+# Operácie patchu nad stromom (CSS selektor) - ostatné sú textové find/replace
+TREE_OPERATIONS = ("set_attrs", "remove_attrs", "add_class", "remove_class", "text")
+
+
+class Artifact(NamedTuple):
+    """Vyriešený artefakt - handle, HTML a rozparsovaný strom (len na čítanie)"""
+    handle: Optional[str]  # None bez MCP session
+    html: str
+    tree: BeautifulSoup
+
+
+def artifact_handle(html: str) -> str:
+    """Handle artefaktu podľa obsahu - rovnaké HTML má vždy rovnaký handle"""
+    return HANDLE_PREFIX + content_version(html)
+
+
+class _SessionArtifacts:
+    """Artefakty jednej session v poradí posledného použitia"""
+
+    def __init__(self):
+        self.items: "OrderedDict[str, str]" = OrderedDict()
+        self.size = 0
+
+
+class ArtifactStore:
+    """
+    Úložisko artefaktov oddelené podľa session
+
+    Každá session má obmedzený počet bajtov HTML (najdlhšie nepoužité
+    artefakty sa zahodia), počet sessions je tiež obmedzený. Stromy sú
+    zdieľané medzi sessions - handle je hash obsahu, rovnaký handle teda
+    znamená rovnaký strom. Vrátený strom sa nesmie meniť; úpravy pracujú
+    s kópiou.
+    """
+
+    def __init__(self, max_sessions: Optional[int] = None, session_bytes: Optional[int] = None,
+                 tree_cache_size: Optional[int] = None):
+        self.max_sessions = config.artifact_max_sessions if max_sessions is None else max_sessions
+        self.session_bytes = config.artifact_session_bytes if session_bytes is None else session_bytes
+        self.tree_cache_size = config.artifact_tree_cache if tree_cache_size is None else tree_cache_size
+        self._sessions: "OrderedDict[str, _SessionArtifacts]" = OrderedDict()
+        self._trees: "OrderedDict[str, BeautifulSoup]" = OrderedDict()
+        # Nástroje bežia v CPU poole - úložisko zdieľajú vlákna
+        self._lock = threading.Lock()
+        self.tree_hits = 0
+        self.tree_misses = 0
+        self.evicted = 0
+
+    def put(self, session_id: Optional[str], html: str, tree: Optional[BeautifulSoup] = None) -> Optional[str]:
+        """
+        Uloží HTML do session
+
+        Args:
+            session_id: Identifikátor session (None = volanie bez MCP session)
+            html: HTML kód artefaktu
+            tree: Už rozparsovaný strom pre toto HTML (ušetrí parsovanie)
+
+        Returns:
+            Handle artefaktu, None bez session - handle by ďalšie volanie
+            (iný pre-fork worker, iný klient za rovnakou IP) nenašlo
+        """
+        handle = artifact_handle(html)
+        with self._lock:
+            if tree is not None:
+                self._remember_tree(handle, tree)
+            if session_id is None:
+                return None
+
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = self._sessions[session_id] = _SessionArtifacts()
+                while len(self._sessions) > max(self.max_sessions, 1):
+                    self._sessions.popitem(last=False)
+            self._sessions.move_to_end(session_id)
+
+            if handle in session.items:
+                session.items.move_to_end(handle)
+            else:
+                session.items[handle] = html
+                session.size += len(html)
+                # Najstaršie artefakty ustúpia - posledný vložený zostane vždy
+                while session.size > self.session_bytes and len(session.items) > 1:
+                    _, evicted = session.items.popitem(last=False)
+                    session.size -= len(evicted)
+                    self.evicted += 1
+        return handle
+
+    def get(self, session_id: Optional[str], handle: str) -> str:
+        """
+        HTML artefaktu session
+
+        Raises:
+            ValueError: Ak session artefakt nepozná (napr. bol vytlačený)
+                alebo volanie nemá MCP session
+        """
+        if session_id is None:
+            raise ValueError(
+                f"Artefakt '{handle}' nie je dostupný - volanie nemá MCP session "
+                "(bezstavové HTTP alebo pre-fork), pošlite HTML"
+            )
+        with self._lock:
+            session = self._sessions.get(session_id)
+            html = session.items.get(handle) if session else None
+            if html is None:
+                raise ValueError(f"Neznámy artefakt '{handle}' - pošlite HTML znova")
+            self._sessions.move_to_end(session_id)
+            session.items.move_to_end(handle)
+            return html
+
+    def tree(self, handle: str, html: str) -> BeautifulSoup:
+        """Rozparsovaný strom artefaktu z cache, pri prvom použití sa HTML rozparsuje"""
+        with self._lock:
+            tree = self._trees.get(handle)
+            if tree is not None:
+                self._trees.move_to_end(handle)
+                self.tree_hits += 1
+                return tree
+            self.tree_misses += 1
+
+        # Parsovanie mimo zámku - súbežné parsovanie rovnakého HTML je len zbytočná práca
+        tree = BeautifulSoup(html, 'html.parser')
+        with self._lock:
+            self._remember_tree(handle, tree)
+        return tree
+
+    def _remember_tree(self, handle: str, tree: BeautifulSoup):
+        """Uloží strom do LRU cache (volá sa pod zámkom)"""
+        if self.tree_cache_size <= 0:
+            return
+        self._trees[handle] = tree
+        self._trees.move_to_end(handle)
+        while len(self._trees) > self.tree_cache_size:
+            self._trees.popitem(last=False)
+
+    def resolve(
+        self,
+        session_id: Optional[str],
+        html: Optional[str] = None,
+        handle: Optional[str] = None,
+        patch: Optional[List[Dict[str, Any]]] = None
+    ) -> Artifact:
+        """
+        Vyrieši vstup nástroja na artefakt
+
+        Priame HTML sa uloží ako nový artefakt (ďalšie volania už môžu
+        poslať len handle). Patch vytvorí nový artefakt, pôvodný zostáva.
+
+        Args:
+            session_id: Identifikátor session
+            html: HTML kód (alternatíva k handle)
+            handle: Handle existujúceho artefaktu
+            patch: Zoznam úprav - {"find", "replace", "count"} alebo
+                {"select", "set_attrs" | "remove_attrs" | "add_class" | "remove_class" | "text"}
+
+        Returns:
+            Artefakt s HTML a stromom
+
+        Raises:
+            ValueError: Chýbajúci vstup, neznámy handle alebo neplatný patch
+        """
+        if html is None and not handle:
+            raise ValueError("Zadajte html alebo artifact")
+
+        if html is None:
+            html = self.get(session_id, handle)
+        else:
+            handle = self.put(session_id, html)
+
+        # Stromy sú v cache podľa obsahu aj bez session
+        tree_key = handle or artifact_handle(html)
+        tree = None
+        if patch:
+            html, tree = self._apply_patch(tree_key, html, patch)
+            handle = self.put(session_id, html, tree)
+            tree_key = handle or artifact_handle(html)
+
+        return Artifact(handle, html, tree if tree is not None else self.tree(tree_key, html))
+
+    def _apply_patch(self, handle: str, html: str, patch: List[Dict[str, Any]]):
+        """
+        Aplikuje úpravy v poradí
+
+        Úpravy stromu pracujú s kópiou stromu z cache, textové s reťazcom;
+        medzi nimi sa prevádza len pri zmene druhu úpravy.
+
+        Returns:
+            (nové HTML, strom alebo None ak posledná úprava bola textová)
+        """
+        tree = None
+        if not isinstance(patch, list):
+            raise ValueError("Patch musí byť zoznam úprav")
+        for index, operation in enumerate(patch):
+            if not isinstance(operation, dict):
+                raise ValueError(f"Úprava {index} musí byť objekt")
+
+            if "find" in operation:
+                if tree is not None:
+                    html, tree = str(tree), None
+                find = operation["find"]
+                if not find or find not in html:
+                    raise ValueError(f"Úprava {index}: text '{find}' sa v artefakte nenachádza")
+                html = html.replace(find, operation.get("replace", ""), int(operation.get("count", 1)))
+                handle = None
+                continue
+
+            if "select" not in operation or not any(key in operation for key in TREE_OPERATIONS):
+                raise ValueError(f"Úprava {index}: očakáva sa find/replace alebo select s úpravou")
+
+            if tree is None:
+                tree = copy.copy(self.tree(handle or artifact_handle(html), html))
+            elements = tree.select(operation["select"])
+            if not elements:
+                raise ValueError(f"Úprava {index}: selektor '{operation['select']}' nenašiel žiadny element")
+            for element in elements:
+                self._patch_element(element, operation)
+
+        if tree is not None:
+            html = str(tree)
+        return html, tree
+
+    def _patch_element(self, element, operation: Dict[str, Any]):
+        """Upraví jeden element podľa operácie patchu"""
+        for name, value in (operation.get("set_attrs") or {}).items():
+            element[name] = value
+        for name in operation.get("remove_attrs") or []:
+            if name in element.attrs:
+                del element[name]
+
+        classes = list(element.get("class", []))
+        if operation.get("add_class"):
+            classes += [cls for cls in operation["add_class"].split() if cls not in classes]
+        if operation.get("remove_class"):
+            removed = set(operation["remove_class"].split())
+            classes = [cls for cls in classes if cls not in removed]
+        if "add_class" in operation or "remove_class" in operation:
+            if classes:
+                element["class"] = classes
+            elif "class" in element.attrs:
+                del element["class"]
+
+        if "text" in operation:
+            element.string = str(operation["text"])
+
+    def drop_session(self, session_id: str):
+        """Zahodí artefakty session"""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Počty artefaktov a úspešnosť cache stromov"""
+        with self._lock:
+            lookups = self.tree_hits + self.tree_misses
+            return {
+                "sessions": len(self._sessions),
+                "artifacts": sum(len(session.items) for session in self._sessions.values()),
+                "bytes": sum(session.size for session in self._sessions.values()),
+                "evicted": self.evicted,
+                "trees": len(self._trees),
+                "tree_hits": self.tree_hits,
+                "tree_misses": self.tree_misses,
+                "tree_hit_ratio": round(self.tree_hits / lookups, 3) if lookups else 0.0
+            }
+
+
+# Globálne úložisko artefaktov - vytvorí sa pri prvom prístupe (PEP 562)
+def __getattr__(name: str):
+    if name == "artifact_store":
+        from ..utils.registry import subsystems
+        return subsystems.get("artifact_store")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,289 @@
+"""
+Index odtlačkov CSS tried pre automatickú detekciu typu komponentu
+"""
+
+import json
+import math
+import re
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..config import get_config
+from ..models.schema import CSS_CLASSES, HTML_TEMPLATES
+
+# Konfigurácia
+config = get_config()
+logger = logging.getLogger(__name__)
+
+# Tagy, ktoré samé o sebe určujú typ komponentu
+STRUCTURAL_TAGS: Dict[str, str] = {
+    "form": "form",
+    "nav": "navbar",
+    "table": "table"
+}
+
+# Minimálne vážené F1 (pokrytie odtlačku aj elementu) pre zhodu
+DEFAULT_MIN_SCORE = 0.5
+
+# Časti CSS_CLASSES, ktoré patria koreňovému elementu komponentu
+ROOT_PARTS = ("base", "nav", "container")
+
+# Menšie odtlačky (flex items-center, p-5) sú len generické utility triedy
+MIN_FINGERPRINT_CLASSES = 5
+
+# Zhoda vyžaduje aspoň toľko spoločných tried s odtlačkom
+MIN_SHARED_CLASSES = 4
+
+
+@dataclass(frozen=True)
+class ClassFingerprint:
+    """Množina CSS tried charakteristická pre typ/variantu komponentu"""
+    component_type: str
+    variant: Optional[str]
+    source: str
+    classes: frozenset
+
+
+@dataclass
+class FingerprintMatch:
+    """Zhoda elementu s odtlačkom"""
+    component_type: str
+    variant: Optional[str]
+    score: float
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "component_type": self.component_type,
+            "variant": self.variant,
+            "score": round(self.score, 3)
+        }
+
+
+class ComponentFingerprintIndex:
+    """Reverzný index: CSS trieda -> odtlačky komponentov s váhou triedy"""
+
+    def __init__(self, components_dir: Optional[str] = None):
+        self.components_dir = Path(components_dir or config.components_dir)
+        self.fingerprints: List[ClassFingerprint] = []
+        self._postings: Dict[str, List[Tuple[int, float]]] = {}
+        self._totals: List[float] = []
+        self._unknown_weight = 0.0
+        self._built = False
+        self._lock = threading.Lock()
+
+    def _collect_fingerprints(self) -> List[ClassFingerprint]:
+        """Zozbiera odtlačky z CSS_CLASSES a data/components/*.json"""
+        fingerprints = []
+
+        for component_type, parts in CSS_CLASSES.items():
+            base = parts.get("base", "").split()
+
+            for variant, classes in parts.get("variants", {}).items():
+                fingerprints.append(ClassFingerprint(
+                    component_type, variant, "css_classes",
+                    frozenset(base + classes.split())
+                ))
+
+            # Len koreňový element - podčasti (card.content, modal.header) sú
+            # generické utility triedy, ktoré sa vyskytujú v ľubovoľnom HTML
+            for part, classes in parts.items():
+                if part not in ROOT_PARTS or not isinstance(classes, str):
+                    continue
+                if part == "base" and parts.get("variants"):
+                    continue  # Base je už súčasťou odtlačkov variant
+                fingerprints.append(ClassFingerprint(
+                    component_type, None, f"css_classes.{part}",
+                    frozenset(classes.split())
+                ))
+
+        if self.components_dir.exists():
+            for json_file in sorted(self.components_dir.glob("*.json")):
+                if json_file.name == "index.json":
+                    continue
+
+                try:
+                    with open(json_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except Exception as e:
+                    logger.error(f"Chyba pri načítaní odtlačkov z {json_file}: {e}")
+                    continue
+
+                for variant, variant_data in data.get("variants", {}).items():
+                    classes = variant_data.get("css_classes") if isinstance(variant_data, dict) else None
+                    if classes:
+                        fingerprints.append(ClassFingerprint(
+                            json_file.stem, variant, json_file.name, frozenset(classes)
+                        ))
+
+        return [f for f in fingerprints if len(f.classes) >= MIN_FINGERPRINT_CLASSES]
+
+    def build(self):
+        """Zostaví reverzný index s IDF váhami tried"""
+        with self._lock:
+            self._build()
+
+    def _ensure_built(self):
+        """Zostaví index pri prvom použití (aj z vlákien cpu_pool)"""
+        if not self._built:
+            with self._lock:
+                if not self._built:
+                    self._build()
+
+    def _build(self):
+        fingerprints = self._collect_fingerprints()
+
+        documents = [fingerprint.classes for fingerprint in fingerprints] + _layout_class_sets()
+        document_frequency: Dict[str, int] = {}
+        for classes in documents:
+            for css_class in classes:
+                document_frequency[css_class] = document_frequency.get(css_class, 0) + 1
+
+        # Triedy zdieľané mnohými komponentmi a layout elementmi (text-sm,
+        # flex, items-center) majú malú váhu
+        total = len(documents)
+        weights = {
+            css_class: math.log(1 + total / count)
+            for css_class, count in document_frequency.items()
+        }
+
+        postings: Dict[str, List[Tuple[int, float]]] = {}
+        totals = []
+        for fingerprint_id, fingerprint in enumerate(fingerprints):
+            totals.append(sum(weights[c] for c in fingerprint.classes))
+            for css_class in fingerprint.classes:
+                postings.setdefault(css_class, []).append((fingerprint_id, weights[css_class]))
+
+        self.fingerprints = fingerprints
+        self._postings = postings
+        self._totals = totals
+        # Neznáma trieda elementu znižuje presnosť zhody ako najbežnejšia známa
+        self._unknown_weight = min(weights.values(), default=0.0)
+        self._built = True
+        logger.debug(f"Index odtlačkov zostavený: {len(fingerprints)} odtlačkov, {len(postings)} tried")
+
+    def invalidate(self):
+        """Označí index na prebudovanie (po zmene komponentov)"""
+        self._built = False
+
+    def match(self, classes: Iterable[str], limit: int = 3) -> List[FingerprintMatch]:
+        """
+        Nájde odtlačky s najväčším váženým F1 pre dané triedy
+
+        Presnosť je podiel váhy spoločných tried na váhe tried elementu,
+        úplnosť podiel na váhe odtlačku - malý odtlačok v elemente s
+        mnohými inými triedami ani element s pár triedami veľkého
+        odtlačku nedosiahnu vysoké skóre.
+
+        Args:
+            classes: CSS triedy elementu
+            limit: Maximum výsledkov
+
+        Returns:
+            Zhody zoradené podľa skóre
+        """
+        self._ensure_built()
+
+        accumulated: Dict[int, float] = {}
+        shared: Dict[int, int] = {}
+        element_total = 0.0
+        for css_class in set(classes):
+            postings = self._postings.get(css_class)
+            if not postings:
+                element_total += self._unknown_weight
+                continue
+            element_total += postings[0][1]
+            for fingerprint_id, weight in postings:
+                accumulated[fingerprint_id] = accumulated.get(fingerprint_id, 0.0) + weight
+                shared[fingerprint_id] = shared.get(fingerprint_id, 0) + 1
+
+        # Najlepšie skóre pre každú dvojicu typ/varianta
+        best: Dict[Tuple[str, Optional[str]], float] = {}
+        for fingerprint_id, weight in accumulated.items():
+            if shared[fingerprint_id] < MIN_SHARED_CLASSES:
+                continue
+            fingerprint = self.fingerprints[fingerprint_id]
+            key = (fingerprint.component_type, fingerprint.variant)
+            precision = weight / element_total
+            recall = weight / self._totals[fingerprint_id]
+            score = 2 * precision * recall / (precision + recall)
+            if score > best.get(key, 0.0):
+                best[key] = score
+
+        matches = [
+            FingerprintMatch(component_type, variant, score)
+            for (component_type, variant), score in best.items()
+        ]
+        matches.sort(key=lambda m: (-m.score, m.variant is None))
+        return matches[:limit]
+
+    def best_match(
+        self,
+        classes: Iterable[str],
+        tag_name: Optional[str] = None,
+        min_score: float = DEFAULT_MIN_SCORE
+    ) -> Optional[FingerprintMatch]:
+        """Najlepšia zhoda elementu alebo None pod prahom"""
+        if tag_name in STRUCTURAL_TAGS:
+            return FingerprintMatch(STRUCTURAL_TAGS[tag_name], None, 1.0)
+
+        matches = self.match(classes, limit=1)
+        if matches and matches[0].score >= min_score:
+            return matches[0]
+        return None
+
+    def detect_component(self, soup, min_score: float = DEFAULT_MIN_SCORE) -> Optional[FingerprintMatch]:
+        """
+        Určí typ komponentu HTML fragmentu
+
+        Rozhoduje najvyššie položený element so zhodou - vonkajší komponent
+        určuje, čím fragment je (formulár s tlačidlom je formulár).
+        """
+        from bs4 import Tag
+
+        best: Optional[Tuple[int, FingerprintMatch]] = None
+        stack = [(child, 1) for child in reversed(soup.contents) if isinstance(child, Tag)]
+
+        while stack:
+            element, depth = stack.pop()
+            if best and depth > best[0]:
+                continue  # Hlbšie elementy už nemôžu vyhrať
+
+            match = self.best_match(element.get('class') or (), element.name, min_score)
+            if match and (not best or depth < best[0] or match.score > best[1].score):
+                best = (depth, match)
+
+            for child in reversed(element.contents):
+                if isinstance(child, Tag):
+                    stack.append((child, depth + 1))
+
+        return best[1] if best else None
+
+
+def _layout_class_sets() -> List[frozenset]:
+    """
+    Množiny tried podčastí komponentov a statických elementov šablón
+
+    Nie sú odtlačkami, len spresňujú IDF váhy - trieda bežná vo vnútri
+    komponentov (flex, p-4) nesmie vyzerať ako charakteristická.
+    """
+    class_sets = []
+    for parts in CSS_CLASSES.values():
+        for part, classes in parts.items():
+            if isinstance(classes, dict):
+                class_sets.extend(frozenset(value.split()) for value in classes.values())
+            elif part not in ROOT_PARTS:
+                class_sets.append(frozenset(classes.split()))
+
+    for templates in HTML_TEMPLATES.values():
+        for template in templates.values():
+            for classes in re.findall(r'class="([^"{}]+)"', template):
+                class_sets.append(frozenset(classes.split()))
+
+    return [classes for classes in class_sets if classes]
+
+
+# Globálna inštancia indexu odtlačkov
+fingerprint_index = ComponentFingerprintIndex()
@@ -4,7 +4,7 @@ Generátor Flowbite komponentov
 
 import json
 import logging
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from pathlib import Path
 from jinja2 import Template, Environment, BaseLoader
 
@@ -17,11 +17,15 @@ from ..models.component import (
     ComponentProps
 )
 from ..models.schema import CSS_CLASSES, HTML_TEMPLATES
+from ..utils.metrics import metrics
 
 # Konfigurácia
 config = get_config()
 logger = logging.getLogger(__name__)
 
+# Úspešnosť cache skompilovaných šablón (renderovanie komponentov)
+cache_metrics = metrics.cache("render")
+
 
 class TemplateLoader(BaseLoader):
     """Custom template loader pre Jinja2"""
@@ -45,6 +49,26 @@ class FlowbiteGenerator:
         self.template_env = Environment(loader=TemplateLoader(HTML_TEMPLATES))
         self.css_classes = CSS_CLASSES
         self.components_cache: Dict[str, List[FlowbiteComponent]] = {}
+        # Skompilované šablóny (typ, variant) -> Template
+        self._templates: Dict[Tuple[str, str], Template] = {}
+    
+    def _compiled_template(self, component_type: str, template_variant: str) -> Template:
+        """Vráti skompilovanú šablónu, kompiluje sa len raz"""
+        key = (component_type, template_variant)
+        template = self._templates.get(key)
+        if template is None:
+            cache_metrics.miss()
+            template = Template(HTML_TEMPLATES[component_type][template_variant])
+            self._templates[key] = template
+        else:
+            cache_metrics.hit()
+        return template
+    
+    def warm_up(self):
+        """Skompiluje všetky šablóny vopred (pred forkom workerov)"""
+        for component_type, variants in HTML_TEMPLATES.items():
+            for template_variant in variants:
+                self._compiled_template(component_type, template_variant)
         
     async def generate_component(
         self,
@@ -91,7 +115,7 @@ class FlowbiteGenerator:
             }
             
             # Renderovanie šablóny
-            template = Template(template_content)
+            template = self._compiled_template(component_type, template_variant)
             html = template.render(**template_vars)
             
             return html.strip()
@@ -380,5 +404,9 @@ class FlowbiteGenerator:
             return []
 
 
-# Globálna inštancia generátora
-generator = FlowbiteGenerator()
\ No newline at end of file
+# Globálna inštancia generátora - vytvorí sa pri prvom prístupe (PEP 562)
+def __getattr__(name: str):
+    if name == "generator":
+        from ..utils.registry import subsystems
+        return subsystems.get("generator")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,579 @@
+"""
+Asynchrónne úlohy pre dlhé operácie
+
+Hromadná validácia, vykreslenie celého katalógu alebo reindexovanie
+dokumentácie môžu trvať dlhšie, ako klient čaká na odpoveď. Klient úlohu
+zadá cez submit_job, priebeh sleduje cez job_status a výsledky si
+stránkovane vyzdvihne cez job_result.
+
+Záznamy úloh a ich výsledky sú v SQLite databáze v config.data_dir -
+prežijú reštart a v pre-fork režime ich vidia všetky workery. Databáza
+je zároveň frontou: worker si úlohu atomicky zarezervuje, takže ju
+nespustia dva procesy naraz.
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..config import get_config
+from ..models.schema import HTML_TEMPLATES
+from ..utils.cancellation import CancellationToken, OperationCancelled, cancellation_scope
+from ..utils.executors import cpu_pool, io_pool
+from ..utils.registry import subsystems
+from ..utils.scheduler import BULK
+
+# Konfigurácia
+config = get_config()
+logger = logging.getLogger(__name__)
+
+# Stavy úlohy
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+# Stránkovanie výsledkov
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Výsledky sa zapisujú po dávkach, medzi dávkami sa kontroluje zrušenie
+RESULT_FLUSH_SIZE = 25
+
+# Ako často voľný worker hľadá úlohy zadané v inom procese
+POLL_INTERVAL = 1.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    params TEXT NOT NULL,
+    client_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    total INTEGER NOT NULL DEFAULT 0,
+    done INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    owner_pid INTEGER,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);
+CREATE TABLE IF NOT EXISTS job_results (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    item TEXT NOT NULL,
+    PRIMARY KEY (job_id, seq)
+);
+"""
+
+
+def _timestamp(value: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(value).isoformat() if value else None
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+
+class JobStore:
+    """
+    SQLite záznamy úloh a ich výsledkov
+
+    Všetky metódy sú blokujúce - JobQueue ich volá cez I/O pool.
+    Spojenie sa otvára lenivo a po forku znova (pre-fork master ho
+    tak nezdieľa s workermi).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self.path), timeout=30, isolation_level=None, check_same_thread=False
+            )
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+            self._connection, self._pid = connection, os.getpid()
+            self._recover(connection)
+        return self._connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Príkazy v bloku sa zapíšu naraz (zámok aj voči iným procesom)"""
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+
+    def _recover(self, connection: sqlite3.Connection):
+        """Úlohy procesov, ktoré už nebežia, sa vrátia do fronty; staré úlohy sa zmažú"""
+        orphaned = [
+            row["id"] for row in connection.execute(
+                "SELECT id, owner_pid FROM jobs WHERE status = ?", (RUNNING,)
+            ) if not _pid_alive(row["owner_pid"])
+        ]
+        for job_id in orphaned:
+            self._requeue(connection, job_id)
+        if orphaned:
+            logger.warning(f"Prerušené úlohy vrátené do fronty: {', '.join(orphaned)}")
+
+        expired = (*FINISHED_STATES, time.time() - config.job_retention_hours * 3600)
+        connection.execute(
+            "DELETE FROM job_results WHERE job_id IN "
+            "(SELECT id FROM jobs WHERE status IN (?, ?, ?) AND finished_at < ?)", expired
+        )
+        connection.execute("DELETE FROM jobs WHERE status IN (?, ?, ?) AND finished_at < ?", expired)
+
+    def _requeue(self, connection: sqlite3.Connection, job_id: str):
+        connection.execute("DELETE FROM job_results WHERE job_id = ?", (job_id,))
+        connection.execute(
+            "UPDATE jobs SET status = ?, done = 0, owner_pid = NULL, started_at = NULL WHERE id = ?",
+            (QUEUED, job_id)
+        )
+
+    def create(self, kind: str, params: Dict[str, Any], client_id: str, total: int) -> str:
+        """Zapíše novú úlohu do fronty a vráti jej ID"""
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._connect().execute(
+                "INSERT INTO jobs (id, kind, params, client_id, status, total, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, kind, json.dumps(params, ensure_ascii=False), client_id, QUEUED, total, time.time())
+            )
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Záznam úlohy (None ak neexistuje)"""
+        with self._lock:
+            row = self._connect().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """Atomicky zarezervuje najstaršiu úlohu vo fronte pre tento proces"""
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT * FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1", (QUEUED,)
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE jobs SET status = ?, owner_pid = ?, started_at = ? WHERE id = ?",
+                    (RUNNING, os.getpid(), time.time(), row["id"])
+                )
+        return dict(row) if row else None
+
+    def append_results(self, job_id: str, first_seq: int, items: List[Any]) -> bool:
+        """
+        Pridá dávku výsledkov a posunie priebeh
+
+        Returns:
+            True ak klient (aj cez iný proces) požiadal o zrušenie
+        """
+        with self._transaction() as connection:
+            connection.executemany(
+                "INSERT INTO job_results (job_id, seq, item) VALUES (?, ?, ?)",
+                [(job_id, first_seq + offset, json.dumps(item, ensure_ascii=False, default=str))
+                 for offset, item in enumerate(items)]
+            )
+            connection.execute("UPDATE jobs SET done = ? WHERE id = ?", (first_seq + len(items), job_id))
+            row = connection.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return bool(row and row["cancel_requested"])
+
+    def finish(self, job_id: str, status: str, error: Optional[str] = None):
+        """Zapíše výsledný stav úlohy"""
+        with self._lock:
+            self._connect().execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                (status, error, time.time(), job_id)
+            )
+
+    def requeue(self, job_id: str):
+        """Vráti prerušenú úlohu do fronty (čiastočné výsledky sa zahodia)"""
+        with self._transaction() as connection:
+            self._requeue(connection, job_id)
+
+    def request_cancel(self, job_id: str) -> Optional[str]:
+        """
+        Zruší úlohu vo fronte, bežiacej nastaví príznak zrušenia
+
+        Returns:
+            Stav úlohy po požiadavke (None ak úloha neexistuje)
+        """
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = ?, finished_at = ? WHERE id = ? AND status = ?",
+                (CANCELLED, time.time(), job_id, QUEUED)
+            )
+            connection.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = ?", (job_id, RUNNING)
+            )
+            row = connection.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row["status"] if row else None
+
+    def results(self, job_id: str, offset: int, limit: int) -> Tuple[int, List[Any]]:
+        """Počet výsledkov a jedna stránka"""
+        with self._lock:
+            connection = self._connect()
+            count = connection.execute(
+                "SELECT COUNT(*) FROM job_results WHERE job_id = ?", (job_id,)
+            ).fetchone()[0]
+            rows = connection.execute(
+                "SELECT item FROM job_results WHERE job_id = ? ORDER BY seq LIMIT ? OFFSET ?",
+                (job_id, limit, offset)
+            ).fetchall()
+        return count, [json.loads(row["item"]) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """Počet úloh podľa stavu"""
+        with self._lock:
+            rows = self._connect().execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+
+class JobQueue:
+    """
+    Fronta dlhých úloh s poolom workerov
+
+    Každý druh úlohy má plán (zoznam položiek z parametrov, overí sa už pri
+    zadaní) a spracovanie jednej položky. Položky bežia v hromadnej triede
+    plánovača, takže interaktívne volania ich predbehnú.
+
+    Workery sa spustia pri prvom použití fronty v bežiacej slučke - úlohy,
+    ktoré zostali vo fronte po reštarte, pokračujú po prvom volaní nástroja úloh.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, workers: Optional[int] = None):
+        """
+        Args:
+            db_path: Cesta k SQLite databáze (predvolene data_dir/jobs.sqlite3)
+            workers: Počet súbežne bežiacich úloh v procese
+        """
+        self.store = JobStore(Path(db_path or Path(config.data_dir) / "jobs.sqlite3"))
+        self.workers = workers or config.job_workers
+        # druh -> (plán položiek, spracovanie položky, dokončenie úlohy na slučke)
+        self._kinds: Dict[str, Tuple[Callable[[Dict[str, Any]], List[Any]],
+                                     Callable[..., Awaitable[Any]],
+                                     Optional[Callable[[], Awaitable[None]]]]] = {
+            "validate_batch": (self._plan_validate_batch, self._validate_item, None),
+            "render_catalog": (self._plan_render_catalog, self._render_item, None),
+            "reindex_docs": (self._plan_reindex_docs, self._reindex_item, self._save_docs_index)
+        }
+        # Tokeny úloh bežiacich v tomto procese
+        self._tokens: Dict[str, CancellationToken] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+
+    @property
+    def kinds(self) -> List[str]:
+        return sorted(self._kinds)
+
+    def _ensure_workers(self):
+        """Spustí workery v aktuálnej slučke (po novej slučke znova)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        # Prázdny kontext - workery nededia token ani HTTP požiadavku volajúceho
+        self._worker_tasks = [
+            contextvars.Context().run(loop.create_task, self._worker())
+            for _ in range(self.workers)
+        ]
+
+    async def submit(self, kind: str, params: Optional[Dict[str, Any]] = None,
+                     client_id: str = "local") -> Dict[str, Any]:
+        """
+        Zadá úlohu do fronty
+
+        Args:
+            kind: Druh úlohy (validate_batch, render_catalog, reindex_docs)
+            params: Parametre úlohy
+            client_id: Klient, ktorému sa úloha započíta v plánovači
+
+        Returns:
+            Stav novej úlohy
+
+        Raises:
+            ValueError: Neznámy druh úlohy alebo neplatné parametre
+        """
+        if kind not in self._kinds:
+            raise ValueError(f"Neznámy druh úlohy: {kind} (dostupné: {', '.join(self.kinds)})")
+
+        params = params or {}
+        plan = self._kinds[kind][0]
+        items = plan(params)
+        if len(items) > config.job_max_items:
+            raise ValueError(f"Úloha má {len(items)} položiek, maximum je {config.job_max_items}")
+
+        self._ensure_workers()
+        job_id = await io_pool.run(self.store.create, kind, params, client_id, len(items))
+        self._wakeup.set()
+        logger.info(f"Úloha {job_id} ({kind}, {len(items)} položiek) zaradená do fronty")
+        return await self.status(job_id)
+
+    async def status(self, job_id: str) -> Dict[str, Any]:
+        """Stav a priebeh úlohy"""
+        self._ensure_workers()
+        job = await io_pool.run(self.store.get, job_id)
+        if job is None:
+            raise ValueError(f"Úloha {job_id} neexistuje")
+
+        return {
+            "job_id": job["id"],
+            "kind": job["kind"],
+            "status": job["status"],
+            "progress": {"done": job["done"], "total": job["total"]},
+            "error": job["error"],
+            "cancel_requested": bool(job["cancel_requested"]),
+            "created_at": _timestamp(job["created_at"]),
+            "started_at": _timestamp(job["started_at"]),
+            "finished_at": _timestamp(job["finished_at"])
+        }
+
+    async def result(self, job_id: str, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+        """
+        Stránka výsledkov úlohy
+
+        Výsledky bežiacej úlohy sú dostupné priebežne - complete hovorí,
+        či už pribudnúť nemôžu.
+        """
+        status = await self.status(job_id)
+        page = max(page, 1)
+        page_size = min(max(page_size, 1), MAX_PAGE_SIZE)
+
+        total_results, items = await io_pool.run(
+            self.store.results, job_id, (page - 1) * page_size, page_size
+        )
+        return {
+            "job_id": job_id,
+            "status": status["status"],
+            "complete": status["status"] in FINISHED_STATES,
+            "page": page,
+            "page_size": page_size,
+            "pages": (total_results + page_size - 1) // page_size,
+            "total_results": total_results,
+            "items": items
+        }
+
+    async def cancel(self, job_id: str) -> Dict[str, Any]:
+        """Zruší úlohu - vo fronte hneď, bežiacu pri najbližšej kontrole"""
+        self._ensure_workers()
+        status = await io_pool.run(self.store.request_cancel, job_id)
+        if status is None:
+            raise ValueError(f"Úloha {job_id} neexistuje")
+
+        token = self._tokens.get(job_id)
+        if token is not None:
+            token.cancel()
+        return await self.status(job_id)
+
+    async def _worker(self):
+        """Berie úlohy z databázy, kým beží slučka"""
+        while True:
+            try:
+                job = await io_pool.run(self.store.claim)
+            except Exception as e:
+                logger.error(f"Chyba pri výbere úlohy: {e}")
+                job = None
+
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._run(job)
+
+    async def _run(self, job: Dict[str, Any]):
+        """Spracuje položky úlohy a zapíše výsledky po dávkach"""
+        job_id = job["id"]
+        # Plánovač je v middleware vrstve servera - import až pri prvej úlohe
+        from ..middleware.scheduling import tool_scheduler
+
+        plan, process, finish = self._kinds[job["kind"]]
+        token = CancellationToken()
+        self._tokens[job_id] = token
+        buffer: List[Any] = []
+        written = 0
+
+        async def flush():
+            nonlocal written
+            if buffer:
+                if await io_pool.run(self.store.append_results, job_id, written, list(buffer)):
+                    token.cancel()
+                written += len(buffer)
+                buffer.clear()
+
+        try:
+            with cancellation_scope(token):
+                for index, item in enumerate(plan(json.loads(job["params"]))):
+                    token.check()
+                    async with tool_scheduler.slot(job["client_id"], BULK):
+                        buffer.append(await process(index, item))
+                    if len(buffer) >= RESULT_FLUSH_SIZE:
+                        await flush()
+                await flush()
+                token.check()
+
+            if finish is not None:
+                await finish()
+
+            await io_pool.run(self.store.finish, job_id, SUCCEEDED)
+            self.completed += 1
+            logger.info(f"Úloha {job_id} dokončená")
+
+        except OperationCancelled:
+            await flush()
+            await io_pool.run(self.store.finish, job_id, CANCELLED)
+            self.cancelled += 1
+            logger.info(f"Úloha {job_id} zrušená")
+        except asyncio.CancelledError:
+            # Slučka končí - úloha sa spustí znova v ďalšej slučke alebo procese.
+            # Zápis (môže čakať na zámok SQLite) beží v io_pool a zrušenie ho nepreruší
+            try:
+                await asyncio.shield(io_pool.run(self.store.requeue, job_id))
+            except Exception as e:
+                logger.error(f"Chyba pri vrátení úlohy {job_id} do fronty: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Chyba pri úlohe {job_id}: {e}")
+            await io_pool.run(self.store.finish, job_id, FAILED, str(e))
+            self.failed += 1
+        finally:
+            self._tokens.pop(job_id, None)
+
+    # Hromadná validácia
+
+    def _plan_validate_batch(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        items = params.get("items")
+        if not isinstance(items, list) or not items:
+            raise ValueError("validate_batch vyžaduje neprázdny zoznam items (HTML alebo {html, component_type})")
+
+        plan = []
+        for item in items:
+            if isinstance(item, str):
+                item = {"html": item}
+            if not isinstance(item, dict) or not isinstance(item.get("html"), str):
+                raise ValueError("Každá položka validate_batch musí byť HTML reťazec alebo {html, component_type}")
+            plan.append({
+                "html": item["html"],
+                "component_type": item.get("component_type"),
+                "strict": params.get("strict", False)
+            })
+        return plan
+
+    async def _validate_item(self, index: int, item: Dict[str, Any]) -> Dict[str, Any]:
+        result = await cpu_pool.run_coroutine(
+            subsystems.get("validator").validate_component,
+            html_code=item["html"],
+            component_type=item["component_type"],
+            strict=item["strict"]
+        )
+        return {
+            "index": index,
+            "component_type": result.component_type,
+            "valid": result.valid,
+            "score": result.score,
+            "errors": result.errors,
+            "warnings": result.warnings
+        }
+
+    # Vykreslenie katalógu
+
+    def _plan_render_catalog(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        component_types = params.get("component_types") or list(HTML_TEMPLATES)
+        unknown = [name for name in component_types if name not in HTML_TEMPLATES]
+        if unknown:
+            raise ValueError(f"Neznáme typy komponentov: {', '.join(unknown)}")
+
+        return [
+            {"component_type": component_type, "variant": variant, "props": params.get("props") or {}}
+            for component_type in component_types
+            for variant in HTML_TEMPLATES[component_type]
+        ]
+
+    async def _render_item(self, index: int, item: Dict[str, Any]) -> Dict[str, Any]:
+        rendered = {"component_type": item["component_type"], "variant": item["variant"]}
+        try:
+            rendered["html"] = await cpu_pool.run_coroutine(
+                subsystems.get("generator").generate_component,
+                item["component_type"], dict(item["props"]), None, item["variant"]
+            )
+        except OperationCancelled:
+            raise
+        except Exception as e:
+            # Jedna nepodarená šablóna nezastaví zvyšok katalógu
+            rendered["error"] = str(e)
+        return rendered
+
+    # Reindexovanie dokumentácie
+
+    def _plan_reindex_docs(self, params: Dict[str, Any]) -> List[str]:
+        sections = subsystems.get("documentation_manager").section_ids()
+        wanted = params.get("sections")
+        if wanted:
+            unknown = [section for section in wanted if section not in sections]
+            if unknown:
+                raise ValueError(f"Neznáme sekcie dokumentácie: {', '.join(unknown)}")
+            return list(wanted)
+        return sections
+
+    async def _reindex_item(self, index: int, section: str) -> Dict[str, Any]:
+        # Index číta aj vyhľadávanie na slučke - sekcia sa preindexuje na slučke, nie v poole
+        await asyncio.sleep(0)
+        return subsystems.get("documentation_manager").reindex_section(section)
+
+    async def _save_docs_index(self):
+        search_index = subsystems.get("documentation_manager").search_index
+        # Snímka na slučke (index mení aj update_documentation), zápis súboru v io_pool
+        payload = search_index.serialize()
+        await io_pool.run(search_index.write, payload)
+
+    def stats(self) -> Dict[str, Any]:
+        """Počítadlá úloh tohto procesu"""
+        return {
+            "workers": self.workers,
+            "running": len(self._tokens),
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled
+        }
@@ -0,0 +1,166 @@
+"""
+Zlúčený pipeline generovanie -> validácia -> oprava komponentu
+
+Agent bežne volá generate_component, validate_component, fix_component a
+znova validate_component - HTML sa štyrikrát serializuje do odpovede a
+trikrát parsuje. Pipeline vykoná tie isté kroky v jednom volaní nad
+jedným stromom: oprava mení strom na mieste a ďalšia validácia ho
+použije bez nového parsovania.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+from ..config import get_config
+from ..utils.cancellation import CancellationToken, OperationCancelled, current_token
+from ..utils.registry import subsystems
+
+# Konfigurácia
+config = get_config()
+logger = logging.getLogger(__name__)
+
+# Horná hranica opravných kôl (každé kolo = oprava + validácia)
+MAX_FIX_ITERATIONS = 10
+
+# Dôvody ukončenia pipeline
+STOP_SCORE_REACHED = "score_reached"
+STOP_MAX_ITERATIONS = "max_iterations"
+STOP_NO_CHANGES = "no_changes"
+STOP_DEADLINE = "deadline"
+
+
+class ComponentPipeline:
+    """Generovanie, validácia a opravy komponentu v jednom prechode"""
+
+    def __init__(self):
+        self.config = config
+
+    async def build_component(
+        self,
+        component_type: str,
+        props: Dict[str, Any],
+        template_variant: str = "basic",
+        min_score: float = 90.0,
+        max_fix_iterations: int = 2,
+        strict: bool = False,
+        session_id: Optional[str] = None,
+        token: Optional[CancellationToken] = None
+    ) -> Dict[str, Any]:
+        """
+        Vygeneruje komponent a opravuje ho, kým nedosiahne cieľové skóre
+
+        Args:
+            component_type: Typ komponentu
+            props: Vlastnosti komponentu (variant, size, text...)
+            template_variant: Variant HTML šablóny
+            min_score: Skóre, pri ktorom sa opravy zastavia
+            max_fix_iterations: Najviac opravných kôl (0 = len validácia)
+            strict: Prísna validácia
+            session_id: Session, do ktorej sa uloží výsledný artefakt
+            token: Token zrušenia (predvolene token aktuálneho volania)
+
+        Returns:
+            Výsledné HTML, posledná validácia, dôvod ukončenia a časy krokov
+        """
+        token = token or current_token()
+        max_fix_iterations = max(0, min(max_fix_iterations, MAX_FIX_ITERATIONS))
+        generator = subsystems.get("generator")
+        validator = subsystems.get("validator")
+        stages: List[Dict[str, Any]] = []
+        started = time.perf_counter()
+
+        def record(stage: str, stage_started: float, **details) -> Dict[str, Any]:
+            entry = {"stage": stage, "ms": round((time.perf_counter() - stage_started) * 1000, 3), **details}
+            stages.append(entry)
+            return entry
+
+        try:
+            stage_started = time.perf_counter()
+            html = await generator.generate_component(
+                component_type=component_type,
+                props=props,
+                template_variant=template_variant
+            )
+            record("generate", stage_started, bytes=len(html))
+
+            stage_started = time.perf_counter()
+            tree = BeautifulSoup(html, 'html.parser')
+            record("parse", stage_started)
+
+            iterations = 0
+            # Serializácia stromu pred opravou - surový výstup generátora sa od nej
+            # líši v medzerách, porovnanie s ním by hlásilo zmenu vždy
+            serialized: Optional[str] = None
+            while True:
+                stage_started = time.perf_counter()
+                result = await validator.validate_component(
+                    html, strict=strict, token=token, soup=tree,
+                    component_type=component_type
+                )
+                record("validate", stage_started, iteration=iterations, score=round(result.score, 2))
+
+                # Neúplná validácia (vypršaný limit) nemá spoľahlivé skóre
+                if result.truncated:
+                    stop_reason = STOP_DEADLINE
+                    break
+                if result.score >= min_score:
+                    stop_reason = STOP_SCORE_REACHED
+                    break
+                if iterations >= max_fix_iterations:
+                    stop_reason = STOP_MAX_ITERATIONS
+                    break
+                if not token.proceed("fix"):
+                    stop_reason = STOP_DEADLINE
+                    break
+
+                # Oprava mení strom na mieste - ďalšia validácia ho neparsuje znova
+                stage_started = time.perf_counter()
+                if serialized is None:
+                    serialized = str(tree)
+                validator.fix_tree(tree)
+                fixed = str(tree)
+                iterations += 1
+                record("fix", stage_started, iteration=iterations, changed=fixed != serialized)
+                if fixed == serialized:
+                    stop_reason = STOP_NO_CHANGES
+                    break
+                html = serialized = fixed
+
+            response = {
+                "html": html,
+                "component_type": component_type,
+                "score": result.score,
+                "valid": result.valid,
+                "iterations": iterations,
+                "stop_reason": stop_reason,
+                "validation": result.dict(),
+                "stages": stages,
+                "total_ms": round((time.perf_counter() - started) * 1000, 3)
+            }
+
+            if session_id is not None:
+                # Strom už pipeline nemení - uloží sa s artefaktom do cache
+                response["artifact"] = subsystems.get("artifact_store").put(session_id, html, tree)
+
+            return response
+
+        except OperationCancelled:
+            logger.info("Pipeline komponentu zrušený klientom")
+            raise
+        except Exception as e:
+            logger.error(f"Chyba v pipeline komponentu {component_type}: {e}")
+            return {
+                "error": str(e),
+                "component_type": component_type,
+                "stages": stages
+            }
+
+
+# Globálna inštancia pipeline - vytvorí sa pri prvom prístupe (PEP 562)
+def __getattr__(name: str):
+    if name == "component_pipeline":
+        return subsystems.get("component_pipeline")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
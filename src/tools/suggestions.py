@@ -4,8 +4,8 @@ Inteligentné návrhy pre Flowbite komponenty
 
 import re
 import logging
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 from ..config import get_config
@@ -16,6 +16,8 @@ from ..models.component import (
     ComponentSize,
     ComponentProps
 )
+from ..utils.cancellation import CancellationToken, OperationCancelled, current_token
+from .fingerprint import fingerprint_index
 
 # Konfigurácia
 config = get_config()
@@ -53,6 +55,55 @@ class ContextKeyword:
     page_types: List[PageType]
 
 
+# Predkompilované detektory pre analýzu layoutu
+SEMANTIC_TAGS = frozenset(['nav', 'header', 'main', 'footer', 'section', 'article'])
+LANDMARK_TAGS = ('nav', 'header', 'main', 'footer')
+INTERACTIVE_TAGS = frozenset(['button', 'a', 'input', 'select', 'textarea'])
+SUBMIT_TAGS = frozenset(['button', 'input'])
+# (CSS marker, povolené tagy alebo None pre všetky, vzor triedy)
+CLASS_DETECTORS: Tuple[Tuple[str, Optional[frozenset], "re.Pattern[str]"], ...] = (
+    ("btn", frozenset(['a']), re.compile(r'btn')),
+    ("card", None, re.compile(r'card')),
+    ("modal", None, re.compile(r'modal')),
+)
+RESPONSIVE_PREFIX_RE = re.compile(r'(?:sm|md|lg|xl):')
+# Po koľkých elementoch sa pri prechode stromom kontroluje token zrušenia
+SCAN_CHECK_INTERVAL = 512
+
+# (komponent, tagy, CSS marker) - poradie určuje poradie vo výsledku
+COMPONENT_DETECTORS: Tuple[Tuple[str, Tuple[str, ...], Optional[str]], ...] = (
+    ("button", ("button",), "btn"),
+    ("form", ("form",), None),
+    ("navbar", ("nav",), None),
+    ("card", (), "card"),
+    ("modal", (), "modal"),
+    ("table", ("table",), None),
+)
+
+
+@dataclass
+class LayoutScan:
+    """Výsledok jedného prechodu HTML stromom"""
+    total_elements: int = 0
+    max_depth: int = 0
+    semantic_elements: int = 0
+    interactive_elements: int = 0
+    images_without_alt: int = 0
+    forms_without_submit: int = 0
+    tag_counts: Dict[str, int] = field(default_factory=dict)
+    class_markers: Set[str] = field(default_factory=set)
+    # Typy/varianty rozpoznané podľa odtlačkov CSS tried
+    fingerprint_variants: Dict[str, Set[str]] = field(default_factory=dict)
+    
+    def count(self, *tags: str) -> int:
+        """Počet elementov s danými tagmi"""
+        return sum(self.tag_counts.get(tag, 0) for tag in tags)
+    
+    def has_component(self, component: str) -> bool:
+        """Či layout obsahuje komponent (CSS marker alebo odtlačok)"""
+        return component in self.class_markers or component in self.fingerprint_variants
+
+
 class FlowbiteSuggestionEngine:
     """Engine pre generovanie inteligentných návrhov"""
     
@@ -221,20 +272,26 @@ class FlowbiteSuggestionEngine:
         context: str,
         page_type: str = "general",
         framework: str = "html",
-        max_suggestions: int = 5
+        max_suggestions: int = 5,
+        token: Optional[CancellationToken] = None
     ) -> List[ComponentSuggestion]:
         """
         Navrhne komponenty na základe kontextu
         
+        Návrhy vznikajú v troch prechodoch (kľúčové slová, typ stránky,
+        vzory). Po vypršaní limitu tokenu sa zvyšné prechody preskočia.
+        
         Args:
             context: Popis toho, čo užívateľ potrebuje
             page_type: Typ stránky
             framework: Framework
             max_suggestions: Maximum návrhov
+            token: Token zrušenia (predvolene token aktuálneho volania)
             
         Returns:
             Zoznam navrhnutých komponentov
         """
+        token = token or current_token()
         try:
             suggestions = []
             
@@ -254,22 +311,26 @@ class FlowbiteSuggestionEngine:
             suggestions.extend(keyword_suggestions)
             
             # Generovanie návrhov na základe typu stránky
-            page_suggestions = self._generate_page_type_suggestions(
-                page_enum, context, max_suggestions - len(suggestions)
-            )
-            suggestions.extend(page_suggestions)
+            if await token.checkpoint("page_type_suggestions"):
+                page_suggestions = self._generate_page_type_suggestions(
+                    page_enum, context, max_suggestions - len(suggestions)
+                )
+                suggestions.extend(page_suggestions)
             
             # Generovanie návrhov na základe vzory
-            pattern_suggestions = self._generate_pattern_suggestions(
-                context, max_suggestions - len(suggestions)
-            )
-            suggestions.extend(pattern_suggestions)
+            if await token.checkpoint("pattern_suggestions"):
+                pattern_suggestions = self._generate_pattern_suggestions(
+                    context, max_suggestions - len(suggestions)
+                )
+                suggestions.extend(pattern_suggestions)
             
             # Zoradenieie podľa confidence
             suggestions.sort(key=lambda x: x.confidence, reverse=True)
             
             return suggestions[:max_suggestions]
             
+        except OperationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Chyba pri generovaní návrhov: {e}")
             return []
@@ -521,138 +582,190 @@ class FlowbiteSuggestionEngine:
         
         return use_cases.get(component_type, f"Všeobecné použitie pre {keyword}")
     
-    async def analyze_layout(self, html_code: str) -> Dict[str, Any]:
-        """Analyzuje existujúci layout a navrhne vylepšenia"""
+    async def analyze_layout(
+        self,
+        html_code: str,
+        token: Optional[CancellationToken] = None,
+        soup: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyzuje existujúci layout a navrhne vylepšenia
+        
+        Po vypršaní limitu tokenu sa prechod stromom ukončí a zvyšné
+        analýzy sa preskočia - výsledok má truncated a skipped. Už
+        rozparsovaný strom (soup, napr. z cache artefaktov) sa len číta.
+        """
+        token = token or current_token()
         try:
-            from bs4 import BeautifulSoup
+            if soup is None:
+                from bs4 import BeautifulSoup
+                soup = BeautifulSoup(html_code, 'html.parser')
+            
+            scan = self._scan_layout(soup, token)
             
-            soup = BeautifulSoup(html_code, 'html.parser')
             analysis = {
-                "structure": {},
-                "components_found": [],
-                "missing_components": [],
-                "improvements": [],
+                # Analýza štruktúry
+                "structure": {
+                    "total_elements": scan.total_elements,
+                    "nesting_depth": scan.max_depth,
+                    "has_semantic_elements": scan.semantic_elements > 0,
+                    "interactive_elements": scan.interactive_elements
+                },
+                # Detekcia existujúcich komponentov
+                "components_found": (
+                    self._detect_existing_components(scan) if token.proceed("components_found") else []
+                ),
+                # Návrhy chýbajúcich komponentov
+                "missing_components": (
+                    self._suggest_missing_components(scan) if token.proceed("missing_components") else []
+                ),
+                # Varianty rozpoznané podľa odtlačkov CSS tried
+                "variants_found": {
+                    component: sorted(variants)
+                    for component, variants in scan.fingerprint_variants.items()
+                },
+                # Návrhy vylepšení
+                "improvements": (
+                    self._suggest_layout_improvements(scan, html_code) if token.proceed("improvements") else []
+                ),
                 "accessibility_issues": [],
                 "performance_issues": []
             }
             
-            # Analýza štruktúry
-            analysis["structure"] = {
-                "total_elements": len(soup.find_all()),
-                "nesting_depth": self._calculate_max_depth(soup),
-                "has_semantic_elements": bool(soup.find_all(['nav', 'header', 'main', 'footer', 'section', 'article'])),
-                "interactive_elements": len(soup.find_all(['button', 'a', 'input', 'select', 'textarea']))
-            }
-            
-            # Detekcia existujúcich komponentov
-            analysis["components_found"] = self._detect_existing_components(soup)
-            
-            # Návrhy chýbajúcich komponentov
-            analysis["missing_components"] = self._suggest_missing_components(soup)
-            
-            # Návrhy vylepšení
-            analysis["improvements"] = self._suggest_layout_improvements(soup)
+            if token.truncated:
+                analysis["truncated"] = True
+                analysis["skipped"] = list(token.skipped)
             
             return analysis
             
+        except OperationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Chyba pri analýze layout: {e}")
             return {"error": str(e)}
     
-    def _calculate_max_depth(self, soup) -> int:
-        """Vypočíta maximálnu hĺbku vnorenia"""
-        def get_depth(element, depth=0):
-            if not hasattr(element, 'children'):
-                return depth
+    def _scan_layout(self, soup, token: Optional[CancellationToken] = None) -> LayoutScan:
+        """Jeden prechod stromom - zbiera všetky údaje pre analýzu layoutu"""
+        from bs4 import Tag
+        
+        token = token or current_token()
+        scan = LayoutScan()
+        # Otvorené formuláre na aktuálnej vetve: [hĺbka, má submit]
+        open_forms: List[List[Any]] = []
+        stack = [(child, 1) for child in reversed(soup.contents) if isinstance(child, Tag)]
+        
+        while stack:
+            element, depth = stack.pop()
+            name = element.name
+            
+            scan.total_elements += 1
+            if scan.total_elements % SCAN_CHECK_INTERVAL == 0 and not token.proceed("layout_scan"):
+                break
+            scan.tag_counts[name] = scan.tag_counts.get(name, 0) + 1
+            if depth > scan.max_depth:
+                scan.max_depth = depth
+            
+            # Formuláre mimo aktuálnej vetvy sú uzavreté
+            while open_forms and open_forms[-1][0] >= depth:
+                if not open_forms.pop()[1]:
+                    scan.forms_without_submit += 1
             
-            max_child_depth = depth
-            for child in element.children:
-                if hasattr(child, 'name') and child.name:
-                    child_depth = get_depth(child, depth + 1)
-                    max_child_depth = max(max_child_depth, child_depth)
+            if name in SEMANTIC_TAGS:
+                scan.semantic_elements += 1
+            if name in INTERACTIVE_TAGS:
+                scan.interactive_elements += 1
             
-            return max_child_depth
+            if name == 'form':
+                open_forms.append([depth, False])
+            elif name in SUBMIT_TAGS and open_forms and element.get('type') == 'submit':
+                for form in open_forms:
+                    form[1] = True
+            elif name == 'img' and not element.get('alt'):
+                scan.images_without_alt += 1
+            
+            classes = element.get('class')
+            if classes:
+                class_string = ' '.join(classes) if isinstance(classes, list) else classes
+                for marker, tags, detector in CLASS_DETECTORS:
+                    if (tags is None or name in tags) and detector.search(class_string):
+                        scan.class_markers.add(marker)
+                
+                match = fingerprint_index.best_match(classes if isinstance(classes, list) else classes.split())
+                if match:
+                    variants = scan.fingerprint_variants.setdefault(match.component_type, set())
+                    if match.variant:
+                        variants.add(match.variant)
+            
+            children = element.contents
+            for index in range(len(children) - 1, -1, -1):
+                child = children[index]
+                if isinstance(child, Tag):
+                    stack.append((child, depth + 1))
         
-        return get_depth(soup)
+        for form in open_forms:
+            if not form[1]:
+                scan.forms_without_submit += 1
+        
+        return scan
     
-    def _detect_existing_components(self, soup) -> List[str]:
+    def _detect_existing_components(self, scan: LayoutScan) -> List[str]:
         """Detekuje existujúce Flowbite komponenty"""
         components = []
         
-        # Detekcia buttonov
-        if soup.find('button') or soup.find('a', class_=re.compile(r'.*btn.*')):
-            components.append("button")
-        
-        # Detekcia formov
-        if soup.find('form'):
-            components.append("form")
+        for component, tags, marker in COMPONENT_DETECTORS:
+            if scan.count(*tags) or marker in scan.class_markers:
+                components.append(component)
         
-        # Detekcia navbar
-        if soup.find('nav'):
-            components.append("navbar")
-        
-        # Detekcia card
-        if soup.find(attrs={'class': re.compile(r'.*card.*')}):
-            components.append("card")
-        
-        # Detekcia modal
-        if soup.find(attrs={'class': re.compile(r'.*modal.*')}):
-            components.append("modal")
-        
-        # Detekcia table
-        if soup.find('table'):
-            components.append("table")
+        # Komponenty rozpoznané podľa odtlačkov CSS tried
+        for component in scan.fingerprint_variants:
+            if component not in components:
+                components.append(component)
         
         return components
     
-    def _suggest_missing_components(self, soup) -> List[str]:
+    def _suggest_missing_components(self, scan: LayoutScan) -> List[str]:
         """Navrhne chýbajúce komponenty"""
         suggestions = []
         
         # Ak má formulár ale nemá submit button
-        forms = soup.find_all('form')
-        for form in forms:
-            if not form.find(['button', 'input'], attrs={'type': 'submit'}):
-                suggestions.append("submit button pre formulár")
+        suggestions.extend(["submit button pre formulár"] * scan.forms_without_submit)
         
         # Ak má interaktívne elementy ale žiadny modal
-        interactive_elements = soup.find_all(['button', 'a'])
-        if len(interactive_elements) > 3 and not soup.find(attrs={'class': re.compile(r'.*modal.*')}):
+        if scan.count('button', 'a') > 3 and not scan.has_component('modal'):
             suggestions.append("modal pre detailné zobrazenie")
         
         # Ak má veľa obsahu ale žiadne karty
-        content_elements = soup.find_all(['div', 'section', 'article'])
-        if len(content_elements) > 5 and not soup.find(attrs={'class': re.compile(r'.*card.*')}):
+        if scan.count('div', 'section', 'article') > 5 and not scan.has_component('card'):
             suggestions.append("card komponenty pre lepšiu organizáciu obsahu")
         
         return suggestions
     
-    def _suggest_layout_improvements(self, soup) -> List[str]:
+    def _suggest_layout_improvements(self, scan: LayoutScan, html_code: str) -> List[str]:
         """Navrhne vylepšenia layoutu"""
         improvements = []
         
         # Kontrola responzívnosti
-        responsive_classes = ['sm:', 'md:', 'lg:', 'xl:']
-        html_content = str(soup)
-        
-        if not any(pattern in html_content for pattern in responsive_classes):
+        if not RESPONSIVE_PREFIX_RE.search(html_code):
             improvements.append("Pridajte responzívne CSS triedy pre lepšie zobrazenie na mobilných zariadeniach")
         
         # Kontrola accessibility
-        images = soup.find_all('img')
-        if any(not img.get('alt') for img in images):
+        if scan.images_without_alt:
             improvements.append("Pridajte alt atribúty pre všetky obrázky")
         
         # Kontrola semantic HTML
-        if not soup.find_all(['nav', 'header', 'main', 'footer']):
+        if not scan.count(*LANDMARK_TAGS):
             improvements.append("Použite semantic HTML elementy (nav, header, main, footer)")
         
         # Kontrola dark mode
-        if 'dark:' not in html_content:
+        if 'dark:' not in html_code:
             improvements.append("Pridajte dark mode podporu pomocou dark: tried")
         
         return improvements
 
 
-# Globálna inštancia suggestion engine
-suggestion_engine = FlowbiteSuggestionEngine()
\ No newline at end of file
+# Globálna inštancia suggestion engine - vytvorí sa pri prvom prístupe (PEP 562)
+def __getattr__(name: str):
+    if name == "suggestion_engine":
+        from ..utils.registry import subsystems
+        return subsystems.get("suggestion_engine")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -2,8 +2,10 @@
 Validátor Flowbite komponentov
 """
 
+import copy
 import re
 import logging
+from contextvars import ContextVar
 from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime
 from bs4 import BeautifulSoup, Tag
@@ -12,11 +14,21 @@ import json
 from ..config import get_config
 from ..models.component import ComponentValidationResult, ComponentType
 from ..models.schema import CSS_CLASSES, ComponentSchema
+from ..utils.cancellation import CancellationToken, OperationCancelled, current_token
+from ..utils.metrics import metrics
+from .fingerprint import fingerprint_index
 
 # Konfigurácia
 config = get_config()
 logger = logging.getLogger(__name__)
 
+# Strom práve validovaného HTML - skupiny pravidiel ho zdieľajú namiesto
+# vlastného parsovania; (html, strom), strom sa vytvorí pri prvom použití
+_current_tree: ContextVar[Optional[list]] = ContextVar("flowbite_validated_tree", default=None)
+
+# Validácie nad už rozparsovaným stromom (cache artefaktov) vs. s vlastným parsovaním
+cache_metrics = metrics.cache("validation")
+
 
 class FlowbiteValidator:
     """Hlavná trieda pre validáciu Flowbite komponentov"""
@@ -70,23 +82,43 @@ class FlowbiteValidator:
             ]
         }
     
+    def warm_up(self):
+        """Zostaví index odtlačkov komponentov vopred (pred forkom workerov)"""
+        fingerprint_index.build()
+        
     async def validate_component(
         self,
         html_code: str,
         component_type: Optional[str] = None,
-        strict: bool = None
+        strict: bool = None,
+        token: Optional[CancellationToken] = None,
+        soup: Optional[BeautifulSoup] = None
     ) -> ComponentValidationResult:
         """
         Hlavná validačná funkcia
         
+        Skupiny pravidiel bežia v poradí dôležitosti. Pred každou sa
+        kontroluje token - zrušenie vyhodí OperationCancelled, po vypršaní
+        limitu sa zvyšné skupiny preskočia a výsledok je truncated.
+        
         Args:
             html_code: HTML kód komponentu
             component_type: Typ komponentu (ak je známy)
             strict: Prísna validácia
+            token: Token zrušenia (predvolene token aktuálneho volania)
+            soup: Už rozparsovaný strom html_code (napr. z cache artefaktov),
+                validácia ho nemení
             
         Returns:
             Výsledok validácie
         """
+        token = token or current_token()
+        if soup is not None:
+            cache_metrics.hit()
+        else:
+            cache_metrics.miss()
+        # HTML sa parsuje najviac raz pre všetky skupiny pravidiel
+        parsed = _current_tree.set([html_code, soup])
         try:
             if strict is None:
                 strict = self.config.strict_validation
@@ -104,53 +136,91 @@ class FlowbiteValidator:
                 validator_version=self.config.version
             )
             
-            # Základná validácia
-            await self._validate_basic_html(html_code, result)
-            
-            # Flowbite špecifická validácia
-            await self._validate_flowbite_patterns(html_code, result)
-            
-            # Accessibility validácia
-            await self._validate_accessibility(html_code, result)
-            
-            # Performance validácia
-            await self._validate_performance(html_code, result)
+            # Skupiny pravidiel v poradí dôležitosti - po vypršaní limitu sa zvyšné preskočia
+            rule_groups = [
+                ("basic_html", self._validate_basic_html),
+                ("flowbite_patterns", self._validate_flowbite_patterns),
+                ("accessibility", self._validate_accessibility),
+                ("performance", self._validate_performance),
+                ("best_practices", self._validate_best_practices)
+            ]
+            for group, validate in rule_groups:
+                if await token.checkpoint(group):
+                    await validate(html_code, result)
             
-            # Best practices validácia
-            await self._validate_best_practices(html_code, result)
+            # Automatická detekcia typu podľa odtlačkov CSS tried
+            if not component_type and html_code and html_code.strip():
+                if token.proceed("type_detection"):
+                    self._detect_component_type(html_code, result)
+                component_type = result.component_type
+            else:
+                result.component_type = component_type
             
             # Typ-špecifická validácia
-            if component_type:
+            if component_type and await token.checkpoint("component_type"):
                 await self._validate_component_type(html_code, component_type, result)
             
+            result.truncated = token.truncated
+            result.skipped_rules = list(token.skipped)
+            
             # Výpočet finálneho skóre
             self._calculate_final_score(result)
             
             return result
             
+        except OperationCancelled:
+            logger.info("Validácia zrušená klientom")
+            raise
         except Exception as e:
             logger.error(f"Chyba pri validácii: {e}")
             return ComponentValidationResult(
                 valid=False,
                 errors=[f"Chyba validátora: {str(e)}"],
+                error_codes=["validator-error"],
                 warnings=[],
                 suggestions=[],
                 score=0.0
             )
+        finally:
+            _current_tree.reset(parsed)
+    
+    def _tree(self, html_code: str) -> BeautifulSoup:
+        """Strom validovaného HTML - parsuje sa raz za validáciu"""
+        current = _current_tree.get()
+        if current is None or current[0] is not html_code:
+            return BeautifulSoup(html_code, 'html.parser')
+        if current[1] is None:
+            current[1] = BeautifulSoup(html_code, 'html.parser')
+        return current[1]
+    
+    def _report(self, result: ComponentValidationResult, kind: str, code: str, message: str):
+        """Zaznamená nález - správu pre ľudí a stabilný kód pre kompaktné odpovede"""
+        getattr(result, kind).append(message)
+        getattr(result, f"{kind[:-1]}_codes").append(code)
+    
+    def _detect_component_type(self, html_code: str, result: ComponentValidationResult):
+        """Určí typ a variantu komponentu podľa odtlačkov CSS tried"""
+        soup = self._tree(html_code)
+        match = fingerprint_index.detect_component(soup)
+        
+        if match:
+            result.component_type = match.component_type
+            result.component_variant = match.variant
+            result.type_detected = True
     
     async def _validate_basic_html(self, html_code: str, result: ComponentValidationResult):
         """Základná HTML validácia"""
         if not html_code or not html_code.strip():
             result.valid = False
-            result.errors.append("Prázdny HTML kód")
+            self._report(result, "errors", "empty-html", "Prázdny HTML kód")
             return
         
         # Parsovanie HTML
         try:
-            soup = BeautifulSoup(html_code, 'html.parser')
+            soup = self._tree(html_code)
         except Exception as e:
             result.valid = False
-            result.errors.append(f"Neplatný HTML: {str(e)}")
+            self._report(result, "errors", "invalid-html", f"Neplatný HTML: {str(e)}")
             return
         
         # Kontrola párových tagov
@@ -171,31 +241,31 @@ class FlowbiteValidator:
         pattern_score = (found_patterns / total_patterns) * 100
         
         if pattern_score < 30:
-            result.warnings.append("Málo Flowbite CSS tried - možno nie je to Flowbite komponent")
+            self._report(result, "warnings", "few-flowbite-classes", "Málo Flowbite CSS tried - možno nie je to Flowbite komponent")
         elif pattern_score < 50:
-            result.suggestions.append("Zvážte pridanie viacerých Flowbite CSS tried")
+            self._report(result, "suggestions", "more-flowbite-classes", "Zvážte pridanie viacerých Flowbite CSS tried")
         
         # Kontrola dark mode podpory
         if "dark:" not in html_code:
-            result.suggestions.append("Pridajte dark mode podporu pomocou 'dark:' prefix tried")
+            self._report(result, "suggestions", "dark-mode-missing", "Pridajte dark mode podporu pomocou 'dark:' prefix tried")
         
         # Kontrola responzívnych tried
         responsive_patterns = [r"sm:", r"md:", r"lg:", r"xl:"]
         responsive_found = any(re.search(pattern, html_code) for pattern in responsive_patterns)
         
         if not responsive_found:
-            result.suggestions.append("Zvážte pridanie responzívnych CSS tried (sm:, md:, lg:, xl:)")
+            self._report(result, "suggestions", "responsive-classes-missing", "Zvážte pridanie responzívnych CSS tried (sm:, md:, lg:, xl:)")
     
     async def _validate_accessibility(self, html_code: str, result: ComponentValidationResult):
         """Accessibility validácia"""
-        soup = BeautifulSoup(html_code, 'html.parser')
+        soup = self._tree(html_code)
         accessibility_issues = 0
         
         # Kontrola obrázkov bez alt atribútu
         images = soup.find_all('img')
         for img in images:
             if not img.get('alt'):
-                result.warnings.append("Obrázok bez alt atribútu")
+                self._report(result, "warnings", "img-alt-missing", "Obrázok bez alt atribútu")
                 accessibility_issues += 1
         
         # Kontrola labelov pre input elementy
@@ -205,10 +275,10 @@ class FlowbiteValidator:
             if input_id:
                 label = soup.find('label', attrs={'for': input_id})
                 if not label:
-                    result.warnings.append(f"Input s ID '{input_id}' nemá príslušný label")
+                    self._report(result, "warnings", "input-label-missing", f"Input s ID '{input_id}' nemá príslušný label")
                     accessibility_issues += 1
             elif input_elem.get('type') not in ['hidden', 'submit', 'button']:
-                result.warnings.append("Input element bez ID a label")
+                self._report(result, "warnings", "input-id-missing", "Input element bez ID a label")
                 accessibility_issues += 1
         
         # Kontrola ARIA atribútov
@@ -221,13 +291,13 @@ class FlowbiteValidator:
                 aria_missing += 1
         
         if aria_missing > 0:
-            result.suggestions.append(f"Zvážte pridanie ARIA atribútov pre {aria_missing} interaktívnych elementov")
+            self._report(result, "suggestions", "aria-missing", f"Zvážte pridanie ARIA atribútov pre {aria_missing} interaktívnych elementov")
         
         # Kontrola fókusovateľnosti
         focusable_elements = soup.find_all(['button', 'a', 'input', 'select', 'textarea'])
         for elem in focusable_elements:
             if elem.get('tabindex') == '-1' and not elem.get('aria-hidden'):
-                result.warnings.append("Element s tabindex='-1' môže byť problematický pre screen readery")
+                self._report(result, "warnings", "negative-tabindex", "Element s tabindex='-1' môže byť problematický pre screen readery")
         
         # Výpočet accessibility skóre
         max_issues = len(images) + len(inputs) + len(interactive_elements)
@@ -241,7 +311,7 @@ class FlowbiteValidator:
         
         # Kontrola veľkosti komponentu
         if len(html_code) > perf_rules["max_component_size"]:
-            result.warnings.append(f"Komponent je príliš veľký ({len(html_code)} znakov)")
+            self._report(result, "warnings", "component-too-large", f"Komponent je príliš veľký ({len(html_code)} znakov)")
             performance_issues += 1
         
         # Kontrola počtu CSS tried
@@ -249,7 +319,7 @@ class FlowbiteValidator:
         total_classes = sum(len(classes.split()) for classes in css_classes)
         
         if total_classes > perf_rules["max_css_classes"]:
-            result.suggestions.append(f"Veľa CSS tried ({total_classes}) - zvážte optimalizáciu")
+            self._report(result, "suggestions", "too-many-classes", f"Veľa CSS tried ({total_classes}) - zvážte optimalizáciu")
             performance_issues += 1
         
         # Kontrola redundantných tried
@@ -258,14 +328,14 @@ class FlowbiteValidator:
             for redundant_group in perf_rules["redundant_classes"]:
                 found_redundant = [cls for cls in classes if any(cls.startswith(prefix) for prefix in redundant_group)]
                 if len(found_redundant) > 1:
-                    result.suggestions.append(f"Redundantné CSS triedy: {', '.join(found_redundant)}")
+                    self._report(result, "suggestions", "redundant-classes", f"Redundantné CSS triedy: {', '.join(found_redundant)}")
         
         # Kontrola vnorenia
-        soup = BeautifulSoup(html_code, 'html.parser')
+        soup = self._tree(html_code)
         max_depth = self._calculate_nesting_depth(soup)
         
         if max_depth > perf_rules["max_nesting_depth"]:
-            result.warnings.append(f"Príliš hlboké vnorenie ({max_depth} úrovní)")
+            self._report(result, "warnings", "nesting-too-deep", f"Príliš hlboké vnorenie ({max_depth} úrovní)")
             performance_issues += 1
         
         # Výpočet performance skóre
@@ -276,28 +346,28 @@ class FlowbiteValidator:
         practices_issues = 0
         
         # Kontrola semantic HTML
-        soup = BeautifulSoup(html_code, 'html.parser')
+        soup = self._tree(html_code)
         
         # Použitie správnych HTML elementov
         if soup.find('div', attrs={'onclick': True}):
-            result.suggestions.append("Používajte <button> namiesto <div> s onclick pre interaktívne elementy")
+            self._report(result, "suggestions", "div-onclick", "Používajte <button> namiesto <div> s onclick pre interaktívne elementy")
             practices_issues += 1
         
         # Kontrola inline štýlov
         if 'style=' in html_code:
-            result.warnings.append("Vyhýbajte sa inline štýlom, používajte CSS triedy")
+            self._report(result, "warnings", "inline-style", "Vyhýbajte sa inline štýlom, používajte CSS triedy")
             practices_issues += 1
         
         # Kontrola JavaScript v HTML
         if any(attr in html_code for attr in ['onclick=', 'onchange=', 'onsubmit=']):
-            result.suggestions.append("Vyhýbajte sa inline JavaScript, používajte event listenery")
+            self._report(result, "suggestions", "inline-script", "Vyhýbajte sa inline JavaScript, používajte event listenery")
         
         # Kontrola SEO friendly atribútov
         links = soup.find_all('a')
         for link in links:
             href = link.get('href')
             if href and href.startswith('http') and not link.get('rel'):
-                result.suggestions.append("Zvážte pridanie rel='noopener' pre externé odkazy")
+                self._report(result, "suggestions", "external-link-rel-missing", "Zvážte pridanie rel='noopener' pre externé odkazy")
         
         # Výpočet best practices skóre
         result.best_practices_score = max(0, 100 - (practices_issues * 20))
@@ -308,7 +378,7 @@ class FlowbiteValidator:
         if not schema:
             return
         
-        soup = BeautifulSoup(html_code, 'html.parser')
+        soup = self._tree(html_code)
         
         if component_type == "button":
             await self._validate_button_specific(soup, result)
@@ -326,15 +396,15 @@ class FlowbiteValidator:
         for button in buttons:
             # Kontrola type atribútu pre button elementy
             if button.name == 'button' and not button.get('type'):
-                result.warnings.append("Button element bez type atribútu")
+                self._report(result, "warnings", "button-type-missing", "Button element bez type atribútu")
             
             # Kontrola textového obsahu
             if not button.get_text(strip=True) and not button.find(['img', 'svg', 'i']):
-                result.errors.append("Button bez textového obsahu alebo ikony")
+                self._report(result, "errors", "button-empty", "Button bez textového obsahu alebo ikony")
             
             # Kontrola disabled stavu
             if button.get('disabled') and 'opacity-50' not in button.get('class', []):
-                result.suggestions.append("Pridajte vizuálnu indikáciu pre disabled button (opacity-50)")
+                self._report(result, "suggestions", "disabled-indicator-missing", "Pridajte vizuálnu indikáciu pre disabled button (opacity-50)")
     
     async def _validate_form_specific(self, soup: BeautifulSoup, result: ComponentValidationResult):
         """Form špecifická validácia"""
@@ -344,18 +414,18 @@ class FlowbiteValidator:
             # Kontrola method atribútu
             method = form.get('method', 'GET').upper()
             if method not in ['GET', 'POST']:
-                result.warnings.append(f"Neštandardná HTTP metóda: {method}")
+                self._report(result, "warnings", "form-method-nonstandard", f"Neštandardná HTTP metóda: {method}")
             
             # Kontrola submit tlačidla
             submit_buttons = form.find_all(['button', 'input'], attrs={'type': 'submit'})
             if not submit_buttons:
-                result.warnings.append("Formulár bez submit tlačidla")
+                self._report(result, "warnings", "form-submit-missing", "Formulár bez submit tlačidla")
             
             # Kontrola required polí
             required_inputs = form.find_all(['input', 'select', 'textarea'], attrs={'required': True})
             for input_elem in required_inputs:
                 if 'required' not in input_elem.get('class', []):
-                    result.suggestions.append("Pridajte vizuálnu indikáciu pre povinné polia")
+                    self._report(result, "suggestions", "required-indicator-missing", "Pridajte vizuálnu indikáciu pre povinné polia")
     
     async def _validate_navbar_specific(self, soup: BeautifulSoup, result: ComponentValidationResult):
         """Navbar špecifická validácia"""
@@ -365,11 +435,11 @@ class FlowbiteValidator:
             # Kontrola brand elementu
             brand = nav.find(['a', 'span'], class_=lambda x: x and 'brand' in ' '.join(x).lower())
             if not brand:
-                result.suggestions.append("Zvážte pridanie brand elementu do navbar")
+                self._report(result, "suggestions", "navbar-brand-missing", "Zvážte pridanie brand elementu do navbar")
             
             # Kontrola responzívneho menu
             if 'lg:flex' in str(nav) and not nav.find(attrs={'id': lambda x: x and 'menu' in x}):
-                result.suggestions.append("Responzívne menu potrebuje ID pre JavaScript funkcionalitu")
+                self._report(result, "suggestions", "navbar-menu-id-missing", "Responzívne menu potrebuje ID pre JavaScript funkcionalitu")
     
     async def _validate_card_specific(self, soup: BeautifulSoup, result: ComponentValidationResult):
         """Card špecifická validácia"""
@@ -378,12 +448,12 @@ class FlowbiteValidator:
         for card in cards:
             # Kontrola štruktúry card
             if not card.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-                result.suggestions.append("Card by mal obsahovať heading element")
+                self._report(result, "suggestions", "card-heading-missing", "Card by mal obsahovať heading element")
             
             # Kontrola obrázka v card
             img = card.find('img')
             if img and not img.get('alt'):
-                result.warnings.append("Obrázok v card bez alt atribútu")
+                self._report(result, "warnings", "card-img-alt-missing", "Obrázok v card bez alt atribútu")
     
     def _check_paired_tags(self, soup: BeautifulSoup, result: ComponentValidationResult):
         """Kontrola párových HTML tagov"""
@@ -399,7 +469,7 @@ class FlowbiteValidator:
             for elem in elements:
                 for attr in required_attrs:
                     if not elem.get(attr):
-                        result.warnings.append(f"{tag_name} element bez povinného {attr} atribútu")
+                        self._report(result, "warnings", f"{tag_name}-{attr}-missing", f"{tag_name} element bez povinného {attr} atribútu")
     
     def _calculate_nesting_depth(self, soup: BeautifulSoup) -> int:
         """Vypočíta maximálnu hĺbku vnorenia"""
@@ -453,7 +523,8 @@ class FlowbiteValidator:
         self,
         html_code: str,
         auto_fix: bool = True,
-        component_type: Optional[str] = None
+        component_type: Optional[str] = None,
+        soup: Optional[BeautifulSoup] = None
     ) -> str:
         """
         Automaticky opraví bežné chyby v komponente
@@ -462,6 +533,7 @@ class FlowbiteValidator:
             html_code: Pôvodný HTML kód
             auto_fix: Či automaticky opraviť
             component_type: Typ komponentu
+            soup: Už rozparsovaný strom html_code - opravuje sa jeho kópia
             
         Returns:
             Opravený HTML kód
@@ -470,23 +542,31 @@ class FlowbiteValidator:
             if not auto_fix:
                 return html_code
             
-            soup = BeautifulSoup(html_code, 'html.parser')
-            
-            # Oprava základných HTML problémov
-            self._fix_basic_html_issues(soup)
-            
-            # Oprava accessibility problémov
-            self._fix_accessibility_issues(soup)
+            soup = copy.copy(soup) if soup is not None else BeautifulSoup(html_code, 'html.parser')
             
-            # Oprava performance problémov
-            self._fix_performance_issues(soup)
-            
-            return str(soup)
+            return str(self.fix_tree(soup))
             
         except Exception as e:
             logger.error(f"Chyba pri oprave komponentu: {e}")
             return html_code
     
+    def fix_tree(self, soup: BeautifulSoup) -> BeautifulSoup:
+        """
+        Opraví bežné chyby priamo v strome (mení ho)
+        
+        Opravený strom sa dá ďalej validovať bez serializácie a parsovania.
+        """
+        # Oprava základných HTML problémov
+        self._fix_basic_html_issues(soup)
+        
+        # Oprava accessibility problémov
+        self._fix_accessibility_issues(soup)
+        
+        # Oprava performance problémov
+        self._fix_performance_issues(soup)
+        
+        return soup
+    
     def _fix_basic_html_issues(self, soup: BeautifulSoup):
         """Opraví základné HTML problémy"""
         # Pridanie type atribútu pre button elementy
@@ -520,5 +600,9 @@ class FlowbiteValidator:
                 elem['class'] = list(dict.fromkeys(classes))
 
 
-# Globálna inštancia validátora
-validator = FlowbiteValidator()
\ No newline at end of file
+# Globálna inštancia validátora - vytvorí sa pri prvom prístupe (PEP 562)
+def __getattr__(name: str):
+    if name == "validator":
+        from ..utils.registry import subsystems
+        return subsystems.get("validator")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""
+Kooperatívne zrušenie a časové limity dlhých operácií
+
+Validátor, návrhy a vyhľadávanie v dokumentácii sa medzi krokmi pýtajú
+tokenu, či môžu pokračovať. Zrušená operácia (klient poslal
+notifications/cancelled) skončí výnimkou OperationCancelled, operácia po
+vypršaní limitu preskočí zvyšné kroky a vráti čiastočný výsledok.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+
+class OperationCancelled(Exception):
+    """Operáciu zrušil klient"""
+
+
+class CancellationToken:
+    """
+    Token zrušenia s voliteľným časovým limitom
+
+    Kroky, ktoré sa pre vypršanie limitu nevykonali, sa zapisujú do
+    skipped - podľa nich sa výsledok označí ako neúplný (truncated).
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Args:
+            timeout: Časový limit v sekundách (None alebo 0 = bez limitu)
+        """
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self.skipped: List[str] = []
+        self._cancelled = False
+
+    def cancel(self):
+        """Zruší operáciu - najbližšia kontrola vyhodí OperationCancelled"""
+        self._cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    @property
+    def expired(self) -> bool:
+        """Či vypršal časový limit"""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    @property
+    def truncated(self) -> bool:
+        """Či sa pre časový limit niektorý krok preskočil"""
+        return bool(self.skipped)
+
+    def remaining(self) -> Optional[float]:
+        """Zostávajúci čas v sekundách (None = bez limitu)"""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    def check(self):
+        """Vyhodí OperationCancelled, ak bola operácia zrušená"""
+        if self._cancelled:
+            raise OperationCancelled()
+
+    def proceed(self, step: str) -> bool:
+        """
+        Rozhodne, či vykonať ďalší krok
+
+        Args:
+            step: Názov kroku (zapíše sa do skipped, ak sa preskočí)
+
+        Returns:
+            False ak vypršal limit - krok treba preskočiť
+        """
+        self.check()
+        if self.expired:
+            self.skipped.append(step)
+            return False
+        return True
+
+    async def checkpoint(self, step: str) -> bool:
+        """Ako proceed(), ale najprv pustí slučku k slovu (doručí sa zrušenie úlohy)"""
+        await asyncio.sleep(0)
+        return self.proceed(step)
+
+
+_current_token: ContextVar[Optional[CancellationToken]] = ContextVar("cancellation_token", default=None)
+
+
+def current_token() -> CancellationToken:
+    """Token aktuálneho volania nástroja (mimo volania token bez limitu)"""
+    token = _current_token.get()
+    return token if token is not None else CancellationToken()
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken) -> Iterator[CancellationToken]:
+    """Nastaví token pre kód v bloku (a úlohy z neho spustené)"""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
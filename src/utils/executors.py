@@ -0,0 +1,159 @@
+"""
+Vykonávanie blokujúcej práce mimo event loopu
+
+CPU náročné nástroje (BeautifulSoup, Jinja, regulárne výrazy) bežia v
+ohraničenom CPU poole, čítanie súborov v I/O poole. Slučka medzitým
+obsluhuje lacné volania - tie nečakajú za 300 ms validáciou.
+
+Pooly sú vláknové: nástroje potrebujú teplé cache subsystémov a token
+zrušenia aktuálneho volania, ktoré sa do iného procesu nedajú preniesť.
+Viac jadier využije pre-fork režim (každý worker má vlastné pooly).
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ..config import get_config
+
+config = get_config()
+logger = logging.getLogger(__name__)
+
+# Event loop vlákna poolu pre korutiny subsystémov
+_thread_state = threading.local()
+
+
+def _run_coroutine(coroutine_function: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+    """Spustí korutinu na vlastnej slučke vlákna (slučka sa používa opakovane)"""
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None:
+        loop = _thread_state.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(coroutine_function(*args, **kwargs))
+
+
+class WorkPool:
+    """
+    Ohraničený pool vlákien s metrikami fronty
+
+    Executor sa vytvorí až pri prvej úlohe - pre-fork master tak pred
+    forkom nespúšťa vlákna. Úlohy bežia v kópii kontextu volajúceho,
+    takže vidia token zrušenia aktuálneho volania nástroja.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        """
+        Args:
+            name: Názov poolu (prefix vlákien a metrík)
+            max_workers: Maximálny počet vlákien
+        """
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.failed = 0
+        self.max_queued = 0
+        self._wait_total = 0.0
+        self._run_total = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=f"flowbite-{self.name}"
+            )
+        return self._executor
+
+    def _execute(self, submitted: float, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """Vykoná úlohu vo vlákne poolu a aktualizuje metriky"""
+        started = time.perf_counter()
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+            self._wait_total += started - submitted
+
+        failed = True
+        try:
+            result = function(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.completed += 1
+                self.failed += failed
+                self._run_total += time.perf_counter() - started
+
+    async def run(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Spustí blokujúcu funkciu v poole
+
+        Args:
+            function: Synchrónna funkcia
+            *args, **kwargs: Jej argumenty
+
+        Returns:
+            Výsledok funkcie
+        """
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, self._execute, time.perf_counter(), function, *args, **kwargs)
+
+        with self._lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+
+        future = asyncio.get_running_loop().run_in_executor(self._get_executor(), call)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # Úloha zrušená ešte vo fronte sa nikdy nespustí
+            if future.cancelled():
+                with self._lock:
+                    self.queued = max(self.queued - 1, 0)
+            raise
+
+    async def run_coroutine(self, coroutine_function: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Spustí async metódu subsystému v poole
+
+        Metódy subsystémov sú async, ale počítajú synchrónne - v poole
+        bežia na slučke vlákna, hlavná slučka zostane voľná.
+        """
+        return await self.run(_run_coroutine, coroutine_function, *args, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Metriky poolu - hĺbka fronty, vyťaženie a priemerné časy"""
+        with self._lock:
+            finished = self.completed or 1
+            return {
+                "max_workers": self.max_workers,
+                "queued": self.queued,
+                "active": self.active,
+                "max_queued": self.max_queued,
+                "completed": self.completed,
+                "failed": self.failed,
+                "avg_wait_ms": round(self._wait_total / finished * 1000, 3),
+                "avg_run_ms": round(self._run_total / finished * 1000, 3)
+            }
+
+    def shutdown(self):
+        """Ukončí vlákna poolu (ďalšia úloha vytvorí nové)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+# Globálne pooly
+cpu_pool = WorkPool("cpu", config.cpu_workers)
+io_pool = WorkPool("io", config.io_workers)
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Metriky všetkých poolov"""
+    return {pool.name: pool.stats() for pool in (cpu_pool, io_pool)}
@@ -0,0 +1,123 @@
+"""
+ASGI middleware pre HTTP transport servera (limit súbežnosti, kompresia)
+"""
+
+import asyncio
+import json
+import logging
+from typing import List
+
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+
+from ..config import get_config
+
+config = get_config()
+logger = logging.getLogger(__name__)
+
+# Odpoveď pri preplnenej fronte požiadaviek (JSON-RPC chyba servera)
+BUSY_BODY = json.dumps({
+    "jsonrpc": "2.0",
+    "id": None,
+    "error": {"code": -32000, "message": "Server je preťažený, skúste to znova"}
+}).encode("utf-8")
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    Obmedzí počet súčasne spracovávaných MCP požiadaviek
+
+    Požiadavky nad limit čakajú vo fronte najviac queue_timeout sekúnd,
+    potom dostanú 503 s Retry-After. GET (dlhotrvajúci SSE stream pre
+    notifikácie) a DELETE (ukončenie session) sa nepočítajú - držali by
+    slot počas celej session.
+    """
+
+    def __init__(self, app, max_concurrency: int = 64, queue_timeout: float = 30.0,
+                 exempt_methods: tuple = ("GET", "DELETE", "OPTIONS")):
+        self.app = app
+        self.max_concurrency = max_concurrency
+        self.queue_timeout = queue_timeout
+        self.exempt_methods = exempt_methods
+        self.active = 0
+        self.rejected = 0
+        # Semafor sa vytvorí až v bežiacej slučke uvicornu
+        self._semaphore = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in self.exempt_methods:
+            await self.app(scope, receive, send)
+            return
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            logger.warning(f"Požiadavka odmietnutá, obsadených {self.active}/{self.max_concurrency} slotov")
+            await self._send_busy(send)
+            return
+
+        self.active += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.active -= 1
+            self._semaphore.release()
+
+    async def _send_busy(self, send):
+        """Odošle 503 odpoveď pre preplnenú frontu"""
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(BUSY_BODY)).encode("ascii")),
+                (b"retry-after", b"1")
+            ]
+        })
+        await send({"type": "http.response.body", "body": BUSY_BODY})
+
+
+def compression_middleware(kind: str = None, minimum_size: int = None) -> List[Middleware]:
+    """
+    Middleware pre kompresiu veľkých odpovedí
+
+    Args:
+        kind: gzip, br alebo none (predvolene z konfigurácie)
+        minimum_size: Menšie odpovede sa nekomprimujú
+
+    Returns:
+        Zoznam middleware (prázdny pre none). Brotli vyžaduje balík
+        brotli-asgi, bez neho sa použije gzip.
+    """
+    kind = (kind or config.http_compression).lower()
+    minimum_size = config.http_compression_min_size if minimum_size is None else minimum_size
+
+    if kind == "none":
+        return []
+
+    if kind == "br":
+        try:
+            from brotli_asgi import BrotliMiddleware
+            # Klienti bez podpory br dostanú gzip
+            return [Middleware(BrotliMiddleware, minimum_size=minimum_size, gzip_fallback=True)]
+        except ImportError:
+            logger.warning("brotli-asgi nie je nainštalovaný, používam gzip kompresiu")
+
+    return [Middleware(GZipMiddleware, minimum_size=minimum_size, compresslevel=6)]
+
+
+def build_http_middleware() -> List[Middleware]:
+    """Middleware HTTP transportu podľa konfigurácie (prvý je najvonkajší)"""
+    middleware = [
+        Middleware(
+            ConcurrencyLimitMiddleware,
+            max_concurrency=config.http_max_concurrency,
+            queue_timeout=config.http_queue_timeout
+        )
+    ]
+    middleware.extend(compression_middleware())
+    return middleware
@@ -0,0 +1,110 @@
+"""
+Report času importu modulov (studený štart servera)
+
+Použitie:
+    python -m src.utils.import_report [modul] [--budget-ms N] [--top N]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Riadok výstupu -X importtime: "import time: self [us] | cumulative | modul"
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def measure_imports(module: str = "src.server") -> Dict[str, Any]:
+    """
+    Zmeria import modulu v čistom procese cez python -X importtime
+
+    Args:
+        module: Meraný modul
+
+    Returns:
+        Celkový čas, vlastný čas meraného modulu (vykonanie jeho tela bez
+        importov, ktoré spustí) a časy jednotlivých modulov (ms), zoradené
+        podľa vlastného času
+    """
+    project_root = Path(__file__).resolve().parent.parent.parent
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [str(project_root), os.environ.get("PYTHONPATH")])
+    ))
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=str(project_root), env=env
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Import {module} zlyhal: {completed.stderr.strip().splitlines()[-1:]}")
+
+    modules: List[Dict[str, Any]] = []
+    total_ms = 0.0
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+
+        self_us, cumulative_us, indent, name = match.groups()
+        modules.append({
+            "module": name,
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000
+        })
+        if not indent.strip(" ") and len(indent) <= 1:
+            # Moduly na najvyššej úrovni - ich kumulatívne časy dávajú celok
+            total_ms += int(cumulative_us) / 1000
+
+    modules.sort(key=lambda m: m["self_ms"], reverse=True)
+    return {
+        "module": module,
+        "total_ms": round(total_ms, 2),
+        "self_ms": next((m["self_ms"] for m in modules if m["module"] == module), 0.0),
+        "modules": modules
+    }
+
+
+def group_by_package(modules: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Súčet vlastných časov podľa top-level balíka (fastmcp, pydantic, src...)"""
+    packages: Dict[str, float] = {}
+    for entry in modules:
+        package = entry["module"].split(".")[0]
+        packages[package] = packages.get(package, 0.0) + entry["self_ms"]
+    return dict(sorted(packages.items(), key=lambda item: item[1], reverse=True))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI - vypíše report a pri prekročení rozpočtu vráti nenulový kód"""
+    parser = argparse.ArgumentParser(description="Report času importu modulov")
+    parser.add_argument("module", nargs="?", default="src.server")
+    parser.add_argument(
+        "--budget-ms", type=float,
+        default=float(os.getenv("IMPORT_TIME_BUDGET_MS", "0")),
+        help="Maximálny celkový čas importu (0 = bez kontroly)"
+    )
+    parser.add_argument("--top", type=int, default=15, help="Počet vypísaných modulov")
+    args = parser.parse_args(argv)
+
+    report = measure_imports(args.module)
+
+    print(f"📦 Import {report['module']}: {report['total_ms']:.1f} ms")
+    print(f"   z toho telo {report['module']}: {report['self_ms']:.1f} ms")
+    print("\nPodľa balíkov:")
+    for package, self_ms in list(group_by_package(report["modules"]).items())[:args.top]:
+        print(f"  {self_ms:9.1f} ms  {package}")
+
+    print("\nNajpomalšie moduly (vlastný čas):")
+    for entry in report["modules"][:args.top]:
+        print(f"  {entry['self_ms']:9.1f} ms  {entry['module']}")
+
+    if args.budget_ms and report["total_ms"] > args.budget_ms:
+        print(f"\n❌ Prekročený rozpočet {args.budget_ms:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
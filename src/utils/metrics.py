@@ -0,0 +1,340 @@
+"""
+Register metrík procesu - počítadlá, merače a histogramy latencie
+
+Zápis na horúcej ceste je len pričítanie k atribútu alebo k prvku
+zoznamu (bez zámku a bez alokácií), takže stojí desiatky až stovky
+nanosekúnd. Súčty, percentily a Prometheus text sa počítajú až pri
+čítaní (nástroj server_stats, HTTP endpoint /metrics).
+
+Modul používa len štandardnú knižnicu - zdieľa ho FastMCP server aj
+zjednodušený server bez závislostí.
+"""
+
+import math
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Prefix mien metrík v Prometheus expozícii
+METRIC_PREFIX = "flowbite_"
+
+# Content-Type Prometheus textového formátu
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram: 4 významné bity mantisy = 16 košov na oktávu, relatívna chyba <= 6,25 %.
+# Hodnoty pod LINEAR_LIMIT majú každá vlastný kôš (presne).
+SIGNIFICANT_BITS = 4
+SUB_BUCKETS = 1 << SIGNIFICANT_BITS
+LINEAR_LIMIT = SUB_BUCKETS * 2
+BUCKET_COUNT = 64 * SUB_BUCKETS
+
+# Percentily v prehľade a v Prometheus summary
+QUANTILES = (0.5, 0.9, 0.99)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Counter:
+    """Monotónne počítadlo"""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: int = 1):
+        self.value += amount
+
+
+class Gauge:
+    """Merač okamžitej hodnoty (napr. rozbehnuté volania)"""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: int = 1):
+        self.value += amount
+
+    def dec(self, amount: int = 1):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class Histogram:
+    """
+    Histogram s logaritmicko-lineárnymi košmi (v štýle HdrHistogram)
+
+    Hodnoty sú celé čísla (mikrosekundy, znaky). Každá oktáva má
+    SUB_BUCKETS košov, kôš sa určí z bit_length a horných bitov hodnoty
+    bez delenia a logaritmov. Percentily vracajú hornú hranicu koša.
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value: int):
+        """Zaznamená nezápornú celočíselnú hodnotu"""
+        if value < LINEAR_LIMIT:
+            index = value if value > 0 else 0
+        else:
+            shift = value.bit_length() - SIGNIFICANT_BITS - 1
+            index = (shift << SIGNIFICANT_BITS) + (value >> shift)
+            if index >= BUCKET_COUNT:
+                index = BUCKET_COUNT - 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @staticmethod
+    def bucket_upper(index: int) -> int:
+        """Najväčšia hodnota, ktorá padne do koša"""
+        if index < LINEAR_LIMIT:
+            return index
+        shift = (index >> SIGNIFICANT_BITS) - 1
+        mantissa = index - (shift << SIGNIFICANT_BITS)
+        return ((mantissa + 1) << shift) - 1
+
+    def quantiles(self, quantiles: Iterable[float] = QUANTILES) -> Dict[float, int]:
+        """Percentily - horná hranica koša, nie viac ako zaznamenané maximum"""
+        counts = list(self.counts)  # Kópia - zápisy z iných vlákien bežia ďalej
+        total = sum(counts)
+        result = {}
+        for quantile in quantiles:
+            if not total:
+                result[quantile] = 0
+                continue
+            rank = max(1, math.ceil(quantile * total))
+            seen = 0
+            for index, bucket_count in enumerate(counts):
+                seen += bucket_count
+                if seen >= rank:
+                    result[quantile] = min(self.bucket_upper(index), self.max)
+                    break
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        """Počet, súčet, priemer, percentily a maximum"""
+        quantiles = self.quantiles()
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": round(self.total / self.count, 2) if self.count else 0,
+            **{f"p{int(quantile * 100)}": value for quantile, value in quantiles.items()},
+            "max": self.max
+        }
+
+
+class CacheCounter:
+    """Zásahy a výpadky jednej cache"""
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self, hits: Counter, misses: Counter):
+        self.hits = hits
+        self.misses = misses
+
+    def hit(self):
+        self.hits.value += 1
+
+    def miss(self):
+        self.misses.value += 1
+
+
+class _Family:
+    """Metriky jedného mena s rôznymi hodnotami labelov"""
+
+    def __init__(self, kind: str, help_text: str, factory: Callable[[], Any]):
+        self.kind = kind
+        self.help = help_text
+        self.factory = factory
+        self.children: Dict[LabelKey, Any] = {}
+
+
+class MetricsRegistry:
+    """
+    Register metrík procesu
+
+    Metriky sa vytvárajú (pod zámkom) pri prvom použití mena a labelov;
+    volajúci si vrátený objekt drží a na horúcej ceste už len zapisuje.
+    Collectors sú funkcie vracajúce štatistiky iných subsystémov
+    (limiter, plánovač, pooly...), volajú sa len pri čítaní.
+    """
+
+    def __init__(self):
+        self._families: Dict[str, _Family] = {}
+        self._collectors: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def _child(self, kind: str, name: str, help_text: str, factory, labels: Dict[str, str]):
+        key: LabelKey = tuple(sorted((label, str(value)) for label, value in labels.items()))
+        family = self._families.get(name)
+        if family is not None:
+            child = family.children.get(key)
+            if child is not None:
+                return child
+
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = _Family(kind, help_text, factory)
+            elif family.kind != kind:
+                raise ValueError(f"Metrika {name} už existuje ako {family.kind}")
+            child = family.children.get(key)
+            if child is None:
+                child = family.children[key] = family.factory()
+            return child
+
+    def counter(self, name: str, help_text: str = "", **labels) -> Counter:
+        """Počítadlo s danými labelmi"""
+        return self._child("counter", name, help_text, Counter, labels)
+
+    def gauge(self, name: str, help_text: str = "", **labels) -> Gauge:
+        """Merač s danými labelmi"""
+        return self._child("gauge", name, help_text, Gauge, labels)
+
+    def histogram(self, name: str, help_text: str = "", **labels) -> Histogram:
+        """Histogram s danými labelmi"""
+        return self._child("summary", name, help_text, Histogram, labels)
+
+    def cache(self, name: str) -> CacheCounter:
+        """Počítadlá zásahov a výpadkov cache"""
+        help_text = "Cache lookups by result"
+        return CacheCounter(
+            self.counter("cache_requests_total", help_text, cache=name, result="hit"),
+            self.counter("cache_requests_total", help_text, cache=name, result="miss")
+        )
+
+    def register_collector(self, name: str, collector: Callable[[], Dict[str, Any]]):
+        """Zaregistruje zdroj štatistík iného subsystému (prepíše rovnaké meno)"""
+        self._collectors[name] = collector
+
+    def _collect(self) -> Dict[str, Any]:
+        collected = {}
+        for name, collector in list(self._collectors.items()):
+            try:
+                collected[name] = collector()
+            except Exception as e:
+                collected[name] = {"error": str(e)}
+        return collected
+
+    def cache_ratios(self) -> Dict[str, Dict[str, Any]]:
+        """Zásahy, výpadky a úspešnosť jednotlivých caches"""
+        family = self._families.get("cache_requests_total")
+        caches: Dict[str, Dict[str, Any]] = {}
+        if family is None:
+            return caches
+        for key, counter in list(family.children.items()):
+            labels = dict(key)
+            entry = caches.setdefault(labels["cache"], {"hits": 0, "misses": 0})
+            entry["hits" if labels["result"] == "hit" else "misses"] += counter.value
+        for entry in caches.values():
+            lookups = entry["hits"] + entry["misses"]
+            entry["hit_ratio"] = round(entry["hits"] / lookups, 3) if lookups else 0.0
+        return caches
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Prehľad všetkých metrík pre nástroj server_stats
+
+        Returns:
+            {"uptime_s", "metrics": {meno: [{labels, hodnota/prehľad}]},
+             "caches": {...}, "subsystems": {collector: štatistiky}}
+        """
+        metrics: Dict[str, List[Dict[str, Any]]] = {}
+        for name, family in list(self._families.items()):
+            entries = []
+            for key, child in list(family.children.items()):
+                value = child.summary() if family.kind == "summary" else child.value
+                entries.append({"labels": dict(key), "value": value})
+            metrics[name] = entries
+
+        return {
+            "uptime_s": round(time.time() - self.started, 1),
+            "metrics": metrics,
+            "caches": self.cache_ratios(),
+            "subsystems": self._collect()
+        }
+
+    def prometheus(self) -> str:
+        """Expozícia v Prometheus textovom formáte (histogramy ako summary)"""
+        lines: List[str] = []
+        for name, family in sorted(self._families.items()):
+            metric = METRIC_PREFIX + name
+            if family.help:
+                lines.append(f"# HELP {metric} {family.help}")
+            lines.append(f"# TYPE {metric} {family.kind}")
+            for key, child in sorted(family.children.items()):
+                if family.kind != "summary":
+                    lines.append(f"{metric}{_labels(key)} {_number(child.value)}")
+                    continue
+                for quantile, value in child.quantiles().items():
+                    lines.append(f"{metric}{_labels(key + (('quantile', str(quantile)),))} {value}")
+                lines.append(f"{metric}_sum{_labels(key)} {child.total}")
+                lines.append(f"{metric}_count{_labels(key)} {child.count}")
+
+        lines.append(f"# TYPE {METRIC_PREFIX}uptime_seconds gauge")
+        lines.append(f"{METRIC_PREFIX}uptime_seconds {round(time.time() - self.started, 1)}")
+
+        # Číselné hodnoty subsystémov ako merače (vnorené kľúče spojené "_")
+        for collector, stats in sorted(self._collect().items()):
+            for path, value in _flatten(stats):
+                metric = METRIC_PREFIX + _metric_name(f"{collector}_{path}")
+                lines.append(f"# TYPE {metric} gauge")
+                lines.append(f"{metric} {_number(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Zahodí všetky metriky (collectors zostávajú)"""
+        with self._lock:
+            self._families.clear()
+            self.started = time.time()
+
+
+def _labels(key: LabelKey) -> str:
+    """Labely v Prometheus zápise"""
+    if not key:
+        return ""
+    escaped = (
+        f'{label}="{value.replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34)).replace(chr(10), " ")}"'
+        for label, value in key
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _number(value: Any) -> str:
+    """Číslo v Prometheus zápise"""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _metric_name(name: str) -> str:
+    """Meno metriky len z povolených znakov"""
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _flatten(stats: Any, prefix: str = ""):
+    """Číselné listy vnorených štatistík ako (cesta, hodnota)"""
+    if isinstance(stats, dict):
+        for key, value in stats.items():
+            yield from _flatten(value, f"{prefix}_{key}" if prefix else str(key))
+    elif isinstance(stats, (int, float)) and not (isinstance(stats, float) and math.isnan(stats)):
+        yield prefix, stats
+
+
+# Globálny register metrík
+metrics = MetricsRegistry()
@@ -0,0 +1,146 @@
+"""
+Pre-fork režim HTTP servera
+
+Master načíta katalóg, šablóny a indexy, zmrazí ich pre garbage collector
+a spustí N workerov cez fork(). Workery zdieľajú tieto stránky pamäte
+copy-on-write a každý beží vo vlastnom procese (vlastný GIL).
+"""
+
+import gc
+import logging
+import os
+import signal
+import socket
+import time
+from typing import Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Pauza pred znovuspustením padnutého workera (ochrana pred cyklom pádov)
+RESPAWN_DELAY = 1.0
+
+
+def bind_sockets(host: str, port: int, count: int, backlog: int = 2048) -> List[socket.socket]:
+    """
+    Vytvorí počúvajúce sockety pre workery
+
+    S SO_REUSEPORT dostane každý worker vlastný socket na rovnakom porte
+    a jadro rozdeľuje nové spojenia medzi ne rovnomerne. Bez neho
+    workery zdieľajú jeden socket.
+
+    Args:
+        host: Adresa
+        port: Port (0 = voľný port, ostatné sockety použijú ten istý)
+        count: Počet workerov
+        backlog: Dĺžka fronty spojení
+
+    Returns:
+        Zoznam socketov (1 alebo count)
+    """
+    reuse_port = hasattr(socket, "SO_REUSEPORT")
+    address = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)[0]
+    family, sockaddr = address[0], address[4]
+
+    sockets = []
+    for _ in range(count if reuse_port else 1):
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if reuse_port:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind(sockaddr)
+        sock.listen(backlog)
+        sock.set_inheritable(True)
+        sockets.append(sock)
+        # Pri porte 0 musia ďalšie sockety počúvať na už pridelenom porte
+        sockaddr = sock.getsockname()
+
+    return sockets
+
+
+class PreforkServer:
+    """
+    Master proces, ktorý spúšťa a stráži workery
+
+    Worker, ktorý skončí, sa nahradí novým na tom istom sockete.
+    SIGTERM/SIGINT mastera sa prepošle workerom a master počká na ich
+    ukončenie.
+    """
+
+    def __init__(self, serve: Callable[[socket.socket], None], sockets: List[socket.socket], workers: int):
+        """
+        Args:
+            serve: Funkcia workera - obsluhuje daný socket až do ukončenia
+            sockets: Sockety z bind_sockets()
+            workers: Počet workerov
+        """
+        self.serve = serve
+        self.sockets = sockets
+        self.workers = workers
+        self._children: Dict[int, int] = {}  # pid -> slot
+        self._stopping = False
+
+    def _spawn(self, slot: int):
+        """Spustí workera pre daný slot"""
+        pid = os.fork()
+        if pid:
+            self._children[pid] = slot
+            return
+
+        # Worker - signály rieši uvicorn, master ich len preposiela
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+        exit_code = 0
+        try:
+            sock = self.sockets[slot % len(self.sockets)]
+            for other in self.sockets:
+                if other is not sock:
+                    other.close()
+            self.serve(sock)
+        except BaseException as e:
+            logger.error(f"Chyba workera {os.getpid()}: {e}")
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _stop(self, signum, frame):
+        """Ukončí workery a zastaví ich obnovovanie"""
+        self._stopping = True
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self):
+        """Spustí workery a čaká, kým nie sú všetky ukončené"""
+        # Objekty načítané v masteri sa presunú do permanentnej generácie -
+        # GC workerov ich neprechádza, takže nezapisuje do ich stránok
+        gc.collect()
+        gc.freeze()
+        logger.info(f"Pre-fork: {self.workers} workerov, zmrazených {gc.get_freeze_count()} objektov")
+
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        for slot in range(self.workers):
+            self._spawn(slot)
+
+        while self._children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+
+            slot = self._children.pop(pid, None)
+            if slot is None or self._stopping:
+                continue
+
+            logger.warning(f"Worker {pid} skončil (stav {status}), spúšťam nový")
+            time.sleep(RESPAWN_DELAY)
+            if not self._stopping:
+                self._spawn(slot)
+
+        for sock in self.sockets:
+            sock.close()
+        logger.info("Pre-fork server ukončený")
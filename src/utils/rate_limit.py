@@ -0,0 +1,138 @@
+"""
+Token-bucket obmedzenie počtu volaní nástrojov na klienta
+
+Modul používa len štandardnú knižnicu - zdieľa ho FastMCP server aj
+zjednodušený server bez závislostí.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# JSON-RPC kód chyby pri prekročení limitu (rozsah serverových chýb, ako HTTP 429)
+RATE_LIMIT_ERROR_CODE = -32029
+
+# Maximálny počet sledovaných klientov - najdlhšie nečinní sa zahodia
+MAX_TRACKED_CLIENTS = 10000
+
+
+class RateLimitExceeded(Exception):
+    """Klient prekročil limit volaní"""
+
+    def __init__(self, client_id: str, retry_after: float, limit_per_minute: float):
+        self.client_id = client_id
+        self.retry_after = retry_after
+        self.limit_per_minute = limit_per_minute
+        super().__init__(f"Prekročený limit {limit_per_minute:g} volaní za minútu, skúste znova o {retry_after:.1f} s")
+
+    def to_error(self) -> Dict[str, Any]:
+        """JSON-RPC chybový objekt s časom, kedy sa oplatí skúsiť znova"""
+        return {
+            "code": RATE_LIMIT_ERROR_CODE,
+            "message": str(self),
+            "data": {
+                "retry_after": round(self.retry_after, 3),
+                "limit_per_minute": self.limit_per_minute,
+                "client": self.client_id
+            }
+        }
+
+
+class TokenBucketLimiter:
+    """
+    Token bucket pre každého klienta
+
+    Vedro má kapacitu burst tokenov a dopĺňa sa rýchlosťou
+    rate_per_minute / 60 za sekundu. Každé volanie stojí jeden token
+    (alebo cost). Kontrola je O(1): jedno vyhľadanie v slovníku a pár
+    aritmetických operácií, bez fronty časových značiek.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: Optional[float] = None,
+                 max_clients: int = MAX_TRACKED_CLIENTS):
+        """
+        Args:
+            rate_per_minute: Trvalá rýchlosť volaní (0 = bez obmedzenia)
+            burst: Kapacita vedra - koľko volaní prejde naraz po nečinnosti
+            max_clients: Limit sledovaných klientov (LRU)
+        """
+        self.max_clients = max_clients
+        # klient -> [tokeny, čas poslednej aktualizácie]; poradie = posledné použitie
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+        self.rejected_by_client: Dict[str, int] = {}
+        self.configure(rate_per_minute, burst)
+
+    def configure(self, rate_per_minute: float, burst: Optional[float] = None):
+        """Nastaví rýchlosť a kapacitu vedra, stav klientov sa zahodí"""
+        self.rate_per_minute = rate_per_minute
+        self.rate = rate_per_minute / 60.0
+        self.burst = float(burst if burst else max(rate_per_minute / 6.0, 1.0))
+        self.reset()
+
+    @property
+    def enabled(self) -> bool:
+        """Obmedzenie je aktívne len pri kladnej rýchlosti"""
+        return self.rate > 0
+
+    def try_acquire(self, client_id: str, cost: float = 1.0) -> float:
+        """
+        Pokúsi sa minúť tokeny klienta
+
+        Args:
+            client_id: Identifikátor klienta
+            cost: Počet tokenov
+
+        Returns:
+            0.0 ak volanie prešlo, inak počet sekúnd do doplnenia tokenov
+        """
+        if not self.enabled:
+            self.allowed += 1
+            return 0.0
+
+        now = time.monotonic()
+        bucket = self._buckets.get(client_id)
+        if bucket is None:
+            bucket = [self.burst, now]
+            self._buckets[client_id] = bucket
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client_id)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+
+        if bucket[0] >= cost:
+            bucket[0] -= cost
+            self.allowed += 1
+            return 0.0
+
+        self.rejected += 1
+        if client_id in self.rejected_by_client or len(self.rejected_by_client) < self.max_clients:
+            self.rejected_by_client[client_id] = self.rejected_by_client.get(client_id, 0) + 1
+        return (cost - bucket[0]) / self.rate
+
+    def acquire(self, client_id: str, cost: float = 1.0):
+        """Ako try_acquire, ale pri prekročení limitu vyhodí RateLimitExceeded"""
+        retry_after = self.try_acquire(client_id, cost)
+        if retry_after:
+            raise RateLimitExceeded(client_id, retry_after, self.rate_per_minute)
+
+    def stats(self) -> Dict[str, Any]:
+        """Počítadlá limitu"""
+        return {
+            "limit_per_minute": self.rate_per_minute,
+            "burst": self.burst,
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "clients": len(self._buckets),
+            "rejected_by_client": dict(
+                sorted(self.rejected_by_client.items(), key=lambda item: item[1], reverse=True)[:10]
+            )
+        }
+
+    def reset(self):
+        """Zahodí stav všetkých klientov a počítadlá"""
+        self._buckets.clear()
+        self.allowed = 0
+        self.rejected = 0
+        self.rejected_by_client.clear()
@@ -0,0 +1,128 @@
+"""
+Register subsystémov servera vytváraných až pri prvom použití
+"""
+
+import importlib
+import logging
+import threading
+import time
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Názov subsystému -> "modul:trieda" (modul sa importuje až pri prvom použití)
+DEFAULT_SUBSYSTEMS: Dict[str, str] = {
+    "generator": "src.tools.generator:FlowbiteGenerator",
+    "validator": "src.tools.validator:FlowbiteValidator",
+    "suggestion_engine": "src.tools.suggestions:FlowbiteSuggestionEngine",
+    "component_db": "src.resources.component_db:ComponentDatabase",
+    "documentation_manager": "src.resources.documentation:DocumentationManager",
+    "job_queue": "src.tools.jobs:JobQueue",
+    "artifact_store": "src.tools.artifacts:ArtifactStore",
+    "component_pipeline": "src.tools.pipeline:ComponentPipeline"
+}
+
+
+class SubsystemRegistry:
+    """
+    Lenivý register zdieľaných inštancií
+
+    Každý subsystém sa vytvorí raz, pri prvom get(). Zaznamenáva sa čas
+    importu modulu a konštrukcie, aby bol studený štart merateľný.
+    """
+
+    def __init__(self, factories: Dict[str, str] = None):
+        self._factories: Dict[str, str] = dict(factories or {})
+        self._instances: Dict[str, Any] = {}
+        self._timings: Dict[str, Dict[str, float]] = {}
+        # RLock - konštruktor subsystému môže žiadať iný subsystém
+        self._lock = threading.RLock()
+
+    def register(self, name: str, target: str):
+        """
+        Zaregistruje subsystém
+
+        Args:
+            name: Názov subsystému
+            target: "balík.modul:Trieda" - volá sa bez argumentov
+        """
+        with self._lock:
+            self._factories[name] = target
+            self._instances.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        """Vráti inštanciu subsystému, pri prvom volaní ju vytvorí"""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            if name in self._instances:
+                return self._instances[name]
+
+            if name not in self._factories:
+                raise KeyError(f"Neznámy subsystém: {name}")
+
+            module_name, _, attribute = self._factories[name].partition(":")
+
+            started = time.perf_counter()
+            factory = getattr(importlib.import_module(module_name), attribute)
+            imported = time.perf_counter()
+            instance = factory()
+            created = time.perf_counter()
+
+            self._instances[name] = instance
+            self._timings[name] = {
+                "import_ms": round((imported - started) * 1000, 2),
+                "init_ms": round((created - imported) * 1000, 2)
+            }
+            logger.debug(
+                f"Subsystém {name} vytvorený: import {self._timings[name]['import_ms']} ms, "
+                f"init {self._timings[name]['init_ms']} ms"
+            )
+            return instance
+
+    def warm_up(self, names: List[str] = None):
+        """
+        Vytvorí subsystémy a zavolá ich warm_up() (ak ho majú)
+
+        Pred-fork master tak načíta katalóg, šablóny a indexy raz a
+        workery ich zdieľajú.
+        """
+        for name in names or list(self._factories):
+            instance = self.get(name)
+            hook = getattr(instance, "warm_up", None)
+            if hook is None:
+                continue
+
+            started = time.perf_counter()
+            hook()
+            self._timings[name]["warm_up_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+    def is_created(self, name: str) -> bool:
+        """Kontrola, či už subsystém existuje"""
+        return name in self._instances
+
+    def reset(self, name: str = None):
+        """Zahodí inštanciu (alebo všetky) - ďalší get() ju vytvorí znovu"""
+        with self._lock:
+            if name is None:
+                self._instances.clear()
+                self._timings.clear()
+            else:
+                self._instances.pop(name, None)
+                self._timings.pop(name, None)
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """Stav a časy vytvorenia všetkých subsystémov"""
+        return {
+            name: {
+                "created": name in self._instances,
+                **self._timings.get(name, {})
+            }
+            for name in self._factories
+        }
+
+
+# Globálny register subsystémov
+subsystems = SubsystemRegistry(DEFAULT_SUBSYSTEMS)
@@ -0,0 +1,109 @@
+"""
+Režim odpovedí nástrojov - úplný (full) alebo kompaktný (compact)
+
+Kompaktné odpovede sú určené pre LLM klientov, ktorým veľkosť odpovede
+priamo určuje cenu (tokeny) aj latenciu: obsahujú len HTML, skóre a
+stabilné kódy nálezov namiesto viet, JSON bez odsadenia a medzier.
+
+Modul používa len štandardnú knižnicu - zdieľa ho FastMCP server aj
+zjednodušený server bez závislostí.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+FULL = "full"
+COMPACT = "compact"
+RESPONSE_MODES = (FULL, COMPACT)
+
+# Maximálny počet sessions s vlastným režimom - najdlhšie nepoužité sa zahodia
+MAX_TRACKED_SESSIONS = 10000
+
+# Separátory JSON bez medzier pre kompaktný režim
+COMPACT_SEPARATORS = (",", ":")
+
+
+def normalize_mode(mode: Optional[str], default: str = FULL) -> str:
+    """
+    Overí názov režimu, None znamená predvolený režim
+
+    Raises:
+        ValueError: Neznámy režim
+    """
+    if mode is None or mode == "":
+        return default
+    mode = str(mode).strip().lower()
+    if mode not in RESPONSE_MODES:
+        raise ValueError(f"Neznámy response_mode '{mode}' - povolené: {', '.join(RESPONSE_MODES)}")
+    return mode
+
+
+def dumps(data: Any, mode: str = FULL) -> str:
+    """JSON podľa režimu - full s odsadením, compact bez medzier"""
+    if mode == COMPACT:
+        return json.dumps(data, ensure_ascii=False, separators=COMPACT_SEPARATORS)
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def compact_validation(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Kompaktný výsledok validácie - platnosť, skóre a kódy nálezov
+
+    Prázdne skupiny kódov sa vynechajú; príznak truncated sa uvedie len
+    pri neúplnej validácii.
+    """
+    compact = {
+        "valid": result.get("valid", False),
+        "score": round(float(result.get("score", 0.0)), 1)
+    }
+    for kind in ("error", "warning", "suggestion"):
+        codes = result.get(f"{kind}_codes")
+        if codes:
+            compact[f"{kind}s"] = codes
+    if result.get("truncated"):
+        compact["truncated"] = True
+    return compact
+
+
+class ResponseModes:
+    """
+    Predvolený režim odpovedí pre jednotlivé sessions
+
+    Explicitný response_mode volania má prednosť pred režimom session,
+    ten pred predvoleným režimom servera.
+    """
+
+    def __init__(self, default: str = FULL, max_sessions: int = MAX_TRACKED_SESSIONS):
+        # Neplatnú konfiguráciu hlási validate_config - tu sa použije full
+        self.default = default if default in RESPONSE_MODES else FULL
+        self.max_sessions = max_sessions
+        self._modes: "OrderedDict[str, str]" = OrderedDict()
+        # Nástroje bežia aj vo vláknach CPU poolu
+        self._lock = threading.Lock()
+
+    def set(self, session_id: str, mode: Optional[str]) -> str:
+        """Nastaví režim session (None vráti session na predvolený režim)"""
+        with self._lock:
+            if mode is None:
+                self._modes.pop(session_id, None)
+                return self.default
+            mode = normalize_mode(mode)
+            self._modes[session_id] = mode
+            self._modes.move_to_end(session_id)
+            while len(self._modes) > max(self.max_sessions, 1):
+                self._modes.popitem(last=False)
+            return mode
+
+    def get(self, session_id: str, override: Optional[str] = None) -> str:
+        """Režim pre volanie - explicitný, inak režim session, inak predvolený"""
+        if override:
+            return normalize_mode(override)
+        with self._lock:
+            return self._modes.get(session_id, self.default)
+
+    def drop(self, session_id: str):
+        """Zabudne režim ukončenej session"""
+        with self._lock:
+            self._modes.pop(session_id, None)
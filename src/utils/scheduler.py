@@ -0,0 +1,223 @@
+"""
+Plánovač volaní nástrojov s prioritnými triedami a férovým poradím klientov
+
+Interaktívne volania (generovanie tlačidla z editora) a hromadné úlohy
+(validácia celého katalógu) zdieľajú jednu inštanciu. Každá trieda má
+podiel na súbežnosti, voľné miesto dostane najprv interaktívna trieda a
+v rámci triedy sa klienti striedajú podľa váženého férového radenia
+(WFQ) - jeden klient s tisíckou požiadaviek nepredbehne ostatných.
+
+Modul používa len štandardnú knižnicu.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+# Poradie tried pri prideľovaní voľného miesta
+PRIORITY_CLASSES = (INTERACTIVE, BULK)
+
+
+class _Waiter:
+    """Požiadavka čakajúca na miesto"""
+
+    __slots__ = ("future", "start", "enqueued")
+
+    def __init__(self, future: "asyncio.Future", start: float):
+        self.future = future
+        self.start = start
+        self.enqueued = time.monotonic()
+
+
+class _PriorityClass:
+    """Fronty klientov a virtuálny čas jednej prioritnej triedy"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.running = 0
+        # klient -> fronta čakajúcich (len neprázdne fronty)
+        self.queues: Dict[str, Deque[_Waiter]] = {}
+        # klient -> virtuálny čas ukončenia jeho poslednej požiadavky
+        self.finish: Dict[str, float] = {}
+        # Virtuálny čas = štartovacia značka naposledy spustenej požiadavky
+        self.clock = 0.0
+        self.dispatched = 0
+        self.wait_total = 0.0
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(queue) for queue in self.queues.values())
+
+
+class PriorityScheduler:
+    """
+    Obmedzenie súbežnosti s prioritnými triedami a WFQ medzi klientmi
+
+    Trieda smie mať naraz najviac ceil(concurrency * share) bežiacich
+    volaní - hromadná trieda s podielom 0.5 tak nikdy neobsadí všetky
+    miesta. Klient s váhou 2 dostane dvojnásobok priepustnosti klienta
+    s váhou 1; drahšie volania (cost) ho posunú vo virtuálnom čase ďalej.
+    """
+
+    def __init__(self, concurrency: int, shares: Optional[Dict[str, float]] = None,
+                 weights: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            concurrency: Celkový počet súčasne bežiacich volaní (0 = bez obmedzenia)
+            shares: Podiel triedy na súbežnosti (predvolene interactive 1.0, bulk 0.5)
+            weights: Váhy klientov (predvolene 1.0)
+        """
+        self.configure(concurrency, shares, weights)
+
+    def configure(self, concurrency: int, shares: Optional[Dict[str, float]] = None,
+                  weights: Optional[Dict[str, float]] = None):
+        """Nastaví súbežnosť, podiely a váhy - stav front sa zahodí"""
+        self.concurrency = concurrency
+        self.shares = {INTERACTIVE: 1.0, BULK: 0.5, **(shares or {})}
+        self.weights = dict(weights or {})
+        self.running = 0
+        self._classes = {
+            name: _PriorityClass(self._class_limit(self.shares[name]))
+            for name in PRIORITY_CLASSES
+        }
+
+    def _class_limit(self, share: float) -> int:
+        if self.concurrency <= 0:
+            return 0
+        return min(self.concurrency, max(1, math.ceil(self.concurrency * share)))
+
+    @property
+    def enabled(self) -> bool:
+        """Plánovanie je aktívne len pri kladnej súbežnosti"""
+        return self.concurrency > 0
+
+    def _can_run(self, priority_class: _PriorityClass) -> bool:
+        return self.running < self.concurrency and priority_class.running < priority_class.limit
+
+    def _tag(self, priority_class: _PriorityClass, client_id: str, cost: float) -> float:
+        """
+        Štartovacia značka požiadavky pri príchode (start-time fair queuing)
+
+        Požiadavka začína vo virtuálnom čase najskôr po skončení predošlej
+        požiadavky toho istého klienta; cena delená váhou ju posunie ďalej.
+        """
+        start = max(priority_class.finish.get(client_id, 0.0), priority_class.clock)
+        priority_class.finish[client_id] = start + cost / self.weights.get(client_id, 1.0)
+        return start
+
+    def _start(self, priority_class: _PriorityClass, start: float):
+        """Započíta spustenie volania"""
+        priority_class.clock = max(priority_class.clock, start)
+        priority_class.running += 1
+        priority_class.dispatched += 1
+        self.running += 1
+
+    def _next_client(self, priority_class: _PriorityClass) -> str:
+        """Klient, ktorého najstaršia čakajúca požiadavka má najmenšiu štartovaciu značku"""
+        return min(priority_class.queues, key=lambda client_id: priority_class.queues[client_id][0].start)
+
+    def _dispatch(self):
+        """Pridelí voľné miesta čakajúcim - najprv vyššej triede"""
+        for name in PRIORITY_CLASSES:
+            priority_class = self._classes[name]
+            while priority_class.queues and self._can_run(priority_class):
+                client_id = self._next_client(priority_class)
+                queue = priority_class.queues[client_id]
+                waiter = queue.popleft()
+                if not queue:
+                    del priority_class.queues[client_id]
+                if waiter.future.done():
+                    continue  # Zrušené počas čakania
+                priority_class.wait_total += time.monotonic() - waiter.enqueued
+                self._start(priority_class, waiter.start)
+                waiter.future.set_result(None)
+
+    def _forget_idle(self, priority_class: _PriorityClass):
+        """Zahodí virtuálny čas klientov, ktorí už nič nečakajú (obmedzí pamäť)"""
+        if len(priority_class.finish) > len(priority_class.queues) + 1024:
+            priority_class.finish = {
+                client_id: finish for client_id, finish in priority_class.finish.items()
+                if client_id in priority_class.queues or finish > priority_class.clock
+            }
+
+    async def acquire(self, client_id: str, priority: str = INTERACTIVE, cost: float = 1.0):
+        """
+        Počká na miesto pre volanie
+
+        Args:
+            client_id: Identifikátor klienta
+            priority: Prioritná trieda (interactive alebo bulk)
+            cost: Relatívna cena volania (napr. podľa veľkosti argumentov)
+        """
+        if not self.enabled:
+            return
+
+        priority_class = self._classes[priority]
+        higher_waiting = any(
+            self._classes[name].queues for name in PRIORITY_CLASSES[:PRIORITY_CLASSES.index(priority) + 1]
+        )
+        start = self._tag(priority_class, client_id, cost)
+        if not higher_waiting and self._can_run(priority_class):
+            self._start(priority_class, start)
+            return
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), start)
+        priority_class.queues.setdefault(client_id, deque()).append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            queue = priority_class.queues.get(client_id)
+            if queue is not None and waiter in queue:
+                queue.remove(waiter)
+                if not queue:
+                    del priority_class.queues[client_id]
+            elif not waiter.future.cancelled():
+                # Miesto už bolo pridelené - uvoľní sa pre ďalšieho
+                self.release(priority)
+            raise
+
+    def release(self, priority: str = INTERACTIVE):
+        """Uvoľní miesto po skončení volania"""
+        if not self.enabled:
+            return
+
+        priority_class = self._classes[priority]
+        priority_class.running -= 1
+        self.running -= 1
+        self._forget_idle(priority_class)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, client_id: str, priority: str = INTERACTIVE, cost: float = 1.0) -> AsyncIterator[None]:
+        """Blok, ktorý beží až po pridelení miesta"""
+        await self.acquire(client_id, priority, cost)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    def stats(self) -> Dict[str, Any]:
+        """Vyťaženie a fronty jednotlivých tried"""
+        return {
+            "concurrency": self.concurrency,
+            "running": self.running,
+            "classes": {
+                name: {
+                    "limit": priority_class.limit,
+                    "running": priority_class.running,
+                    "waiting": priority_class.waiting,
+                    "waiting_clients": len(priority_class.queues),
+                    "dispatched": priority_class.dispatched,
+                    "avg_wait_ms": round(
+                        priority_class.wait_total / (priority_class.dispatched or 1) * 1000, 3
+                    )
+                }
+                for name, priority_class in self._classes.items()
+            }
+        }
@@ -0,0 +1,90 @@
+"""
+Single-flight - súbežné rovnaké volania zdieľajú jeden výpočet
+"""
+
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict
+
+
+def canonical_key(name: str, arguments: Dict[str, Any]) -> str:
+    """
+    Kanonický hash volania - nezáleží na poradí kľúčov ani medzerách
+
+    Args:
+        name: Názov nástroja
+        arguments: Argumenty volania
+
+    Returns:
+        Kľúč v tvare "nástroj:sha256"
+    """
+    encoded = json.dumps(arguments or {}, sort_keys=True, separators=(",", ":"),
+                         ensure_ascii=False, default=str)
+    return f"{name}:{hashlib.sha256(encoded.encode('utf-8')).hexdigest()}"
+
+
+class _Flight:
+    """Prebiehajúci výpočet a počet čakajúcich volaní"""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Zlučovanie rovnakých volaní, ktoré prebiehajú v rovnakom čase
+
+    Prvé volanie s daným kľúčom spustí výpočet ako samostatnú úlohu,
+    ďalšie čakajú na jej výsledok (aj výnimku). Výsledok sa necacheuje -
+    po dokončení ďalšie volanie počíta znova. Ak sa zrušia všetky
+    čakajúce volania, zruší sa aj výpočet.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Vráti výsledok výpočtu pre kľúč, prebiehajúci výpočet zdieľa
+
+        Args:
+            key: Kľúč volania (canonical_key)
+            compute: Funkcia, ktorá vytvorí korutínu výpočtu
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(compute()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._finish(key, flight))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _finish(self, key: str, flight: _Flight):
+        """Odstráni dokončený výpočet (ak ho medzitým nenahradil nový)"""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Počítadlá vykonaných a zlúčených volaní"""
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._flights)
+        }
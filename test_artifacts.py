@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy artefaktov sessions
+Testuje handles adresované obsahom, patche, cache stromov a nástroje nad artefaktmi
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+CARD = '<div class="card p-6 bg-white rounded-lg"><h5 class="text-xl">Titulok</h5><img src="a.png"><a href="#" class="btn">Viac</a></div>'
+
+
+def test_artifact_store():
+    """Test handles, ohraničenia session a patchov"""
+    print("🔍 Testovanie úložiska artefaktov...")
+
+    from src.tools.artifacts import ArtifactStore
+
+    store = ArtifactStore(max_sessions=2, session_bytes=len(CARD) * 2, tree_cache_size=2)
+
+    handle = store.put("a", CARD)
+    same = store.put("a", CARD)
+    other_session_missing = False
+    try:
+        store.get("b", handle)
+    except ValueError:
+        other_session_missing = True
+
+    patched = store.resolve("a", handle=handle, patch=[
+        {"select": "img", "set_attrs": {"alt": "Obrázok"}},
+        {"select": "a", "add_class": "text-blue-700", "remove_class": "btn", "text": "Zobraziť"},
+        {"find": "Titulok", "replace": "Nadpis"}
+    ])
+
+    errors = []
+    for patch in ([{"find": "neexistuje"}], [{"select": "table", "text": "x"}], [{"select": "div"}], "nie zoznam"):
+        try:
+            store.resolve("a", handle=handle, patch=patch)
+        except ValueError as e:
+            errors.append(str(e))
+
+    # Tretí artefakt prekročí limit bajtov session - najstarší ustúpi
+    store.put("a", CARD.replace("Titulok", "Iný titulok"))
+    evicted = False
+    try:
+        store.get("a", handle)
+    except ValueError:
+        evicted = True
+
+    # Tretia session vytlačí najdlhšie nepoužitú
+    store.put("b", CARD)
+    store.put("c", CARD)
+
+    checks = {
+        "handle podľa obsahu": handle == same and handle.startswith("art_"),
+        "oddelené sessions": other_session_missing,
+        "patch stromu a textu": patched.handle != handle
+            and 'alt="Obrázok"' in patched.html
+            and '<a class="text-blue-700" href="#">Zobraziť</a>' in patched.html
+            and "Nadpis" in patched.html and "Titulok" not in patched.html,
+        "pôvodný artefakt nezmenený": "Titulok" in store.tree(handle, CARD).get_text(),
+        "neplatné patche": len(errors) == 4,
+        "limit bajtov session": evicted and store.stats()["evicted"] >= 1,
+        "limit sessions a stromov": store.stats()["sessions"] == 2 and store.stats()["trees"] <= 2
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_tree_reuse():
+    """Test jedného parsovania pri validácii a opravy nad stromom z cache"""
+    print("\n🔍 Testovanie opakovaného použitia stromu...")
+
+    import src.tools.validator as validator_module
+    from src.tools.artifacts import ArtifactStore
+    from src.tools.validator import FlowbiteValidator
+
+    validator = FlowbiteValidator()
+    store = ArtifactStore()
+    parses = []
+    original = validator_module.BeautifulSoup
+
+    def counting_soup(*args, **kwargs):
+        parses.append(1)
+        return original(*args, **kwargs)
+
+    async def run():
+        artifact = store.resolve("s", html=CARD)
+        validator_module.BeautifulSoup = counting_soup
+        try:
+            direct = await validator.validate_component(CARD, strict=False)
+            direct_parses = len(parses)
+            cached = await validator.validate_component(artifact.html, strict=False, soup=artifact.tree)
+            cached_parses = len(parses) - direct_parses
+        finally:
+            validator_module.BeautifulSoup = original
+        fixed = await validator.fix_component(artifact.html, soup=artifact.tree)
+        return direct, cached, direct_parses, cached_parses, fixed, artifact
+
+    direct, cached, direct_parses, cached_parses, fixed, artifact = asyncio.run(run())
+    print(f"   Parsovania: bez stromu {direct_parses}, so stromom {cached_parses}")
+
+    checks = {
+        "jedno parsovanie na validáciu": direct_parses == 1,
+        "strom z cache bez parsovania": cached_parses == 0,
+        "rovnaký výsledok": direct.score == cached.score and direct.warnings == cached.warnings
+            and direct.component_type == cached.component_type,
+        "oprava nemení strom v cache": 'alt=""' in fixed and "alt" not in str(artifact.tree)
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_artifact_tools():
+    """Test nástrojov generate/validate/fix/analyze nad handle"""
+    print("\n🔍 Testovanie nástrojov nad artefaktmi...")
+
+    from fastmcp import Client
+    from src.server import app
+
+    async def run():
+        async with Client(app) as client:
+            generated = (await client.call_tool("generate_component", {
+                "component_type": "button", "variant": "primary", "props": {"text": "Uložiť"}
+            })).data
+            validated = (await client.call_tool("validate_component", {"artifact": generated["artifact"]})).data
+            fixed = (await client.call_tool("fix_component", {"html": CARD})).data
+            patched = (await client.call_tool("validate_component", {
+                "artifact": fixed["artifact"],
+                "patch": [{"select": "img", "set_attrs": {"alt": "Náhľad"}}]
+            })).data
+            layout = (await client.call_tool("analyze_layout", {"artifact": patched["artifact"]})).data
+            unknown = (await client.call_tool("fix_component", {"artifact": "art_0000000000000000"})).data
+            missing = (await client.call_tool("analyze_layout", {})).data
+        return generated, validated, fixed, patched, layout, unknown, missing
+
+    generated, validated, fixed, patched, layout, unknown, missing = asyncio.run(run())
+
+    checks = {
+        "generate_component": "Uložiť" in generated.get("html", "") and generated.get("artifact", "").startswith("art_"),
+        "validácia podľa handle": validated["artifact"] == generated["artifact"] and validated["score"] > 0,
+        "fix_component": fixed["changed"] and 'alt=""' in fixed["html"] and fixed["artifact"] != fixed["source_artifact"],
+        "validácia s patchom": patched["artifact"] not in (fixed["artifact"], generated["artifact"])
+            and "Obrázok bez alt atribútu" not in patched["warnings"],
+        "analyze_layout": layout["structure"]["total_elements"] == 4 and layout["artifact"] == patched["artifact"],
+        "neznámy handle": "error" in unknown and "error" in missing
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_artifacts_over_http():
+    """Test handles len s MCP session - bezstavové HTTP ani pre-fork ich nevydávajú"""
+    print("\n🔍 Testovanie artefaktov cez HTTP...")
+
+    import json
+    from starlette.testclient import TestClient
+    from src.middleware.identity import session_identity, use_stateless_sessions
+    from src.server import app
+
+    headers = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+    def call(client, session, name, arguments):
+        request_headers = {**headers, "mcp-session-id": session} if session else headers
+        response = client.post("/mcp", headers=request_headers, json={
+            "jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {"name": name, "arguments": arguments}
+        })
+        return json.loads(response.json()["result"]["content"][0]["text"])
+
+    def chain(stateless):
+        http_app = app.http_app(path="/mcp", json_response=True, stateless_http=stateless)
+        with TestClient(http_app) as client:
+            initialized = client.post("/mcp", headers=headers, json={
+                "jsonrpc": "2.0", "id": 1, "method": "initialize",
+                "params": {"protocolVersion": "2025-03-26", "capabilities": {},
+                           "clientInfo": {"name": "test", "version": "1"}}
+            })
+            session = initialized.headers.get("mcp-session-id")
+            request_headers = {**headers, "mcp-session-id": session} if session else headers
+            client.post("/mcp", headers=request_headers, json={"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+            generated = call(client, session, "generate_component", {"component_type": "button"})
+            validated = call(client, session, "validate_component", {"artifact": generated["artifact"] or "art_0000000000000000"})
+            return session, generated, validated
+
+    session, generated, validated = chain(stateless=False)
+    _, stateless_generated, stateless_validated = chain(stateless=True)
+
+    use_stateless_sessions()
+    try:
+        prefork_session = session_identity()
+    finally:
+        use_stateless_sessions(False)
+
+    checks = {
+        "handle v session": bool(session) and generated["artifact"].startswith("art_")
+            and validated["artifact"] == generated["artifact"] and "error" not in validated,
+        "bez session bez handle": stateless_generated["artifact"] is None and stateless_generated["html"]
+            and "MCP session" in stateless_validated.get("error", ""),
+        "pre-fork worker bez session": prefork_session is None
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy artefaktov sessions")
+    print("=" * 55)
+
+    tests = [
+        ("Úložisko artefaktov", test_artifact_store),
+        ("Opakované použitie stromu", test_tree_reuse),
+        ("Nástroje nad artefaktmi", test_artifact_tools),
+        ("Artefakty cez HTTP", test_artifacts_over_http)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
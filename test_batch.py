@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy JSON-RPC batchov
+Testuje batch požiadavky v SimpleMCPServer a stdio režime
+"""
+
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+SERVER = str(Path(__file__).parent / "mcp_server_simple.py")
+
+
+def _call(request_id, name: str, arguments: dict) -> dict:
+    """JSON-RPC volanie nástroja"""
+    return {"jsonrpc": "2.0", "id": request_id, "method": "tools/call",
+            "params": {"name": name, "arguments": arguments}}
+
+
+def test_handle_payload():
+    """Test spracovania batchu"""
+    print("🔍 Testovanie batchu v handle_payload...")
+
+    from mcp_server_simple import SimpleMCPServer
+
+    server = SimpleMCPServer()
+
+    async def slow_generate(component_type: str, **kwargs):
+        await asyncio.sleep(0.2)
+        return {"content": [{"type": "text", "text": component_type}]}
+
+    server.generate_component = slow_generate
+
+    async def run():
+        started = time.perf_counter()
+        batch = await server.handle_payload([
+            _call(1, "generate_component", {"component_type": "button"}),
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            _call(2, "generate_component", {"component_type": "card"}),
+            _call(3, "generate_component", {"component_type": "modal"}),
+            42,
+            {"jsonrpc": "2.0", "id": 4},
+            {"jsonrpc": "2.0", "method": 5},
+            {"jsonrpc": "2.0", "id": {"x": 1}}
+        ])
+        elapsed = time.perf_counter() - started
+
+        notifications_only = await server.handle_payload([
+            {"jsonrpc": "2.0", "method": "notifications/initialized"}
+        ])
+        empty = await server.handle_payload([])
+        single = await server.handle_payload({"jsonrpc": "2.0", "id": 9, "method": "tools/list"})
+        notification = await server.handle_payload({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        return batch, elapsed, notifications_only, empty, single, notification
+
+    batch, elapsed, notifications_only, empty, single, notification = asyncio.run(run())
+    print(f"   Batch 3 volaní po 200 ms: {elapsed * 1000:.0f} ms")
+
+    checks = {
+        "jedno pole odpovedí": isinstance(batch, list) and [r["id"] for r in batch] == [1, 2, 3, None, 4, None, None],
+        "poradie výsledkov": [r["result"]["content"][0]["text"] for r in batch[:3]] == ["button", "card", "modal"],
+        "súbežné volania": elapsed < 0.5,
+        "neplatný prvok": all(r["error"]["code"] == -32600 for r in batch[3:]),
+        "len notifikácie": notifications_only is None,
+        "prázdny batch": isinstance(empty, dict) and empty["error"]["code"] == -32600,
+        "jedna správa": single["id"] == 9 and "result" in single,
+        "notifikácia bez odpovede": notification is None
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_stdio_batch():
+    """Test batchu cez stdio"""
+    print("\n🔍 Testovanie batchu cez stdio...")
+
+    lines = [
+        json.dumps([
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {}}
+        ]),
+        json.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"}),
+        "{nie je json",
+        json.dumps(_call(3, "generate_component", {"component_type": "button"}))
+    ]
+    completed = subprocess.run(
+        [sys.executable, SERVER, "--stdio"],
+        input="\n".join(lines) + "\n", capture_output=True, text=True, timeout=30
+    )
+    responses = [json.loads(line) for line in completed.stdout.splitlines() if line.strip()]
+
+    # Správy bežia súbežne - odpovede sa párujú podľa obsahu, nie poradia
+    batches = [r for r in responses if isinstance(r, list)]
+    single = {r.get("id"): r for r in responses if isinstance(r, dict)}
+
+    checks = {
+        "počet odpovedí": len(responses) == 3,
+        "batch": len(batches) == 1 and [r["id"] for r in batches[0]] == [1, 2],
+        "parse error": single.get(None, {}).get("error", {}).get("code") == -32700,
+        "volanie po batchi": "result" in single.get(3, {})
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy JSON-RPC batchov")
+    print("=" * 55)
+
+    tests = [
+        ("Batch v handle_payload", test_handle_payload),
+        ("Batch cez stdio", test_stdio_batch)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy zrušenia a časových limitov
+Testuje token zrušenia, čiastočné výsledky po vypršaní limitu a
+notifications/cancelled v oboch serveroch
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+# Dokumentácia sa generuje do dočasného adresára, nie do data/
+DATA_DIR = tempfile.mkdtemp(prefix="flowbite-cancel-")
+
+# Limit, ktorý vyprší ešte pred prvou kontrolou
+EXPIRED = 1e-9
+
+LAYOUT_HTML = """
+<nav class="bg-white border-gray-200"><a href="/">Domov</a></nav>
+<main><form><input type="text" name="q"></form></main>
+"""
+
+
+def test_token():
+    """Test tokenu zrušenia"""
+    print("🔍 Testovanie tokenu zrušenia...")
+
+    from src.utils.cancellation import (
+        CancellationToken, OperationCancelled, cancellation_scope, current_token
+    )
+
+    unlimited = CancellationToken()
+    expired = CancellationToken(EXPIRED)
+    time.sleep(0.001)
+    proceeded = expired.proceed("a")
+
+    cancelled = CancellationToken(10)
+    cancelled.cancel()
+    try:
+        cancelled.proceed("a")
+        raised = False
+    except OperationCancelled:
+        raised = True
+
+    with cancellation_scope(expired) as scoped:
+        in_scope = current_token() is scoped
+    outside = current_token() is not expired
+
+    checks = {
+        "bez limitu": unlimited.proceed("a") and unlimited.remaining() is None and not unlimited.truncated,
+        "vypršaný limit": proceeded is False and expired.skipped == ["a"] and expired.truncated,
+        "zostávajúci čas": expired.remaining() == 0.0 and 9 < cancelled.remaining() <= 10,
+        "zrušenie": raised,
+        "kontext volania": in_scope and outside
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_partial_results():
+    """Test čiastočných výsledkov po vypršaní limitu"""
+    print("\n🔍 Testovanie čiastočných výsledkov...")
+
+    from src.config import get_config
+    from src.resources.documentation import DocumentationManager
+    from src.tools.suggestions import FlowbiteSuggestionEngine
+    from src.tools.validator import FlowbiteValidator
+    from src.utils.cancellation import CancellationToken, OperationCancelled
+
+    config = get_config()
+    original_data_dir = config.data_dir
+    config.data_dir = DATA_DIR
+    try:
+        docs = DocumentationManager()
+    finally:
+        config.data_dir = original_data_dir
+
+    validator = FlowbiteValidator()
+    engine = FlowbiteSuggestionEngine()
+    button = '<button type="button" class="text-white bg-blue-700 px-5 py-2.5">Klik</button>'
+
+    async def run():
+        full = await validator.validate_component(button, token=CancellationToken())
+        partial = await validator.validate_component(button, token=CancellationToken(EXPIRED))
+
+        cancelled_token = CancellationToken()
+        cancelled_token.cancel()
+        try:
+            await validator.validate_component(button, token=cancelled_token)
+            cancelled = False
+        except OperationCancelled:
+            cancelled = True
+
+        layout = await engine.analyze_layout(LAYOUT_HTML, token=CancellationToken(EXPIRED))
+        suggestions_token = CancellationToken(EXPIRED)
+        suggestions = await engine.suggest_components("prihlasovací formulár", token=suggestions_token)
+        retrieved = await docs.retrieve_docs("inštalácia", token=CancellationToken(EXPIRED))
+        return full, partial, cancelled, layout, suggestions, suggestions_token, retrieved
+
+    full, partial, cancelled, layout, suggestions, suggestions_token, retrieved = asyncio.run(run())
+
+    checks = {
+        "úplná validácia": not full.truncated and full.skipped_rules == [],
+        "čiastočná validácia": partial.truncated and partial.skipped_rules[0] == "basic_html",
+        "zrušená validácia": cancelled,
+        "čiastočná analýza layoutu": layout.get("truncated") is True and "improvements" in layout["skipped"],
+        "čiastočné návrhy": isinstance(suggestions, list) and suggestions_token.truncated,
+        "čiastočné úseky dokumentácie": retrieved.get("truncated") is True and retrieved["chunks"] == []
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_simple_server_cancel():
+    """Test notifications/cancelled v zjednodušenom serveri"""
+    print("\n🔍 Testovanie notifications/cancelled v SimpleMCPServer...")
+
+    from mcp_server_simple import SimpleMCPServer
+
+    server = SimpleMCPServer()
+
+    async def slow_generate(component_type: str, **kwargs):
+        await asyncio.sleep(0.3)
+        return {"content": [{"type": "text", "text": component_type}]}
+
+    server.generate_component = slow_generate
+
+    def call(request_id, component_type: str) -> str:
+        return json.dumps({"jsonrpc": "2.0", "id": request_id, "method": "tools/call",
+                           "params": {"name": "generate_component",
+                                      "arguments": {"component_type": component_type}}})
+
+    lines = [
+        call(1, "button"),
+        call(2, "card"),
+        json.dumps({"jsonrpc": "2.0", "method": "notifications/cancelled",
+                    "params": {"requestId": 1, "reason": "používateľ zrušil"}}),
+        json.dumps({"jsonrpc": "2.0", "method": "notifications/cancelled",
+                    "params": {"requestId": 99}})
+    ]
+    written = []
+
+    async def run():
+        queue = list(lines)
+
+        async def read_line() -> str:
+            await asyncio.sleep(0.01)
+            return queue.pop(0) + "\n" if queue else ""
+
+        async def write_line(line: str):
+            written.append(json.loads(line))
+
+        started = time.perf_counter()
+        await server.serve_lines(read_line, write_line)
+        return time.perf_counter() - started
+
+    elapsed = asyncio.run(run())
+
+    checks = {
+        "zrušené volanie bez odpovede": [r.get("id") for r in written] == [2],
+        "ostatné volania dobehnú": written and written[0]["result"]["content"][0]["text"] == "card",
+        "súbežné spracovanie": elapsed < 0.5
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_fastmcp_deadline():
+    """Test časového limitu nástroja vo FastMCP serveri"""
+    print("\n🔍 Testovanie časového limitu vo FastMCP serveri...")
+
+    from fastmcp import Client
+    from src.config import get_config
+    from src.server import app
+
+    config = get_config()
+    original = dict(config.tool_deadlines)
+    config.tool_deadlines["suggest_components"] = EXPIRED
+
+    async def run():
+        async with Client(app) as client:
+            limited = await client.call_tool("suggest_components", {"context": "e-shop košík"})
+            config.tool_deadlines.clear()
+            config.tool_deadlines.update(original)
+            unlimited = await client.call_tool("suggest_components", {"context": "e-shop objednávka"})
+        return limited.data, unlimited.data
+
+    try:
+        limited, unlimited = asyncio.run(run())
+    finally:
+        config.tool_deadlines.clear()
+        config.tool_deadlines.update(original)
+
+    checks = {
+        "čiastočný výsledok": limited.get("truncated") is True and "pattern_suggestions" in limited["skipped"],
+        "bez limitu úplný": "truncated" not in unlimited and "suggestions" in unlimited
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy zrušenia a časových limitov")
+    print("=" * 55)
+
+    tests = [
+        ("Token zrušenia", test_token),
+        ("Čiastočné výsledky", test_partial_results),
+        ("Zrušenie v SimpleMCPServer", test_simple_server_cancel),
+        ("Časový limit vo FastMCP serveri", test_fastmcp_deadline)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy detekcie komponentov
+Testuje index odtlačkov CSS tried, automatickú detekciu typu vo validátore
+a analýzu layoutu jedným prechodom stromu
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def test_fingerprint_variants():
+    """Test rozpoznania variant z data/components"""
+    print("🔍 Testovanie odtlačkov variant...")
+
+    from src.tools.fingerprint import ComponentFingerprintIndex
+
+    index = ComponentFingerprintIndex()
+
+    with open("data/components/button.json", 'r', encoding='utf-8') as f:
+        button_data = json.load(f)
+
+    results = []
+    for variant, variant_data in button_data["variants"].items():
+        match = index.best_match(variant_data["css_classes"])
+        success = match is not None and (match.component_type, match.variant) == ("button", variant)
+        print(f"{'✅' if success else '❌'} button/{variant}: {match.to_dict() if match else None}")
+        results.append(success)
+
+    # Generické triedy samé o sebe nestačia na zhodu
+    generic = index.best_match(["text-sm", "rounded-lg"])
+    print(f"{'✅' if generic is None else '❌'} generické triedy bez zhody")
+    results.append(generic is None)
+
+    return all(results)
+
+
+def test_generic_utilities():
+    """Test, že generické utility triedy nie sú komponentom"""
+    print("\n🔍 Testovanie generických utility tried...")
+
+    from concurrent.futures import ThreadPoolExecutor
+    from src.tools.fingerprint import ComponentFingerprintIndex
+    from src.tools.validator import FlowbiteValidator
+    from src.tools.suggestions import FlowbiteSuggestionEngine
+
+    index = ComponentFingerprintIndex()
+
+    # Prvé použitie z viacerých vlákien zostaví index raz a celý
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        primary = list(pool.map(
+            lambda _: index.best_match(["text-white", "bg-blue-700", "px-5", "py-2.5"]), range(8)
+        ))
+
+    generic = [
+        "flex items-center",
+        "p-5",
+        "p-6 space-y-6",
+        "rounded-t-lg",
+        "flex items-center justify-center",
+        "flex items-center justify-between p-4"
+    ]
+    generic_matches = {classes: index.best_match(classes.split(), "div") for classes in generic}
+
+    validation = asyncio.run(FlowbiteValidator().validate_component(
+        '<div class="flex items-center"><span>Logo</span></div>'
+    ))
+    analysis = asyncio.run(FlowbiteSuggestionEngine().analyze_layout(
+        '<div class="flex items-center"></div><div class="p-6 space-y-6"></div>'
+        '<div class="p-5"></div><form><input type="text"></form>'
+    ))
+
+    checks = {
+        "bez zhody utility tried": all(match is None for match in generic_matches.values()),
+        "validátor bez typu": validation.component_type is None and not validation.type_detected,
+        "layout bez falošných komponentov": analysis["components_found"] == ["form"]
+            and analysis["missing_components"] == ["submit button pre formulár"],
+        "krátke primárne tlačidlo": all(
+            match is not None and (match.component_type, match.variant) == ("button", "primary")
+            for match in primary
+        )
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+    if not checks["bez zhody utility tried"]:
+        print(f"   Zhody: {[(c, m.to_dict()) for c, m in generic_matches.items() if m]}")
+
+    return all(checks.values())
+
+
+def test_validator_auto_detection():
+    """Test automatickej detekcie typu vo validátore"""
+    print("\n🔍 Testovanie automatickej detekcie vo validátore...")
+
+    from src.tools.validator import FlowbiteValidator
+
+    validator = FlowbiteValidator()
+
+    with open("data/components/form.json", 'r', encoding='utf-8') as f:
+        form_html = json.load(f)["variants"]["login"]["html"]
+
+    form_result = asyncio.run(validator.validate_component(form_html))
+    form_ok = form_result.type_detected and form_result.component_type == "form"
+    print(f"{'✅' if form_ok else '❌'} formulár: {form_result.component_type}")
+
+    button_html = (
+        '<button class="text-white bg-red-700 hover:bg-red-800 focus:ring-4 '
+        'focus:ring-red-300 font-medium rounded-lg text-sm px-5 py-2.5"></button>'
+    )
+    button_result = asyncio.run(validator.validate_component(button_html))
+    button_ok = (
+        button_result.component_type == "button"
+        and button_result.component_variant == "danger"
+        # Typ-špecifické pravidlá bežia aj bez zadaného typu
+        and "Button bez textového obsahu alebo ikony" in button_result.errors
+    )
+    print(f"{'✅' if button_ok else '❌'} tlačidlo: {button_result.component_type}/{button_result.component_variant}")
+
+    explicit = asyncio.run(validator.validate_component(button_html, component_type="card"))
+    explicit_ok = explicit.component_type == "card" and not explicit.type_detected
+    print(f"{'✅' if explicit_ok else '❌'} zadaný typ má prednosť")
+
+    return form_ok and button_ok and explicit_ok
+
+
+def test_layout_analysis():
+    """Test analýzy layoutu"""
+    print("\n🔍 Testovanie analýzy layoutu...")
+
+    from src.tools.suggestions import FlowbiteSuggestionEngine
+
+    engine = FlowbiteSuggestionEngine()
+    html = (
+        '<nav><a href="#" class="my-btn">Domov</a></nav>'
+        '<form><div><input type="submit"></div></form>'
+        '<form><p><input type="text"></p></form>'
+        '<img src="x.png"><table></table>'
+    )
+
+    analysis = asyncio.run(engine.analyze_layout(html))
+
+    checks = {
+        "štruktúra": analysis["structure"] == {
+            "total_elements": 10,
+            "nesting_depth": 3,
+            "has_semantic_elements": True,
+            "interactive_elements": 3
+        },
+        "komponenty": analysis["components_found"] == ["button", "form", "navbar", "table"],
+        "chýbajúce": analysis["missing_components"] == ["submit button pre formulár"],
+        "vylepšenia": "Pridajte alt atribúty pre všetky obrázky" in analysis["improvements"]
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+    if not all(checks.values()):
+        print(f"   Výsledok: {analysis}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy detekcie komponentov")
+    print("=" * 55)
+
+    tests = [
+        ("Odtlačky variant", test_fingerprint_variants),
+        ("Generické utility triedy", test_generic_utilities),
+        ("Detekcia vo validátore", test_validator_auto_detection),
+        ("Analýza layoutu", test_layout_analysis)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
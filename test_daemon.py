@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy daemon režimu
+Testuje stdio shim, ktorý preposiela JSON-RPC správy daemonu cez Unix socket
+"""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SERVER = str(Path(__file__).parent / "mcp_server_simple.py")
+
+
+def _run_shim(socket_path: str, requests: list) -> list:
+    """Spustí shim, pošle požiadavky a vráti odpovede"""
+    env = dict(os.environ, FLOWBITE_MCP_SOCKET=socket_path, FLOWBITE_MCP_IDLE_TIMEOUT="30")
+    payload = "".join(json.dumps(request) + "\n" for request in requests)
+
+    completed = subprocess.run(
+        [sys.executable, SERVER, "--shim"],
+        input=payload, capture_output=True, text=True, env=env, timeout=30
+    )
+    return [json.loads(line) for line in completed.stdout.splitlines() if line.strip()]
+
+
+def test_shim_and_daemon():
+    """Test spustenia daemona na požiadanie a zdieľania medzi sessions"""
+    print("🔍 Testovanie shimu a daemona...")
+
+    socket_path = os.path.join(tempfile.mkdtemp(prefix="flowbite-daemon-"), "mcp.sock")
+    daemon_pid = None
+
+    try:
+        first = _run_shim(socket_path, [
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {}}
+        ])
+        with open(socket_path + ".pid") as f:
+            daemon_pid = int(f.read())
+
+        started = time.perf_counter()
+        second = _run_shim(socket_path, [
+            {"jsonrpc": "2.0", "id": 7, "method": "tools/call",
+             "params": {"name": "generate_component", "arguments": {"component_type": "button"}}}
+        ])
+        attach_ms = (time.perf_counter() - started) * 1000
+
+        with open(socket_path + ".pid") as f:
+            same_daemon = int(f.read()) == daemon_pid
+
+        checks = {
+            "initialize": [r["id"] for r in first] == [1, 2]
+                and first[0]["result"]["serverInfo"]["name"] == "flowbite-mcp-server",
+            "tools/list": len(first[1]["result"]["tools"]) == 3,
+            "tools/call cez existujúci daemon": second and second[0]["id"] == 7 and "result" in second[0],
+            "jeden daemon": same_daemon,
+            "socket len pre vlastníka": os.stat(socket_path).st_mode & 0o077 == 0
+        }
+        print(f"   Pripojenie druhej session: {attach_ms:.0f} ms")
+
+    finally:
+        if daemon_pid:
+            os.kill(daemon_pid, signal.SIGTERM)
+
+    # Daemon po SIGTERM upratal socket
+    for _ in range(100):
+        if not os.path.exists(socket_path):
+            break
+        time.sleep(0.05)
+    checks["upratanie po ukončení"] = not os.path.exists(socket_path)
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy daemon režimu")
+    print("=" * 55)
+
+    tests = [
+        ("Shim a daemon", test_shim_and_daemon)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
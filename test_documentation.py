@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy dokumentácie
+Testuje fulltextový index a správu dokumentácie nad dočasným DATA_DIR
+"""
+
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+# Dokumentácia sa generuje do dočasného adresára, nie do data/
+DATA_DIR = tempfile.mkdtemp(prefix="flowbite-docs-")
+
+
+def _new_manager(data_dir: str = DATA_DIR):
+    """Vytvorí DocumentationManager nad dočasným DATA_DIR"""
+    from src.config import get_config
+    from src.resources.documentation import DocumentationManager
+
+    config = get_config()
+    original_data_dir = config.data_dir
+    config.data_dir = data_dir
+    try:
+        return DocumentationManager()
+    finally:
+        config.data_dir = original_data_dir
+
+
+def test_search_queries():
+    """Test termov, fráz a prefixov"""
+    print("🔍 Testovanie vyhľadávacích dotazov...")
+
+    manager = _new_manager()
+    checks = {}
+
+    # Term bez diakritiky nájde "Inštalácia" a názov sekcie zvýhodní
+    results = asyncio.run(manager.search_documentation("instalacia"))
+    checks["term bez diakritiky"] = bool(results) and results[0]["section"] == "installation"
+
+    # Fráza musí byť v poradí
+    phrase = asyncio.run(manager.search_documentation('"generate_component"'))
+    checks["fráza"] = bool(phrase) and all("generate_component" in r["context"] for r in phrase)
+
+    reversed_phrase = asyncio.run(manager.search_documentation('"nastavenie inštalácia"'))
+    checks["fráza v opačnom poradí"] = reversed_phrase == []
+
+    # Prefix
+    prefix = asyncio.run(manager.search_documentation("validat*"))
+    checks["prefix"] = len(prefix) > 0
+
+    # Úryvok je z okolia zhody
+    checks["úryvok"] = bool(results) and "Inštalácia" in results[0]["context"]
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_incremental_update():
+    """Test inkrementálnej aktualizácie indexu po zápise"""
+    print("\n🔍 Testovanie inkrementálnej aktualizácie...")
+
+    manager = _new_manager()
+    before = asyncio.run(manager.search_documentation("zebra"))
+
+    asyncio.run(manager.update_documentation("zoo", "# Zoo\n\nSekcia o zebrách: zebra je pruhovaná."))
+    after = asyncio.run(manager.search_documentation("zebra"))
+
+    asyncio.run(manager.update_documentation("zoo", "# Zoo\n\nSekcia o žirafách."))
+    replaced = asyncio.run(manager.search_documentation("zebra"))
+
+    # Nová inštancia načíta perzistentný index
+    reloaded = asyncio.run(_new_manager().search_documentation("zirafach"))
+
+    checks = {
+        "pred zápisom": before == [],
+        "po zápise": [r["section"] for r in after] == ["zoo"],
+        "po prepísaní": replaced == [],
+        "po reštarte": [r["section"] for r in reloaded] == ["zoo"]
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_concurrent_index_saves():
+    """Test súbežného ukladania indexu z viacerých inštancií"""
+    print("\n🔍 Testovanie súbežného ukladania indexu...")
+
+    from concurrent.futures import ThreadPoolExecutor
+    from src.resources.doc_index import DocumentationSearchIndex
+
+    docs_dir = Path(tempfile.mkdtemp(prefix="flowbite-index-"))
+    (docs_dir / "a.md").write_text("# A\n\nTlačidlo a formulár.\n", encoding="utf-8")
+    (docs_dir / "b.md").write_text("# B\n\nKarta a modal.\n", encoding="utf-8")
+
+    # Každá inštancia (ako pre-fork worker) ukladá do rovnakého súboru
+    indexes = [DocumentationSearchIndex(docs_dir) for _ in range(8)]
+    for index in indexes:
+        index.sync(["a", "b"])
+
+    import logging
+
+    errors = []
+    handler = logging.Handler(logging.ERROR)
+    handler.emit = errors.append
+    index_logger = logging.getLogger("src.resources.doc_index")
+    index_logger.addHandler(handler)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda index: [index.save() for _ in range(20)], indexes))
+    finally:
+        index_logger.removeHandler(handler)
+
+    reloaded = DocumentationSearchIndex(docs_dir)
+    reloaded.load()
+
+    checks = {
+        "bez chýb ukladania": errors == [],
+        "platný index": sorted(reloaded._documents) == ["a", "b"],
+        "bez dočasných súborov": sorted(p.name for p in docs_dir.iterdir()) == ["a.md", "b.md", "search_index.json"]
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_renditions():
+    """Test renditions uložených pri zápise"""
+    print("\n🔍 Testovanie HTML/JSON renditions...")
+
+    import json
+    import os
+
+    manager = _new_manager()
+    content = (
+        "# Renditions\n\nText s **dôrazom** a `kódom` <b>.\n\n"
+        "## Použitie\n\n- prvý\n- druhý\n\n"
+        "```python\n# komentár, nie nadpis\nx = 1 < 2\n```\n\n"
+        "| Kľúč | Hodnota |\n|------|---------|\n| a | 1 |\n"
+    )
+    asyncio.run(manager.update_documentation("renditions", content))
+
+    docs_dir = Path(DATA_DIR) / "docs"
+    stored = all((docs_dir / name).exists() for name in (
+        "renditions.html", "renditions.json", "renditions.meta.json"
+    ))
+
+    # Čítanie novou inštanciou ide zo súborov na disku
+    html = asyncio.run(_new_manager().get_documentation("renditions", "html"))
+    structure = json.loads(asyncio.run(_new_manager().get_documentation("renditions", "json")))
+
+    # Zmena .md mimo servera vynúti pregenerovanie
+    md_path = docs_dir / "renditions.md"
+    md_path.write_text("# Zmenené\n", encoding='utf-8')
+    stat = md_path.stat()
+    os.utime(md_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    changed = asyncio.run(_new_manager().get_documentation("renditions", "html"))
+
+    checks = {
+        "uložené súbory": stored,
+        "inline prvky": "<strong>dôrazom</strong>" in html and "<code>kódom</code>" in html,
+        "escapovanie": "&lt;b&gt;" in html and "x = 1 &lt; 2" in html,
+        "zoznam a tabuľka": "<ul>\n<li>prvý</li>" in html and "<th>Kľúč</th>" in html,
+        "blok kódu": '<pre><code class="language-python"># komentár, nie nadpis' in html,
+        "JSON štruktúra": structure["title"] == "Renditions"
+            and [s["title"] for s in structure["sections"]] == ["Použitie"],
+        "pregenerovanie": changed == '<h1 id="zmenené">Zmenené</h1>'
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_lazy_sections():
+    """Test vytvárania sekcií až pri prvej požiadavke"""
+    print("\n🔍 Testovanie lenivého vytvárania sekcií...")
+
+    data_dir = tempfile.mkdtemp(prefix="flowbite-docs-lazy-")
+    docs_dir = Path(data_dir) / "docs"
+
+    manager = _new_manager(data_dir)
+    after_init = sorted(p.name for p in docs_dir.glob("*.md"))
+    sections = asyncio.run(manager.list_sections())
+
+    content = asyncio.run(manager.get_documentation("installation"))
+    after_request = sorted(p.name for p in docs_dir.glob("*.md"))
+
+    checks = {
+        "index bez obsahu": after_init == [] and len(sections) == 6,
+        "veľkosť zo šablóny": all(s["exists"] and s["size"] > 0 for s in sections),
+        "obsah zo šablóny": bool(content) and content.startswith("# Inštalácia a nastavenie"),
+        "vytvorená len požadovaná sekcia": after_request == ["installation.md"],
+        "neznáma sekcia": asyncio.run(manager.get_documentation("neexistuje")) is None
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_heading_sections():
+    """Test čítania jednej podsekcie podľa indexu nadpisov"""
+    print("\n🔍 Testovanie čítania podsekcií...")
+
+    manager = _new_manager()
+    full = asyncio.run(manager.get_documentation("api"))
+    section = asyncio.run(manager.get_documentation_section("api", "generate_component"))
+    folded = asyncio.run(manager.get_documentation_section("installation", "instalacia"))
+    missing = asyncio.run(manager.get_documentation_section("api", "neexistuje"))
+
+    asyncio.run(manager.update_documentation(
+        "headings", "# Nadpisy\n\n## Prvý\n\n```python\n# nie nadpis\n```\n\n### Vnorený\n\ntext\n\n## Druhý\n"
+    ))
+    first = asyncio.run(_new_manager().get_documentation_section("headings", "prvy"))
+
+    checks = {
+        "rozsah podsekcie": bool(section) and section["content"].startswith("### generate_component")
+            and "### validate_component" not in section["content"]
+            and section["content"] in full,
+        "menšia odpoveď": bool(section) and len(section["content"]) < len(full) / 3,
+        "bez diakritiky": bool(folded) and folded.get("heading") == "Inštalácia",
+        "neznámy nadpis": bool(missing) and "error" in missing and "generate_component" in missing["headings"],
+        "vnorené a kód": bool(first) and first["content"].endswith("text\n\n")
+            and "# nie nadpis" in first["content"]
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_retrieve_chunks():
+    """Test výberu úsekov v rámci rozpočtu tokenov"""
+    print("\n🔍 Testovanie výberu úsekov dokumentácie...")
+
+    from src.resources.doc_chunks import build_chunks, estimate_tokens
+    from src.resources.markdown_renderer import heading_spans
+
+    manager = _new_manager()
+    result = asyncio.run(manager.retrieve_docs("generate_component parametre", budget_tokens=600))
+    again = asyncio.run(_new_manager().retrieve_docs("generate_component parametre", budget_tokens=600))
+    tiny = asyncio.run(manager.retrieve_docs("generate_component", budget_tokens=1))
+
+    # Dlhý úsek sa delí na časti pod limit
+    long_doc = "# Dlhý\n\n## Časť\n\n" + ("Odstavec s textom. " * 40 + "\n\n") * 5
+    data = long_doc.encode('utf-8')
+    parts = build_chunks("dlhy", data, heading_spans(data), max_tokens=250)
+
+    ids = [chunk["id"] for chunk in result["chunks"]]
+    checks = {
+        "rozpočet": 0 < result["used_tokens"] <= 600
+            and result["used_tokens"] == sum(c["tokens"] for c in result["chunks"]),
+        "relevantný úsek": "api/mcp-tools/generate_component" in ids,
+        "stabilné ID": ids == [chunk["id"] for chunk in again["chunks"]],
+        "malý rozpočet": tiny["chunks"] == [] and tiny["total_matches"] > 0,
+        "delenie úsekov": len(parts) > 1
+            and all(estimate_tokens(p.content) <= 250 for p in parts)
+            and b"".join(data[p.start:p.end] for p in parts) == data[data.index(b"## "):]
+            and parts[1].id == "dlhy/cast:2"
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_section_metadata_cache():
+    """Test metadát sekcií z pamäte a negatívnej cache"""
+    print("\n🔍 Testovanie cache metadát sekcií...")
+
+    from unittest import mock
+
+    manager = _new_manager(tempfile.mkdtemp(prefix="flowbite-docs-meta-"))
+    first = asyncio.run(manager.list_sections())
+
+    real_stat = Path.stat
+    calls = []
+
+    def counting_stat(self, *args, **kwargs):
+        calls.append(self.name)
+        return real_stat(self, *args, **kwargs)
+
+    with mock.patch.object(Path, "stat", counting_stat):
+        second = asyncio.run(manager.list_sections())
+        list_calls = len(calls)
+
+        asyncio.run(manager.get_documentation("neexistuje"))
+        calls.clear()
+        miss = asyncio.run(manager.get_documentation("neexistuje"))
+        miss_calls = len(calls)
+
+    asyncio.run(manager.update_documentation("introduction", "# Úvod\n\nNový text.\n"))
+    updated = {s["id"]: s for s in asyncio.run(manager.list_sections())}["introduction"]
+
+    checks = {
+        "rovnaké metadáta": first == second and all(s["content_hash"] for s in first),
+        "list_sections bez stat": list_calls == 0,
+        "negatívna cache": miss is None and miss_calls == 0,
+        "aktualizácia po zápise": updated["size"] == len("# Úvod\n\nNový text.\n".encode('utf-8'))
+            and updated["mtime"] is not None
+            and updated["content_hash"] != {s["id"]: s for s in first}["introduction"]["content_hash"]
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_resource_versions():
+    """Test verzií resources a notifikácií o zmene"""
+    print("\n🔍 Testovanie verzií resources...")
+
+    from src.resources.versions import content_version, resource_versions
+
+    manager = _new_manager()
+    asyncio.run(manager.update_documentation("verzie", "# Verzie\n\nPrvá verzia.\n"))
+
+    version = resource_versions.remember("flowbite://docs/verzie", "# Verzie\n\nPrvá verzia.\n")
+    resource_versions.remember("flowbite://docs/verzie/verzie", "úryvok")
+    resource_versions.remember("flowbite://docs/verzie-2", "iná sekcia")
+
+    notified = []
+
+    async def listener(uri):
+        notified.append(uri)
+
+    async def update():
+        await manager.update_documentation("verzie", "# Verzie\n\nDruhá verzia.\n")
+        await asyncio.sleep(0)  # Notifikácia beží ako task
+
+    async def update_off_loop():
+        # Zápis vo vlákne s vlastnou slučkou ako v io_pool
+        resource_versions.attach_loop(asyncio.get_running_loop())
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: asyncio.run(manager.update_documentation("verzie-3", "# Tretia\n"))
+        )
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+    resource_versions.add_listener(listener)
+    try:
+        asyncio.run(update())
+        asyncio.run(update_off_loop())
+    finally:
+        resource_versions.remove_listener(listener)
+        resource_versions.attach_loop(None)
+
+    checks = {
+        "verzia z obsahu": version == content_version("# Verzie\n\nPrvá verzia.\n") and len(version) == 16,
+        "notifikácia": notified[:1] == ["flowbite://docs/verzie"],
+        "notifikácia zo zápisu mimo slučky": notified[1:] == ["flowbite://docs/verzie-3"],
+        "zneplatnenie": resource_versions.get("flowbite://docs/verzie") is None
+            and resource_versions.get("flowbite://docs/verzie/verzie") is None,
+        "iné resources ostávajú": resource_versions.get("flowbite://docs/verzie-2") is not None
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy dokumentácie")
+    print("=" * 55)
+
+    tests = [
+        ("Vyhľadávacie dotazy", test_search_queries),
+        ("Inkrementálna aktualizácia", test_incremental_update),
+        ("Súbežné ukladanie indexu", test_concurrent_index_saves),
+        ("HTML/JSON renditions", test_renditions),
+        ("Lenivé vytváranie sekcií", test_lazy_sections),
+        ("Čítanie podsekcií", test_heading_sections),
+        ("Výber úsekov dokumentácie", test_retrieve_chunks),
+        ("Cache metadát sekcií", test_section_metadata_cache),
+        ("Verzie resources", test_resource_versions)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
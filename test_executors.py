@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy poolov pre blokujúcu prácu
+Testuje CPU a I/O pooly, metriky fronty a voľnú slučku počas validácie
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def test_work_pool():
+    """Test poolu, metrík a prenosu kontextu"""
+    print("🔍 Testovanie poolu a metrík fronty...")
+
+    from src.utils.cancellation import (
+        CancellationToken, OperationCancelled, cancellation_scope, current_token
+    )
+    from src.utils.executors import WorkPool
+
+    pool = WorkPool("test", max_workers=1)
+
+    async def token_step() -> bool:
+        await asyncio.sleep(0)
+        return current_token().proceed("krok")
+
+    def wait_for_cancel():
+        token = current_token()
+        while True:
+            token.check()
+            time.sleep(0.01)
+
+    async def run():
+        token = CancellationToken()
+        with cancellation_scope(token):
+            seen = await pool.run(current_token)
+
+        # Jedno vlákno - dve z troch úloh čakajú vo fronte
+        started = time.perf_counter()
+        results = await asyncio.gather(*(pool.run(time.sleep, 0.1) for _ in range(3)))
+        serialized = time.perf_counter() - started
+
+        coroutine_result = await pool.run_coroutine(token_step)
+
+        cancel_token = CancellationToken()
+        with cancellation_scope(cancel_token):
+            job = asyncio.ensure_future(pool.run(wait_for_cancel))
+        await asyncio.sleep(0.05)
+        cancel_token.cancel()
+        try:
+            await job
+            cancelled = False
+        except OperationCancelled:
+            cancelled = True
+
+        return token, seen, results, serialized, coroutine_result, cancelled
+
+    token, seen, results, serialized, coroutine_result, cancelled = asyncio.run(run())
+    stats = pool.stats()
+    pool.shutdown()
+
+    checks = {
+        "token v poole": seen is token,
+        "ohraničený pool": results == [None] * 3 and serialized >= 0.28,
+        "hĺbka fronty": stats["max_queued"] >= 2 and stats["queued"] == 0 and stats["active"] == 0,
+        "metriky": stats["completed"] == 6 and stats["failed"] == 1 and stats["avg_run_ms"] > 0,
+        "korutina v poole": coroutine_result is True,
+        "zrušenie vo vlákne": cancelled
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_responsive_loop():
+    """Test, že lacné volania nečakajú za pomalou validáciou"""
+    print("\n🔍 Testovanie voľnej slučky počas validácie...")
+
+    from fastmcp import Client
+    from src.server import app
+    from src.tools.validator import FlowbiteValidator
+    from src.utils.executors import cpu_pool
+
+    original = FlowbiteValidator._validate_basic_html
+
+    async def slow_basic_html(self, html_code, result):
+        time.sleep(0.3)  # Blokujúca práca ako pri veľkom HTML
+        await original(self, html_code, result)
+
+    FlowbiteValidator._validate_basic_html = slow_basic_html
+    cpu_completed = cpu_pool.stats()["completed"]
+
+    async def run():
+        async with Client(app) as client:
+            validation = asyncio.ensure_future(client.call_tool(
+                "validate_component", {"html": '<button type="button" class="px-5 py-2.5">Ok</button>'}
+            ))
+            await asyncio.sleep(0.05)
+
+            started = time.perf_counter()
+            await client.read_resource("flowbite://components/button")
+            cheap_ms = (time.perf_counter() - started) * 1000
+
+            result = await validation
+        return cheap_ms, result.data
+
+    try:
+        cheap_ms, validated = asyncio.run(run())
+    finally:
+        FlowbiteValidator._validate_basic_html = original
+
+    print(f"   Lacné volanie počas validácie: {cheap_ms:.0f} ms")
+
+    checks = {
+        "lacné volanie nečaká": cheap_ms < 200,
+        "validácia dobehla": isinstance(validated, dict) and "score" in validated,
+        "validácia v CPU poole": cpu_pool.stats()["completed"] > cpu_completed
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_component_file_io():
+    """Test čítania komponentu v I/O poole"""
+    print("\n🔍 Testovanie čítania komponentu v I/O poole...")
+
+    from src.resources.component_db import ComponentDatabase
+    from src.utils.executors import io_pool
+
+    db = ComponentDatabase()
+    completed = io_pool.stats()["completed"]
+
+    async def run():
+        first = await db.get_component("button")
+        cached = await db.get_component("button")
+        missing = await db.get_component("neexistuje")
+        return first, cached, missing
+
+    first, cached, missing = asyncio.run(run())
+
+    checks = {
+        "načítaný komponent": isinstance(first, dict) and "variants" in first,
+        "čítanie v poole": io_pool.stats()["completed"] == completed + 1,
+        "cache": cached is first,
+        "neznámy komponent": missing is None
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_retrieve_docs_off_loop():
+    """Test, že výber úsekov dokumentácie beží v CPU poole"""
+    print("\n🔍 Testovanie retrieve_docs mimo slučky...")
+
+    import threading
+    from fastmcp import Client
+    from src.resources.documentation import DocumentationManager
+    from src.server import app
+
+    original = DocumentationManager._sync_chunk_index
+    threads = []
+
+    def recording_sync(self, token=None):
+        threads.append(threading.current_thread())
+        original(self, token)
+
+    DocumentationManager._sync_chunk_index = recording_sync
+
+    async def run():
+        async with Client(app) as client:
+            return (await client.call_tool("retrieve_docs", {"query": "inštalácia", "budget_tokens": 300})).data
+
+    try:
+        retrieved = asyncio.run(run())
+    finally:
+        DocumentationManager._sync_chunk_index = original
+
+    checks = {
+        "výber mimo slučky": bool(threads) and all(t is not threading.main_thread() for t in threads),
+        "úseky vrátené": isinstance(retrieved, dict) and "chunks" in retrieved and "error" not in retrieved
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy poolov pre blokujúcu prácu")
+    print("=" * 55)
+
+    tests = [
+        ("Pool a metriky", test_work_pool),
+        ("Voľná slučka", test_responsive_loop),
+        ("Čítanie komponentu", test_component_file_io),
+        ("Dokumentácia mimo slučky", test_retrieve_docs_off_loop)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy HTTP transportu
+Testuje limit súbežnosti a kompresiu odpovedí
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+MCP_HEADERS = {
+    "accept": "application/json, text/event-stream",
+    "content-type": "application/json"
+}
+
+
+def test_concurrency_limit():
+    """Test odmietnutia požiadaviek nad limit súbežnosti"""
+    print("🔍 Testovanie limitu súbežnosti...")
+
+    from src.utils.http import ConcurrencyLimitMiddleware
+
+    async def slow_app(scope, receive, send):
+        await asyncio.sleep(0.2)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    limited = ConcurrencyLimitMiddleware(slow_app, max_concurrency=2, queue_timeout=0.05)
+
+    async def request(method: str) -> dict:
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        await limited({"type": "http", "method": method, "path": "/mcp"}, receive, send)
+        return {"status": messages[0]["status"], "headers": dict(messages[0]["headers"]),
+                "body": messages[1]["body"]}
+
+    async def run():
+        posts = await asyncio.gather(*[request("POST") for _ in range(4)])
+        return posts, await request("GET")
+
+    posts, stream = asyncio.run(run())
+    statuses = sorted(response["status"] for response in posts)
+    busy = [response for response in posts if response["status"] == 503]
+
+    checks = {
+        "limit": statuses == [200, 200, 503, 503],
+        "Retry-After": all(response["headers"][b"retry-after"] == b"1" for response in busy),
+        "JSON-RPC chyba": all(json.loads(response["body"])["error"]["code"] == -32000 for response in busy),
+        "GET mimo limitu": stream["status"] == 200,
+        "uvoľnené sloty": limited.active == 0 and limited.rejected == 2
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_http_app():
+    """Test MCP cez streamable HTTP s kompresiou"""
+    print("\n🔍 Testovanie MCP cez HTTP...")
+
+    from starlette.testclient import TestClient
+    from src.server import app
+    from src.utils.http import build_http_middleware
+
+    http_app = app.http_app(path="/mcp", middleware=build_http_middleware(), json_response=True)
+
+    with TestClient(http_app) as client:
+        initialized = client.post("/mcp", headers=MCP_HEADERS, json={
+            "jsonrpc": "2.0", "id": 1, "method": "initialize",
+            "params": {
+                "protocolVersion": "2025-03-26",
+                "capabilities": {},
+                "clientInfo": {"name": "test", "version": "1.0"}
+            }
+        })
+        session = {"mcp-session-id": initialized.headers.get("mcp-session-id", "")}
+        client.post("/mcp", headers={**MCP_HEADERS, **session},
+                    json={"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+        tools = client.post("/mcp", headers={**MCP_HEADERS, **session, "accept-encoding": "gzip"},
+                            json={"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        plain = client.post("/mcp", headers={**MCP_HEADERS, **session, "accept-encoding": "identity"},
+                            json={"jsonrpc": "2.0", "id": 3, "method": "tools/list"})
+
+    names = [tool["name"] for tool in tools.json()["result"]["tools"]]
+
+    checks = {
+        "initialize": initialized.status_code == 200 and bool(session["mcp-session-id"]),
+        "tools/list": "generate_component" in names,
+        "gzip": tools.headers.get("content-encoding") == "gzip",
+        "bez kompresie": "content-encoding" not in plain.headers
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_compression_selection():
+    """Test výberu kompresie"""
+    print("\n🔍 Testovanie výberu kompresie...")
+
+    from starlette.middleware.gzip import GZipMiddleware
+    from src.utils.http import compression_middleware
+
+    try:
+        import brotli_asgi  # noqa: F401
+        has_brotli = True
+    except ImportError:
+        has_brotli = False
+
+    brotli = compression_middleware("br", 500)
+
+    checks = {
+        "gzip": compression_middleware("gzip", 500)[0].cls is GZipMiddleware,
+        "none": compression_middleware("none") == [],
+        "br alebo gzip záloha": has_brotli or brotli[0].cls is GZipMiddleware
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy HTTP transportu")
+    print("=" * 55)
+
+    tests = [
+        ("Limit súbežnosti", test_concurrency_limit),
+        ("MCP cez HTTP", test_http_app),
+        ("Výber kompresie", test_compression_selection)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy asynchrónnych úloh
+Testuje frontu úloh, stránkované výsledky, zrušenie, obnovu po páde a nástroje servera
+"""
+
+import asyncio
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+BUTTON = '<button type="button" class="text-white bg-blue-700 px-5 py-2.5 rounded-lg">Ok {}</button>'
+
+
+def _new_queue(workers: int = 2):
+    """JobQueue nad dočasnou databázou"""
+    from src.tools.jobs import JobQueue
+
+    return JobQueue(str(Path(tempfile.mkdtemp(prefix="flowbite-jobs-")) / "jobs.sqlite3"), workers)
+
+
+async def _wait(queue, job_id: str, timeout: float = 15.0) -> dict:
+    """Počká na dokončenie úlohy"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = await queue.status(job_id)
+        if status["status"] in ("succeeded", "failed", "cancelled"):
+            return status
+        await asyncio.sleep(0.05)
+    return status
+
+
+def test_job_lifecycle():
+    """Test zadania, priebehu a stránkovaných výsledkov"""
+    print("🔍 Testovanie životného cyklu úlohy...")
+
+    queue = _new_queue()
+
+    async def run():
+        submitted = await queue.submit("validate_batch", {"items": [BUTTON.format(i) for i in range(60)]})
+        finished = await _wait(queue, submitted["job_id"])
+        first = await queue.result(submitted["job_id"], page=1, page_size=25)
+        last = await queue.result(submitted["job_id"], page=3, page_size=25)
+
+        rendered = await queue.submit("render_catalog", {"component_types": ["button"]})
+        rendered_status = await _wait(queue, rendered["job_id"])
+        catalog = await queue.result(rendered["job_id"], page_size=500)
+
+        errors = []
+        for kind, params in (("neznama", {}), ("validate_batch", {"items": []}),
+                             ("render_catalog", {"component_types": ["neexistuje"]})):
+            try:
+                await queue.submit(kind, params)
+            except ValueError as e:
+                errors.append(str(e))
+        try:
+            await queue.status("neexistuje")
+        except ValueError as e:
+            errors.append(str(e))
+
+        return submitted, finished, first, last, rendered_status, catalog, errors
+
+    submitted, finished, first, last, rendered_status, catalog, errors = asyncio.run(run())
+
+    from src.models.schema import HTML_TEMPLATES
+
+    checks = {
+        "zadaná úloha": submitted["status"] in ("queued", "running") and submitted["progress"]["total"] == 60,
+        "dokončená úloha": finished["status"] == "succeeded" and finished["progress"]["done"] == 60,
+        "stránkovanie": first["pages"] == 3 and len(first["items"]) == 25 and first["items"][0]["index"] == 0
+            and len(last["items"]) == 10 and last["items"][-1]["index"] == 59 and last["complete"],
+        "výsledok validácie": "score" in first["items"][0] and "valid" in first["items"][0],
+        "katalóg": rendered_status["status"] == "succeeded"
+            and catalog["total_results"] == len(HTML_TEMPLATES["button"])
+            and all(item.get("html") and "error" not in item for item in catalog["items"]),
+        "neplatné úlohy": len(errors) == 4
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_job_cancel():
+    """Test zrušenia bežiacej a čakajúcej úlohy"""
+    print("\n🔍 Testovanie zrušenia úloh...")
+
+    from src.tools.validator import FlowbiteValidator
+
+    queue = _new_queue(workers=1)
+    original = FlowbiteValidator._validate_basic_html
+
+    async def slow_basic_html(self, html_code, result):
+        time.sleep(0.01)
+        await original(self, html_code, result)
+
+    async def run():
+        running = await queue.submit("validate_batch", {"items": [BUTTON.format(i) for i in range(400)]})
+        waiting = await queue.submit("validate_batch", {"items": [BUTTON.format(0)]})
+
+        while (await queue.status(running["job_id"]))["progress"]["done"] < 25:
+            await asyncio.sleep(0.02)
+
+        waiting_cancelled = await queue.cancel(waiting["job_id"])
+        await queue.cancel(running["job_id"])
+        running_cancelled = await _wait(queue, running["job_id"])
+        partial = await queue.result(running["job_id"], page_size=200)
+        return waiting_cancelled, running_cancelled, partial
+
+    FlowbiteValidator._validate_basic_html = slow_basic_html
+    try:
+        waiting_cancelled, running_cancelled, partial = asyncio.run(run())
+    finally:
+        FlowbiteValidator._validate_basic_html = original
+
+    checks = {
+        "čakajúca úloha": waiting_cancelled["status"] == "cancelled",
+        "bežiaca úloha": running_cancelled["status"] == "cancelled"
+            and running_cancelled["progress"]["done"] < 400,
+        "čiastočné výsledky": partial["complete"] and 25 <= partial["total_results"] < 400,
+        "počítadlá": queue.stats()["cancelled"] == 1 and queue.stats()["running"] == 0
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_job_blocking_steps_off_loop():
+    """Test, že zápis indexu a vrátenie úlohy do fronty neblokujú slučku"""
+    print("\n🔍 Testovanie blokujúcich krokov mimo slučky...")
+
+    import threading
+
+    from src.utils.registry import subsystems
+
+    queue = _new_queue(workers=1)
+    threads = {}
+    search_index = subsystems.get("documentation_manager").search_index
+    original_serialize = search_index.serialize
+
+    def serialize():
+        threads["snapshot"] = threading.current_thread()
+        return original_serialize()
+
+    def write(payload):
+        threads["finish"] = threading.current_thread()
+        threads["payload"] = payload
+
+    search_index.serialize = serialize
+    search_index.write = write
+
+    original_requeue = queue.store.requeue
+
+    def requeue(job_id):
+        threads["requeue"] = threading.current_thread()
+        return original_requeue(job_id)
+
+    plan, process, _ = queue._kinds["render_catalog"]
+    queue._kinds["render_catalog"] = (plan, process, queue._save_docs_index)
+    queue.store.requeue = requeue
+
+    async def slow_process(index, item):
+        await asyncio.sleep(0.05)
+        return {"index": index}
+
+    async def run():
+        finished = await queue.submit("render_catalog", {"component_types": ["button"]})
+        finished = await _wait(queue, finished["job_id"])
+
+        # Slučka skončí počas behu úlohy - worker ju vráti do fronty
+        queue._kinds["render_catalog"] = (plan, slow_process, None)
+        interrupted = await queue.submit("render_catalog", {"component_types": ["button"]})
+        while (await queue.status(interrupted["job_id"]))["status"] != "running":
+            await asyncio.sleep(0.01)
+        return finished, interrupted["job_id"]
+
+    try:
+        finished, interrupted_id = asyncio.run(run())
+    finally:
+        del search_index.serialize, search_index.write
+    requeued = queue.store.get(interrupted_id)
+
+    main_thread = threading.main_thread()
+    checks = {
+        "snímka indexu na slučke": threads.get("snapshot") is main_thread
+            and '"postings"' in threads.get("payload", ""),
+        "zápis indexu mimo slučky": finished["status"] == "succeeded"
+            and threads.get("finish") not in (None, main_thread),
+        "vrátenie do fronty mimo slučky": threads.get("requeue") not in (None, main_thread)
+            and requeued["status"] == "queued"
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_job_recovery():
+    """Test obnovy úlohy po páde procesu"""
+    print("\n🔍 Testovanie obnovy prerušenej úlohy...")
+
+    from src.tools.jobs import JobQueue
+
+    queue = _new_queue()
+    job_id = queue.store.create("render_catalog", {"component_types": ["button"]}, "local", 1)
+
+    # Úloha zarezervovaná procesom, ktorý medzitým skončil
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    queue.store.claim()
+    queue.store._connect().execute("UPDATE jobs SET owner_pid = ? WHERE id = ?", (dead.pid, job_id))
+    queue.store.append_results(job_id, 0, [{"čiastočný": True}])
+
+    restarted = JobQueue(str(queue.store.path), workers=1)
+
+    async def run():
+        return await _wait(restarted, job_id), await restarted.result(job_id)
+
+    status, result = asyncio.run(run())
+
+    checks = {
+        "úloha znova spustená": status["status"] == "succeeded",
+        "bez starých výsledkov": result["items"] and all("čiastočný" not in item for item in result["items"])
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_job_tools():
+    """Test nástrojov úloh vo FastMCP serveri"""
+    print("\n🔍 Testovanie nástrojov úloh vo FastMCP serveri...")
+
+    from fastmcp import Client
+    from src.config import get_config
+    from src.server import app
+    from src.utils.registry import subsystems
+
+    config = get_config()
+    original_data_dir = config.data_dir
+    config.data_dir = tempfile.mkdtemp(prefix="flowbite-jobs-")
+    subsystems.reset("job_queue")
+    subsystems.reset("documentation_manager")
+
+    async def run():
+        async with Client(app) as client:
+            submitted = (await client.call_tool("submit_job", {"kind": "reindex_docs"})).data
+            job_id = submitted["job_id"]
+            for _ in range(300):
+                status = (await client.call_tool("job_status", {"job_id": job_id})).data
+                if status["status"] == "succeeded":
+                    break
+                await asyncio.sleep(0.05)
+            page = (await client.call_tool("job_result", {"job_id": job_id, "page_size": 5})).data
+            cancelled = (await client.call_tool("cancel_job", {"job_id": job_id})).data
+            invalid = (await client.call_tool("submit_job", {"kind": "neznama"})).data
+        return submitted, status, page, cancelled, invalid
+
+    try:
+        submitted, status, page, cancelled, invalid = asyncio.run(run())
+        db_created = (Path(config.data_dir) / "jobs.sqlite3").exists()
+    finally:
+        config.data_dir = original_data_dir
+        subsystems.reset("job_queue")
+        subsystems.reset("documentation_manager")
+
+    checks = {
+        "submit_job": submitted["status"] in ("queued", "running") and submitted["progress"]["total"] > 0,
+        "job_status": status["status"] == "succeeded",
+        "job_result": len(page["items"]) == min(5, status["progress"]["total"])
+            and all(item["indexed"] for item in page["items"]),
+        "cancel_job dokončenej úlohy": cancelled["status"] == "succeeded",
+        "chyba": "error" in invalid,
+        "databáza v data_dir": db_created
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy asynchrónnych úloh")
+    print("=" * 55)
+
+    tests = [
+        ("Životný cyklus úlohy", test_job_lifecycle),
+        ("Zrušenie úloh", test_job_cancel),
+        ("Blokujúce kroky mimo slučky", test_job_blocking_steps_off_loop),
+        ("Obnova prerušenej úlohy", test_job_recovery),
+        ("Nástroje úloh", test_job_tools)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy metrík
+Testuje histogramy, cenu zápisu, nástroj server_stats a Prometheus endpoint
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def test_metric_types():
+    """Test presnosti histogramu, expozície a ceny zápisu"""
+    print("🔍 Testovanie typov metrík...")
+
+    from src.utils.metrics import Histogram, MetricsRegistry
+
+    histogram = Histogram()
+    for value in range(1, 100001):
+        histogram.record(value)
+    quantiles = histogram.quantiles((0.5, 0.99))
+
+    registry = MetricsRegistry()
+    registry.counter("calls_total", "Calls", tool="a").inc(3)
+    registry.gauge("in_flight", tool="a").inc()
+    registry.histogram("latency_us", tool='a"b').record(250)
+    cache = registry.cache("docs")
+    cache.hit()
+    cache.hit()
+    cache.miss()
+    registry.register_collector("pool", lambda: {"active": 2, "classes": {"bulk": {"running": 1}}, "name": "cpu"})
+    registry.register_collector("broken", lambda: 1 / 0)
+    text = registry.prometheus()
+    snapshot = registry.snapshot()
+
+    # Cena zápisu na horúcej ceste (najlepší z niekoľkých behov)
+    samples = []
+    record = Histogram().record
+    for _ in range(5):
+        started = time.perf_counter()
+        for value in range(20000):
+            record(value)
+        samples.append((time.perf_counter() - started) / 20000)
+    record_ns = min(samples) * 1e9
+    print(f"   Zápis do histogramu: {record_ns:.0f} ns")
+
+    checks = {
+        "percentily do 6,25 %": abs(quantiles[0.5] - 50000) <= 50000 * 0.0625
+            and abs(quantiles[0.99] - 99000) <= 99000 * 0.0625,
+        "malé hodnoty presne": Histogram.bucket_upper(31) == 31 and Histogram.bucket_upper(32) == 33,
+        "úspešnosť cache": snapshot["caches"]["docs"] == {"hits": 2, "misses": 1, "hit_ratio": 0.667},
+        "Prometheus": 'flowbite_calls_total{tool="a"} 3' in text
+            and 'flowbite_latency_us{tool="a\\"b",quantile="0.5"} 250' in text
+            and "flowbite_latency_us_count" in text
+            and "flowbite_pool_classes_bulk_running 1" in text and "flowbite_pool_name" not in text,
+        "chybný collector": "error" in snapshot["subsystems"]["broken"],
+        "zápis pod 1 µs": record_ns < 1000
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_server_stats_tool():
+    """Test metrík nástrojov, resources a caches cez server_stats"""
+    print("\n🔍 Testovanie nástroja server_stats...")
+
+    from fastmcp import Client
+    from src.server import app
+
+    async def run():
+        async with Client(app) as client:
+            for _ in range(3):
+                await client.call_tool("generate_component", {"component_type": "button"})
+            await client.call_tool("validate_component", {"html": "<button>OK</button>"})
+            await client.read_resource("flowbite://components/button")
+            await client.read_resource("flowbite://components/button")
+            stats = (await client.call_tool("server_stats", {})).data
+            brief = (await client.call_tool("server_stats", {"include_metrics": False})).data
+        return stats, brief
+
+    stats, brief = asyncio.run(run())
+
+    def entry(name, **labels):
+        return next((e["value"] for e in stats["metrics"].get(name, []) if e["labels"] == labels), None)
+
+    latency = entry("tool_latency_us", tool="generate_component")
+    print(f"   generate_component: p50 {latency['p50']} µs, p99 {latency['p99']} µs")
+
+    checks = {
+        "volania nástroja": entry("tool_calls_total", tool="generate_component") >= 3
+            and latency["count"] >= 3 and latency["max"] > 0,
+        "veľkosť odpovede": entry("tool_response_chars", tool="generate_component")["mean"] > 100,
+        "rozbehnuté volania": entry("tool_in_flight", tool="generate_component") == 0
+            and entry("tool_in_flight", tool="server_stats") == 1,
+        "čítania resources": entry("resource_calls_total", kind="components") >= 2,
+        "caches": {"render", "validation", "resource_payload", "component_db"} <= set(stats["caches"])
+            and stats["caches"]["resource_payload"]["hits"] >= 1,
+        "subsystémy": {"rate_limit", "single_flight", "scheduler", "pools", "subsystems"} <= set(stats["subsystems"])
+            and "cpu" in stats["subsystems"]["pools"],
+        "bez jednotlivých metrík": "metrics" not in brief and "caches" in brief
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_prometheus_endpoint():
+    """Test Prometheus endpointu v HTTP režime"""
+    print("\n🔍 Testovanie Prometheus endpointu...")
+
+    from starlette.testclient import TestClient
+    from src.server import app, config
+
+    http_app = app.http_app(path="/mcp", json_response=True)
+
+    with TestClient(http_app) as client:
+        response = client.get(config.metrics_path)
+
+    checks = {
+        "odpoveď": response.status_code == 200 and response.headers["content-type"].startswith("text/plain"),
+        "metriky": "# TYPE flowbite_uptime_seconds gauge" in response.text
+            and "flowbite_pools_cpu_max_workers" in response.text
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy metrík")
+    print("=" * 55)
+
+    tests = [
+        ("Typy metrík", test_metric_types),
+        ("Nástroj server_stats", test_server_stats_tool),
+        ("Prometheus endpoint", test_prometheus_endpoint)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy pipeline generovanie -> validácia -> oprava
+Testuje podmienky zastavenia, jedno parsovanie a nástroj build_component
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def test_pipeline_stages():
+    """Test podmienok zastavenia a zhody s reťazou samostatných krokov"""
+    print("🔍 Testovanie krokov pipeline...")
+
+    import src.tools.pipeline as pipeline_module
+    import src.tools.validator as validator_module
+    from src.tools.pipeline import ComponentPipeline
+    from src.utils.cancellation import CancellationToken
+    from src.utils.registry import subsystems
+
+    pipeline = ComponentPipeline()
+    generator = subsystems.get("generator")
+    validator = subsystems.get("validator")
+    parses = []
+    original = validator_module.BeautifulSoup
+
+    def counting_soup(*args, **kwargs):
+        parses.append(1)
+        return original(*args, **kwargs)
+
+    async def run():
+        pipeline_module.BeautifulSoup = counting_soup
+        validator_module.BeautifulSoup = counting_soup
+        try:
+            fixed = await pipeline.build_component("form", {}, min_score=100.0, max_fix_iterations=3)
+        finally:
+            pipeline_module.BeautifulSoup = original
+            validator_module.BeautifulSoup = original
+
+        reached = await pipeline.build_component("button", {"text": "Ok"}, min_score=50.0)
+        limited = await pipeline.build_component("form", {}, min_score=100.0, max_fix_iterations=0)
+        expired = await pipeline.build_component("form", {}, min_score=100.0, token=CancellationToken(1e-9))
+        failed = await pipeline.build_component("neexistuje", {})
+        # Oprava karty nič nemení - pipeline skončí po prvom kole s výstupom generátora
+        unchanged = await pipeline.build_component("card", {}, min_score=100.0, max_fix_iterations=3)
+        card_html = await generator.generate_component("card", {})
+
+        # Tá istá reťaz po krokoch - HTML a skóre sa musia zhodovať
+        html = await generator.generate_component("form", {})
+        chained = await validator.fix_component(html, component_type="form")
+        chained_result = await validator.validate_component(chained, component_type="form", strict=False)
+        return fixed, reached, limited, expired, failed, unchanged, card_html, chained, chained_result
+
+    fixed, reached, limited, expired, failed, unchanged, card_html, chained, chained_result = asyncio.run(run())
+    timings = ", ".join(f"{stage['stage']} {stage['ms']} ms" for stage in fixed["stages"])
+    print(f"   Kroky: {timings}")
+
+    checks = {
+        "jedno parsovanie": len(parses) == 1,
+        "opravy bez zmeny": fixed["stop_reason"] == "no_changes" and fixed["iterations"] == 2,
+        "prvé kolo bez zmeny": unchanged["stop_reason"] == "no_changes" and unchanged["iterations"] == 1
+            and unchanged["html"] == card_html
+            and [s.get("changed") for s in unchanged["stages"] if s["stage"] == "fix"] == [False],
+        "zhoda s reťazou": fixed["html"] == chained and fixed["score"] == chained_result.score,
+        "cieľové skóre": reached["stop_reason"] == "score_reached" and reached["iterations"] == 0
+            and [s["stage"] for s in reached["stages"]] == ["generate", "parse", "validate"],
+        "limit opráv": limited["stop_reason"] == "max_iterations" and limited["iterations"] == 0,
+        "časový limit": expired["stop_reason"] == "deadline" and expired["validation"]["truncated"],
+        "chyba generovania": "error" in failed and failed["stages"] == [],
+        "časy krokov": all(stage["ms"] >= 0 for stage in fixed["stages"]) and fixed["total_ms"] > 0
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_build_component_tool():
+    """Test nástroja build_component vo FastMCP serveri"""
+    print("\n🔍 Testovanie nástroja build_component...")
+
+    from fastmcp import Client
+    from src.server import app
+
+    async def run():
+        async with Client(app) as client:
+            built = (await client.call_tool("build_component", {
+                "component_type": "button", "variant": "primary", "props": {"text": "Odoslať"}
+            })).data
+            validated = (await client.call_tool("validate_component", {"artifact": built["artifact"]})).data
+            invalid = (await client.call_tool("build_component", {"component_type": "neexistuje"})).data
+        return built, validated, invalid
+
+    built, validated, invalid = asyncio.run(run())
+
+    checks = {
+        "HTML a skóre": "Odoslať" in built["html"] and built["score"] >= 90 and built["valid"],
+        "handle artefaktu": validated["artifact"] == built["artifact"],
+        "chyba": "error" in invalid
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy pipeline komponentu")
+    print("=" * 55)
+
+    tests = [
+        ("Kroky pipeline", test_pipeline_stages),
+        ("Nástroj build_component", test_build_component_tool)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
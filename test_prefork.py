@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy pre-fork režimu
+Testuje prípravu subsystémov v masteri a HTTP server s viacerými workermi
+"""
+
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+ROOT = Path(__file__).parent
+
+
+def _free_port() -> int:
+    """Nájde voľný port"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _children(pid: int) -> set:
+    """PID priamych potomkov procesu"""
+    completed = subprocess.run(["pgrep", "-P", str(pid)], capture_output=True, text=True)
+    return {int(line) for line in completed.stdout.split()}
+
+
+def _tools_list(port: int) -> list:
+    """Bezstavová požiadavka tools/list"""
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{port}/mcp",
+        data=json.dumps({"jsonrpc": "2.0", "id": 1, "method": "tools/list"}).encode("utf-8"),
+        headers={"accept": "application/json, text/event-stream", "content-type": "application/json"}
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return [tool["name"] for tool in json.loads(response.read())["result"]["tools"]]
+
+
+def _wait_for_server(port: int, timeout: float = 30.0) -> bool:
+    """Počká, kým server neodpovedá"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _tools_list(port)
+            return True
+        except Exception:
+            time.sleep(0.2)
+    return False
+
+
+def test_warm_up():
+    """Test prípravy subsystémov pred forkom"""
+    print("🔍 Testovanie prípravy subsystémov...")
+
+    from src.utils.registry import SubsystemRegistry
+
+    registry = SubsystemRegistry({
+        "generator": "src.tools.generator:FlowbiteGenerator",
+        "validator": "src.tools.validator:FlowbiteValidator"
+    })
+    registry.warm_up()
+    report = registry.report()
+
+    from src.models.schema import HTML_TEMPLATES
+    from src.tools.fingerprint import fingerprint_index
+    template_count = sum(len(variants) for variants in HTML_TEMPLATES.values())
+
+    checks = {
+        "vytvorené": all(entry["created"] for entry in report.values()),
+        "čas prípravy": all("warm_up_ms" in entry for entry in report.values()),
+        "skompilované šablóny": len(registry.get("generator")._templates) == template_count,
+        "index odtlačkov": fingerprint_index.fingerprints != []
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_bind_sockets():
+    """Test socketov pre workery"""
+    print("\n🔍 Testovanie socketov pre workery...")
+
+    from src.utils.prefork import bind_sockets
+
+    sockets = bind_sockets("127.0.0.1", 0, 3)
+    try:
+        ports = {sock.getsockname()[1] for sock in sockets}
+        checks = {
+            "počet": len(sockets) == (3 if hasattr(socket, "SO_REUSEPORT") else 1),
+            "jeden port": len(ports) == 1,
+            "dediteľné": all(sock.get_inheritable() for sock in sockets)
+        }
+    finally:
+        for sock in sockets:
+            sock.close()
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_prefork_server():
+    """Test HTTP servera s dvoma workermi"""
+    print("\n🔍 Testovanie pre-fork servera...")
+
+    port = _free_port()
+    master = subprocess.Popen(
+        [sys.executable, "-m", "src.server", "--transport", "http",
+         "--host", "127.0.0.1", "--port", str(port), "--workers", "2"],
+        cwd=str(ROOT), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+    try:
+        started = _wait_for_server(port)
+        workers = _children(master.pid)
+        responses = [_tools_list(port) for _ in range(10)] if started else []
+
+        # Padnutý worker sa nahradí novým
+        os.kill(next(iter(workers)), signal.SIGKILL)
+        for _ in range(50):
+            respawned = _children(master.pid)
+            if len(respawned) == 2 and respawned != workers:
+                break
+            time.sleep(0.2)
+        serving = _wait_for_server(port)
+
+        checks = {
+            "štart": started,
+            "dva workery": len(workers) == 2,
+            "odpovede": len(responses) == 10 and all("generate_component" in r for r in responses),
+            "obnovený worker": len(respawned) == 2 and respawned != workers and serving
+        }
+
+    finally:
+        master.send_signal(signal.SIGTERM)
+        try:
+            master.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            master.kill()
+
+    checks["ukončenie"] = master.returncode == 0 and not _children(master.pid)
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy pre-fork režimu")
+    print("=" * 55)
+
+    tests = [
+        ("Príprava subsystémov", test_warm_up),
+        ("Sockety pre workery", test_bind_sockets),
+        ("Pre-fork server", test_prefork_server)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
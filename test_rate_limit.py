@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy limitu volaní
+Testuje token bucket, chybu s retry_after a limit v oboch serveroch
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def test_token_bucket():
+    """Test token bucketu s burstom a dopĺňaním"""
+    print("🔍 Testovanie token bucketu...")
+
+    from src.utils.rate_limit import RATE_LIMIT_ERROR_CODE, RateLimitExceeded, TokenBucketLimiter
+
+    limiter = TokenBucketLimiter(rate_per_minute=600, burst=2)  # 10 tokenov za sekundu
+    burst = [limiter.try_acquire("a") for _ in range(2)]
+    retry_after = limiter.try_acquire("a")
+    other_client = limiter.try_acquire("b")
+    time.sleep(0.15)
+    refilled = limiter.try_acquire("a")
+
+    try:
+        limiter.acquire("a")
+        error = None
+    except RateLimitExceeded as e:
+        error = e.to_error()
+
+    lru = TokenBucketLimiter(rate_per_minute=60, burst=1, max_clients=2)
+    for client in ("x", "y", "z"):
+        lru.try_acquire(client)
+
+    disabled = TokenBucketLimiter(rate_per_minute=0)
+
+    started = time.perf_counter()
+    for _ in range(10000):
+        limiter.try_acquire("bench")
+    per_call_us = (time.perf_counter() - started) * 100
+    print(f"   Kontrola limitu: {per_call_us:.2f} µs")
+
+    checks = {
+        "burst": burst == [0.0, 0.0],
+        "retry_after": 0.05 < retry_after <= 0.1,
+        "vedro na klienta": other_client == 0.0,
+        "dopĺňanie": refilled == 0.0,
+        "štruktúrovaná chyba": error is not None and error["code"] == RATE_LIMIT_ERROR_CODE
+            and error["data"]["retry_after"] > 0 and error["data"]["client"] == "a",
+        "LRU klientov": lru.stats()["clients"] == 2,
+        "vypnutý limit": all(disabled.try_acquire("a") == 0.0 for _ in range(1000)),
+        "počítadlá": limiter.stats()["rejected_by_client"].get("a", 0) >= 2
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_simple_server_limit():
+    """Test limitu v zjednodušenom serveri"""
+    print("\n🔍 Testovanie limitu v SimpleMCPServer...")
+
+    from mcp_server_simple import SimpleMCPServer
+    from src.utils.rate_limit import RATE_LIMIT_ERROR_CODE, TokenBucketLimiter
+
+    server = SimpleMCPServer()
+    server.limiter = TokenBucketLimiter(rate_per_minute=60, burst=1)
+    call = {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+            "params": {"name": "generate_component", "arguments": {"component_type": "button"}}}
+
+    async def run():
+        first = await server.handle_message(call)
+        second = await server.handle_message(call)
+        other = await server.handle_message(call, client_id="session-2")
+        listed = await server.handle_message({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        return first, second, other, listed
+
+    first, second, other, listed = asyncio.run(run())
+
+    checks = {
+        "prvé volanie": "result" in first,
+        "odmietnuté volanie": second.get("error", {}).get("code") == RATE_LIMIT_ERROR_CODE
+            and second["error"]["data"]["retry_after"] > 0,
+        "iná session": "result" in other,
+        "tools/list bez limitu": "result" in listed
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_client_identity():
+    """Test, že X-Client-Id platí len od dôveryhodnej proxy"""
+    print("\n🔍 Testovanie identity klienta...")
+
+    from fastmcp.server.http import _current_http_request
+    from starlette.requests import Request
+    from src.middleware.identity import client_identity, config
+
+    def identity(host, client_id=None):
+        headers = [(b"x-client-id", client_id.encode())] if client_id else []
+        request = Request({"type": "http", "headers": headers, "client": (host, 50000)})
+        token = _current_http_request.set(request)
+        try:
+            return client_identity()
+        finally:
+            _current_http_request.reset(token)
+
+    original = config.trusted_proxies
+    try:
+        config.trusted_proxies = []
+        spoofed = {identity("203.0.113.7", f"klient-{i}") for i in range(5)}
+        config.trusted_proxies = ["10.0.0.0/8", "neplatná"]
+        proxied = identity("10.1.2.3", "tim-a")
+        proxy_only = identity("10.1.2.3")
+        outside = identity("198.51.100.1", "tim-a")
+    finally:
+        config.trusted_proxies = original
+
+    checks = {
+        "hlavička bez proxy ignorovaná": spoofed == {"203.0.113.7"},
+        "hlavička od proxy": proxied == "tim-a" and proxy_only == "10.1.2.3",
+        "mimo siete proxy": outside == "198.51.100.1"
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_fastmcp_limit():
+    """Test limitu pred nástrojmi FastMCP servera"""
+    print("\n🔍 Testovanie limitu vo FastMCP serveri...")
+
+    from fastmcp import Client
+    from src.middleware.rate_limiting import tool_limiter
+    from src.server import app
+    from src.utils.rate_limit import RATE_LIMIT_ERROR_CODE
+
+    original = (tool_limiter.rate_per_minute, tool_limiter.burst)
+    tool_limiter.configure(60, 1)
+
+    async def run():
+        errors = []
+        async with Client(app) as client:
+            for _ in range(2):
+                try:
+                    await client.call_tool("fetch_resource", {"uri": "flowbite://neexistuje"})
+                    errors.append(None)
+                except Exception as e:
+                    errors.append(e)
+        return errors
+
+    try:
+        errors = asyncio.run(run())
+    finally:
+        tool_limiter.configure(*original)
+
+    rejected = errors[1]
+    checks = {
+        "prvé volanie": errors[0] is None,
+        "kód chyby": getattr(rejected, "code", None) == RATE_LIMIT_ERROR_CODE,
+        "retry_after": (getattr(rejected, "data", None) or {}).get("retry_after", 0) > 0
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy limitu volaní")
+    print("=" * 55)
+
+    tests = [
+        ("Token bucket", test_token_bucket),
+        ("Limit v SimpleMCPServer", test_simple_server_limit),
+        ("Identita klienta", test_client_identity),
+        ("Limit vo FastMCP serveri", test_fastmcp_limit)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy predkódovaných odpovedí
+Testuje cache zakódovaných resources a nemenné výsledky zjednodušeného servera
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def test_payload_registry():
+    """Test cache zakódovaného obsahu a jeho zneplatnenia"""
+    print("🔍 Testovanie cache zakódovaných resources...")
+
+    import src.resources.versions as versions_module
+    from src.resources.versions import ResourceVersionRegistry
+
+    registry = ResourceVersionRegistry()
+    hashes = []
+    original = versions_module.content_version
+
+    def counting_version(payload):
+        hashes.append(1)
+        return original(payload)
+
+    versions_module.content_version = counting_version
+    try:
+        stored = registry.store("flowbite://components/button", '{"type":"button"}')
+        remembered = registry.remember("flowbite://components/button", stored.text)
+        other = registry.store("flowbite://components/card", '{"type":"card"}')
+        registry.changed("flowbite://components/button")
+    finally:
+        versions_module.content_version = original
+
+    checks = {
+        "obsah a verzia": registry.payload("flowbite://components/card") is other
+            and other.version == original(other.text),
+        "verzia bez nového hashu": remembered == stored.version and len(hashes) == 2,
+        "zneplatnenie": registry.payload("flowbite://components/button") is None
+            and registry.get("flowbite://components/button") is None
+            and registry.payload("flowbite://components/card") is other
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_component_resources():
+    """Test, že opakované čítanie resource nekóduje JSON ani nečíta databázu"""
+    print("\n🔍 Testovanie predkódovaných resources komponentov...")
+
+    import src.server as server_module
+    from src.resources.versions import resource_versions
+    from src.utils.registry import subsystems
+
+    encodings = []
+    original = server_module.dumps
+
+    def counting_dumps(*args, **kwargs):
+        encodings.append(1)
+        return original(*args, **kwargs)
+
+    async def run():
+        resource_versions.changed("flowbite://components")
+        server_module.dumps = counting_dumps
+        try:
+            first = await server_module.get_component_resource("button")
+            second = await server_module.get_component_resource("button")
+            variant = await server_module.get_component_variant_resource("button", "primary")
+            variant_again = await server_module.get_component_variant_resource("button", "primary")
+            cold_encodings = len(encodings)
+
+            # Zápis do databázy zneplatní obsah - ďalšie čítanie kóduje znova
+            resource_versions.changed("flowbite://components/button")
+            third = await server_module.get_component_resource("button")
+            missing = await server_module.get_component_resource("neexistuje")
+            fetched = await server_module.fetch_resource("flowbite://components/button")
+        finally:
+            server_module.dumps = original
+        return first, second, variant, variant_again, cold_encodings, third, missing, fetched
+
+    first, second, variant, variant_again, cold_encodings, third, missing, fetched = asyncio.run(run())
+    component_data = asyncio.run(subsystems.get("component_db").get_component("button"))
+
+    checks = {
+        "rovnaký objekt z cache": second is first and variant_again is variant,
+        "kódovanie len pri prvom čítaní": cold_encodings == 2 and len(encodings) == 3,
+        "obsah": json.loads(first) == component_data and third == first,
+        "chyby sa necachujú": "error" in json.loads(missing)
+            and resource_versions.payload("flowbite://components/neexistuje") is None,
+        "verzia z cache": fetched["version"] == resource_versions.payload("flowbite://components/button").version
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_simple_server_static_results():
+    """Test nemenných výsledkov initialize a tools/list v zjednodušenom serveri"""
+    print("\n🔍 Testovanie predkódovaných výsledkov zjednodušeného servera...")
+
+    from mcp_server_simple import SimpleMCPServer
+
+    server = SimpleMCPServer()
+    requests = [
+        {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+        {"jsonrpc": "2.0", "id": "a", "method": "tools/list"},
+        [{"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+         {"jsonrpc": "2.0", "id": 3, "method": "tools/call",
+          "params": {"name": "generate_component", "arguments": {"component_type": "button"}}}]
+    ]
+
+    async def run():
+        lines = iter([json.dumps(request) for request in requests] + [""])
+        written = []
+
+        async def read_line():
+            return next(lines)
+
+        async def write_line(line):
+            written.append(line)
+
+        await server.serve_lines(read_line, write_line)
+        first = await server.handle_rpc_call("tools/list", {})
+        second = await server.handle_rpc_call("tools/list", {})
+        compact = await server.handle_rpc_call("initialize", {"capabilities": {"experimental": {"response_mode": "compact"}}}, "s1")
+        return written, first, second, compact
+
+    written, first, second, compact = asyncio.run(run())
+    responses = {}
+    for line in written:
+        decoded = json.loads(line)
+        for response in decoded if isinstance(decoded, list) else [decoded]:
+            responses[response["id"]] = response
+
+    checks = {
+        "nemenný výsledok": first is second,
+        "platné JSON riadky": set(responses) == {1, "a", 2, 3},
+        "obsah tools/list": responses["a"]["result"] == json.loads(json.dumps(first)) == responses[2]["result"],
+        "initialize podľa režimu": responses[1]["result"]["capabilities"]["experimental"]["response_mode"] == "full"
+            and compact["capabilities"]["experimental"]["response_mode"] == "compact",
+        "bežné výsledky": "Generated **button**" in responses[3]["result"]["content"][0]["text"]
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy predkódovaných odpovedí")
+    print("=" * 55)
+
+    tests = [
+        ("Cache zakódovaných resources", test_payload_registry),
+        ("Resources komponentov", test_component_resources),
+        ("Zjednodušený server", test_simple_server_static_results)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy režimu odpovedí (compact/full)
+Testuje kódy nálezov validátora, režim session a veľkosť kompaktných odpovedí
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+CARD = '<div class="card p-6 bg-white rounded-lg"><img src="a.png"><button class="btn">Viac</button></div>'
+
+
+def test_validation_codes():
+    """Test stabilných kódov nálezov a kompaktného výsledku validácie"""
+    print("🔍 Testovanie kódov nálezov...")
+
+    from src.tools.validator import FlowbiteValidator
+    from src.utils.response_mode import ResponseModes, compact_validation, dumps, normalize_mode
+
+    result = asyncio.run(FlowbiteValidator().validate_component(CARD, component_type="button", strict=False))
+    compact = compact_validation(result.dict())
+
+    modes = ResponseModes("compact", max_sessions=1)
+    modes.set("a", "full")
+    modes.set("b", "full")
+    invalid = False
+    try:
+        normalize_mode("stručný")
+    except ValueError:
+        invalid = True
+
+    checks = {
+        "kód ku každej správe": len(result.errors) == len(result.error_codes)
+            and len(result.warnings) == len(result.warning_codes)
+            and len(result.suggestions) == len(result.suggestion_codes),
+        "kódy nálezov": "img-alt-missing" in result.warning_codes
+            and "button-type-missing" in result.warning_codes,
+        "kompaktný výsledok": set(compact) <= {"valid", "score", "errors", "warnings", "suggestions", "truncated"}
+            and compact["warnings"] == result.warning_codes,
+        "JSON bez medzier": dumps({"a": [1, 2]}, "compact") == '{"a":[1,2]}'
+            and "\n  " in dumps({"a": 1}, "full"),
+        "poradie režimov": modes.get("b") == "full" and modes.get("a") == "compact"
+            and modes.get("b", "compact") == "compact",
+        "neplatný režim": invalid and ResponseModes("stručný").default == "full"
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_simple_server_modes():
+    """Test režimu session z initialize a režimu volania v zjednodušenom serveri"""
+    print("\n🔍 Testovanie režimov zjednodušeného servera...")
+
+    from mcp_server_simple import SimpleMCPServer
+
+    server = SimpleMCPServer()
+
+    async def call(name, arguments, client_id):
+        return await server.handle_rpc_call("tools/call", {"name": name, "arguments": arguments}, client_id)
+
+    async def run():
+        init = await server.handle_rpc_call("initialize", {"capabilities": {"experimental": {"response_mode": "compact"}}}, "s1")
+        compact = await call("generate_component", {"component_type": "button"}, "s1")
+        full = await call("generate_component", {"component_type": "button"}, "s2")
+        override = await call("generate_component", {"component_type": "button", "response_mode": "full"}, "s1")
+        validated = await call("validate_component", {"html": "<div>x</div>", "component_type": "button"}, "s1")
+        suggested = await call("suggest_components", {"description": "contact form"}, "s1")
+        invalid = await server.handle_message({
+            "jsonrpc": "2.0", "id": 1, "method": "tools/call",
+            "params": {"name": "generate_component", "arguments": {"component_type": "button", "response_mode": "x"}}
+        }, "s1")
+        return init, compact, full, override, validated, suggested, invalid
+
+    init, compact, full, override, validated, suggested, invalid = asyncio.run(run())
+    compact_text = compact["content"][0]["text"]
+    full_text = full["content"][0]["text"]
+    validation = json.loads(validated["content"][0]["text"])
+    print(f"   generate_component: compact {len(compact_text)} B, full {len(full_text)} B")
+
+    checks = {
+        "režim session": init["capabilities"]["experimental"]["response_mode"] == "compact",
+        "kompaktné HTML": list(json.loads(compact_text)) == ["html"] and ", " not in compact_text[:10]
+            and len(compact_text) < len(full_text),
+        "iná session bez zmeny": full_text.startswith("Generated **button**"),
+        "režim volania má prednosť": override["content"][0]["text"] == full_text,
+        "kódy validácie": validation == {"valid": False, "score": 65, "errors": ["button-tag-missing"],
+                                         "warnings": ["css-classes-missing"]},
+        "kompaktné návrhy": all(set(s) == {"component", "variants"}
+                                for s in json.loads(suggested["content"][0]["text"])["suggestions"]),
+        "neplatný režim": "error" in invalid
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_fastmcp_modes():
+    """Test argumentu response_mode a nástroja set_response_mode vo FastMCP serveri"""
+    print("\n🔍 Testovanie režimov FastMCP servera...")
+
+    from fastmcp import Client
+    from src.server import app, response_modes
+
+    async def run():
+        async with Client(app) as client:
+            full = (await client.call_tool("validate_component", {"html": CARD})).data
+            compact = (await client.call_tool("validate_component", {"html": CARD, "response_mode": "compact"})).data
+            built = (await client.call_tool("build_component", {
+                "component_type": "button", "response_mode": "compact"
+            })).data
+            session = (await client.call_tool("set_response_mode", {"mode": "compact"})).data
+            generated = (await client.call_tool("generate_component", {"component_type": "button"})).data
+            fixed = (await client.call_tool("fix_component", {"html": CARD, "response_mode": "full"})).data
+            reset = (await client.call_tool("set_response_mode", {})).data
+            invalid = (await client.call_tool("validate_component", {"html": CARD, "response_mode": "x"})).data
+        return full, compact, built, session, generated, fixed, reset, invalid
+
+    async def run_stateless():
+        async with Client(app) as client:
+            rejected = (await client.call_tool("set_response_mode", {"mode": "compact"})).data
+            generated = (await client.call_tool("generate_component", {"component_type": "button"})).data
+            compact = (await client.call_tool("generate_component", {
+                "component_type": "button", "response_mode": "compact"
+            })).data
+        return rejected, generated, compact
+
+    full, compact, built, session, generated, fixed, reset, invalid = asyncio.run(run())
+
+    from src.middleware.identity import use_stateless_sessions
+    use_stateless_sessions()
+    try:
+        rejected, stateless_generated, stateless_compact = asyncio.run(run_stateless())
+    finally:
+        use_stateless_sessions(False)
+
+    full_size = len(json.dumps(full, ensure_ascii=False))
+    compact_size = len(json.dumps(compact, ensure_ascii=False))
+    print(f"   validate_component: compact {compact_size} B, full {full_size} B")
+
+    checks = {
+        "kompaktná validácia": compact["score"] == round(full["score"], 1)
+            and compact["warnings"] == full["warning_codes"] and "artifact" in compact
+            and compact_size * 3 < full_size,
+        "kompaktný build": set(built) <= {"html", "artifact", "valid", "score", "errors", "warnings", "suggestions"},
+        "režim session": session["response_mode"] == "compact" and set(generated) == {"html", "artifact"},
+        "režim volania má prednosť": "source_artifact" in fixed,
+        "návrat k predvolenému": reset["response_mode"] == response_modes.default,
+        "neplatný režim": "error" in invalid,
+        "bez session bez režimu session": "MCP session" in rejected.get("error", "")
+            and None not in response_modes._modes and "html" in stateless_generated
+            and set(stateless_generated) != {"html", "artifact"} and set(stateless_compact) == {"html", "artifact"}
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy režimu odpovedí")
+    print("=" * 55)
+
+    tests = [
+        ("Kódy nálezov", test_validation_codes),
+        ("Zjednodušený server", test_simple_server_modes),
+        ("FastMCP server", test_fastmcp_modes)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy plánovača volaní
+Testuje prioritné triedy, férové radenie klientov a plánovanie vo FastMCP serveri
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def test_priority_classes():
+    """Test podielu hromadnej triedy a prednosti interaktívnych volaní"""
+    print("🔍 Testovanie prioritných tried...")
+
+    from src.utils.scheduler import BULK, INTERACTIVE, PriorityScheduler
+
+    scheduler = PriorityScheduler(concurrency=2, shares={BULK: 0.5})
+    peak_bulk = []
+
+    async def bulk_job():
+        async with scheduler.slot("katalog", BULK, cost=50):
+            peak_bulk.append(scheduler.stats()["classes"][BULK]["running"])
+            await asyncio.sleep(0.1)
+
+    async def interactive_job() -> float:
+        started = time.perf_counter()
+        async with scheduler.slot("editor", INTERACTIVE):
+            waited = time.perf_counter() - started
+            await asyncio.sleep(0.01)
+        return waited
+
+    async def run():
+        jobs = [asyncio.ensure_future(bulk_job()) for _ in range(5)]
+        await asyncio.sleep(0.02)
+        waited = await interactive_job()
+        queued = scheduler.stats()["classes"][BULK]["waiting"]
+        await asyncio.gather(*jobs)
+        return waited, queued
+
+    waited, queued = asyncio.run(run())
+    stats = scheduler.stats()
+    print(f"   Čakanie interaktívneho volania za 5 hromadnými: {waited * 1000:.1f} ms")
+
+    checks = {
+        "podiel hromadnej triedy": max(peak_bulk) == 1 and stats["classes"][BULK]["limit"] == 1,
+        "interaktívne bez čakania": waited < 0.02,
+        "hromadné vo fronte": queued >= 3,
+        "všetko dobehlo": stats["running"] == 0 and stats["classes"][BULK]["dispatched"] == 5
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_fair_queuing():
+    """Test váženého férového radenia medzi klientmi"""
+    print("\n🔍 Testovanie férového radenia klientov...")
+
+    from src.utils.scheduler import PriorityScheduler
+
+    async def dispatch_order(scheduler, requests):
+        order = []
+
+        async def job(client_id: str, label: str):
+            async with scheduler.slot(client_id):
+                order.append(label)
+                await asyncio.sleep(0.001)
+
+        await scheduler.acquire("blokuje")
+        jobs = [asyncio.ensure_future(job(client_id, label)) for client_id, label in requests]
+        await asyncio.sleep(0.01)
+        scheduler.release()
+        await asyncio.gather(*jobs)
+        return order
+
+    async def run():
+        fair = await dispatch_order(
+            PriorityScheduler(concurrency=1),
+            [("a", f"a{i}") for i in range(1, 5)] + [("b", "b1"), ("b", "b2")]
+        )
+        weighted = await dispatch_order(
+            PriorityScheduler(concurrency=1, weights={"a": 2.0}),
+            [("a", f"a{i}") for i in range(1, 7)] + [("b", f"b{i}") for i in range(1, 4)]
+        )
+
+        # Zrušené čakajúce volanie sa z fronty odstráni
+        scheduler = PriorityScheduler(concurrency=1)
+        await scheduler.acquire("a")
+        waiting = asyncio.ensure_future(scheduler.acquire("b"))
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        after_cancel = scheduler.stats()["classes"]["interactive"]["waiting"]
+        scheduler.release()
+        return fair, weighted, after_cancel, scheduler.stats()["running"]
+
+    fair, weighted, after_cancel, running = asyncio.run(run())
+    print(f"   Poradie: {' '.join(fair)} | s váhou 2: {' '.join(weighted)}")
+
+    checks = {
+        "striedanie klientov": fair == ["a1", "b1", "a2", "b2", "a3", "a4"],
+        "váha klienta": [label[0] for label in weighted[:6]].count("a") == 4,
+        "zrušené čakanie": after_cancel == 0 and running == 0
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_scheduler_middleware():
+    """Test triedenia volaní a plánovania vo FastMCP serveri"""
+    print("\n🔍 Testovanie plánovania vo FastMCP serveri...")
+
+    from fastmcp import Client
+    from src.middleware.scheduling import SchedulerMiddleware, tool_scheduler
+    from src.server import app
+    from src.utils.scheduler import BULK, INTERACTIVE
+
+    middleware = SchedulerMiddleware(tool_scheduler, bulk_tools=["validate_catalog"], bulk_bytes=1024)
+    small = middleware.classify("validate_component", {"html": "<button>Ok</button>"})
+    large = middleware.classify("validate_component", {"html": "<div></div>" * 500})
+    named = middleware.classify("validate_catalog", {})
+
+    dispatched = tool_scheduler.stats()["classes"][INTERACTIVE]["dispatched"]
+
+    async def run():
+        async with Client(app) as client:
+            result = await client.call_tool("generate_component", {"component_type": "button"})
+        return result.data
+
+    generated = asyncio.run(run())
+    stats = tool_scheduler.stats()
+
+    checks = {
+        "malé volanie interaktívne": small[0] == INTERACTIVE and small[1] < 1.1,
+        "veľké argumenty hromadné": large[0] == BULK and large[1] > 5,
+        "hromadný nástroj": named[0] == BULK,
+        "volanie cez plánovač": stats["classes"][INTERACTIVE]["dispatched"] > dispatched
+            and stats["running"] == 0 and isinstance(generated, dict)
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy plánovača volaní")
+    print("=" * 55)
+
+    tests = [
+        ("Prioritné triedy", test_priority_classes),
+        ("Férové radenie", test_fair_queuing),
+        ("Plánovanie vo FastMCP serveri", test_scheduler_middleware)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy zlučovania volaní
+Testuje single-flight pre súbežné rovnaké volania nástrojov
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def test_single_flight():
+    """Test zdieľania jedného výpočtu"""
+    print("🔍 Testovanie single-flight...")
+
+    from src.utils.single_flight import SingleFlight, canonical_key
+
+    flights = SingleFlight()
+    runs = []
+
+    async def compute(value):
+        runs.append(value)
+        await asyncio.sleep(0.05)
+        if value == "chyba":
+            raise ValueError("zlyhanie")
+        return {"value": value}
+
+    async def failing(key):
+        try:
+            await flights.do(key, lambda: compute("chyba"))
+        except ValueError:
+            return True
+        return False
+
+    async def cancelled_flight():
+        started = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(10)
+
+        waiters = [asyncio.ensure_future(flights.do("pomalé", slow)) for _ in range(2)]
+        await started.wait()
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0)
+        return flights.stats()["in_flight"] == 0
+
+    async def run():
+        shared = await asyncio.gather(*[flights.do("a", lambda: compute("a")) for _ in range(5)])
+        again = await flights.do("a", lambda: compute("a"))
+        errors = await asyncio.gather(*[failing("b") for _ in range(3)])
+        return shared, again, errors, await cancelled_flight()
+
+    shared, again, errors, cancelled = asyncio.run(run())
+
+    checks = {
+        "jeden výpočet": runs.count("a") == 2 and all(result is shared[0] for result in shared),
+        "bez cache po dokončení": again == {"value": "a"},
+        "zdieľaná výnimka": all(errors) and runs.count("chyba") == 1,
+        "zrušenie všetkých čakajúcich": cancelled,
+        "počítadlá": flights.stats()["coalesced"] >= 6,
+        "kanonický kľúč": canonical_key("t", {"a": 1, "b": [1, 2]}) == canonical_key("t", {"b": [1, 2], "a": 1})
+            and canonical_key("t", {"a": 1}) != canonical_key("u", {"a": 1})
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_single_flight_middleware():
+    """Test zlučovania volaní nástrojov cez FastMCP middleware"""
+    print("\n🔍 Testovanie middleware zlučovania...")
+
+    from fastmcp import Client, FastMCP
+    from src.middleware.coalescing import SingleFlightMiddleware
+    from src.utils.single_flight import SingleFlight
+
+    flights = SingleFlight()
+    calls = []
+    test_app = FastMCP(name="single-flight-test")
+    test_app.add_middleware(SingleFlightMiddleware(flights, tools={"render"}))
+
+    @test_app.tool()
+    async def render(component_type: str) -> str:
+        calls.append(component_type)
+        await asyncio.sleep(0.1)
+        return f"<{component_type}>"
+
+    @test_app.tool()
+    async def touch(component_type: str) -> str:
+        calls.append(f"touch:{component_type}")
+        await asyncio.sleep(0.05)
+        return component_type
+
+    async def run():
+        async with Client(test_app) as client:
+            results = await asyncio.gather(
+                *[client.call_tool("render", {"component_type": "button"}) for _ in range(4)],
+                client.call_tool("render", {"component_type": "card"}),
+                *[client.call_tool("touch", {"component_type": "x"}) for _ in range(2)]
+            )
+        return [result.data for result in results]
+
+    results = asyncio.run(run())
+
+    checks = {
+        "výsledky": results[:5] == ["<button>"] * 4 + ["<card>"],
+        "zlúčené volania": calls.count("button") == 1 and calls.count("card") == 1,
+        "nástroje mimo zoznamu": calls.count("touch:x") == 2,
+        "metriky": flights.stats() == {"executed": 2, "coalesced": 3, "in_flight": 0}
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_session_scoped_artifacts():
+    """Test, že nástroje s artefaktmi sa zlučujú len v rámci session"""
+    print("\n🔍 Testovanie zlučovania nástrojov s artefaktmi...")
+
+    from types import SimpleNamespace
+    from fastmcp.server.middleware import MiddlewareContext
+    from src.middleware.coalescing import SingleFlightMiddleware
+    from src.middleware.identity import session_identity
+    from src.tools.artifacts import ArtifactStore
+    from src.utils.single_flight import SingleFlight
+
+    flights = SingleFlight()
+    store = ArtifactStore()
+    middleware = SingleFlightMiddleware(flights)
+    calls = []
+
+    async def generate(context):
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return store.put(session_identity(context.fastmcp_context), "<button>OK</button>")
+
+    def call(session):
+        context = MiddlewareContext(
+            message=SimpleNamespace(name="generate_component", arguments={"component_type": "button"}),
+            fastmcp_context=SimpleNamespace(client_id=session)
+        )
+        return middleware.on_call_tool(context, generate)
+
+    async def run():
+        return await asyncio.gather(call("A"), call("B"), call("A"))
+
+    handle_a, handle_b, handle_a2 = asyncio.run(run())
+
+    try:
+        resolved_b = store.get("B", handle_b)
+    except Exception:
+        resolved_b = None
+
+    checks = {
+        "handle v session volajúceho": resolved_b == "<button>OK</button>"
+            and store.get("A", handle_a) == "<button>OK</button>",
+        "zlúčenie v rámci session": handle_a2 == handle_a and len(calls) == 2
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy zlučovania volaní")
+    print("=" * 55)
+
+    tests = [
+        ("Single-flight", test_single_flight),
+        ("Middleware zlučovania", test_single_flight_middleware),
+        ("Nástroje s artefaktmi", test_session_scoped_artifacts)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Flowbite MCP Server - Testy studeného štartu
+Testuje lenivé vytváranie subsystémov a report času importu
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# Pridáme koreň projektu do path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def test_lazy_server_import():
+    """Test, že import servera nevytvára subsystémy ani neimportuje ťažké knižnice"""
+    print("🔍 Testovanie lenivého importu servera...")
+
+    script = (
+        "import sys, src.server\n"
+        "from src.utils.registry import subsystems\n"
+        "heavy = [m for m in ('bs4', 'jinja2', 'src.tools.validator', 'src.resources.documentation') if m in sys.modules]\n"
+        "created = [n for n, r in subsystems.report().items() if r['created']]\n"
+        "print(heavy, created)\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True, text=True, cwd=str(Path(__file__).parent)
+    )
+
+    success = completed.returncode == 0 and completed.stdout.strip() == "[] []"
+    print(f"{'✅' if success else '❌'} po importe: {completed.stdout.strip() or completed.stderr.strip()[-200:]}")
+    return success
+
+
+def test_subsystem_registry():
+    """Test registra subsystémov"""
+    print("\n🔍 Testovanie registra subsystémov...")
+
+    from src.utils.registry import SubsystemRegistry
+
+    registry = SubsystemRegistry({"renderer": "src.resources.markdown_renderer:MarkdownRenderer"})
+    before = registry.report()["renderer"]
+    first = registry.get("renderer")
+    after = registry.report()["renderer"]
+
+    try:
+        registry.get("neexistuje")
+        unknown = False
+    except KeyError:
+        unknown = True
+
+    checks = {
+        "pred použitím": before == {"created": False},
+        "jedna inštancia": first is registry.get("renderer"),
+        "časy": after["created"] and "import_ms" in after and "init_ms" in after,
+        "neznámy subsystém": unknown
+    }
+
+    # Globálne inštancie modulov zdieľajú register
+    from src.utils.registry import subsystems
+    from src.tools import suggestions
+    checks["PEP 562 atribút"] = suggestions.suggestion_engine is subsystems.get("suggestion_engine")
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def test_import_report():
+    """Test reportu času importu"""
+    print("\n🔍 Testovanie reportu času importu...")
+
+    from src.utils.import_report import group_by_package, measure_imports
+
+    report = measure_imports("src.config")
+    names = [entry["module"] for entry in report["modules"]]
+    packages = group_by_package(report["modules"])
+
+    checks = {
+        "celkový čas": report["total_ms"] > 0,
+        "moduly": "src.config" in names,
+        "vlastný čas modulu": 0 < report["self_ms"] <= report["total_ms"],
+        "balíky": "src" in packages
+    }
+
+    for name, success in checks.items():
+        print(f"{'✅' if success else '❌'} {name}")
+
+    return all(checks.values())
+
+
+def main():
+    """Hlavná test funkcia"""
+    print("🚀 Flowbite MCP Server - Testy studeného štartu")
+    print("=" * 55)
+
+    tests = [
+        ("Lenivý import servera", test_lazy_server_import),
+        ("Register subsystémov", test_subsystem_registry),
+        ("Report času importu", test_import_report)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            results.append((test_name, test_func()))
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            results.append((test_name, False))
+
+    print("\n" + "=" * 55)
+    passed = sum(1 for _, result in results if result)
+    for test_name, result in results:
+        print(f"{'✅ PREŠIEL' if result else '❌ NEPREŠIEL'}: {test_name}")
+    print(f"\n📊 Výsledok: {passed}/{len(results)} testov prešlo")
+
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)